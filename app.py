@@ -12,7 +12,6 @@ import streamlit as st
 # Add the src directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
-from src.models.cv_data import init_cv_data
 from src.sections.certifications_awards import certifications_awards_section
 from src.sections.education import education_section
 from src.sections.experience import experience_section
@@ -21,6 +20,14 @@ from src.sections.preview_export import preview_export_section
 from src.sections.projects import projects_section
 from src.sections.publications import publications_section
 from src.sections.skills import skills_section
+from src.utils.cv_session import (
+    load_full_cv,
+    open_cv,
+    save_cv_changes,
+    section_size,
+)
+from src.utils.layout_estimate import estimate_layout
+from src.utils.pdf_generator import RenderError
 from src.utils.styles import display_main_header, load_css
 
 # Page configuration
@@ -34,13 +41,32 @@ st.set_page_config(
 
 def init_session_state():
     """Initialize all session state variables"""
-    if "cv_data" not in st.session_state:
-        st.session_state.cv_data = init_cv_data()
+    # Restores the CV named in the URL, or starts a new one
+    open_cv(st.session_state, st.query_params)
 
     if "current_section" not in st.session_state:
         st.session_state.current_section = "Personal Information"
 
 
+def show_length_estimate(slot):
+    """Live length estimate for the template and format chosen for export"""
+    template, page_format = st.session_state.get(
+        "export_selection", ("Professional Blue", "A4")
+    )
+    template = st.session_state.get("pdf_template", template)
+    page_format = st.session_state.get("pdf_format", page_format)
+    # A restored CV is loaded a section at a time; the rest is loaded here,
+    # after the page has been drawn
+    cv_data = load_full_cv(st.session_state)
+    try:
+        pages = estimate_layout(cv_data, template, page_format).page_count
+    except RenderError:
+        slot.write("📄 Length: unavailable")
+    else:
+        plural = "s" if pages != 1 else ""
+        slot.write(f"📄 Length: {pages} page{plural} ({page_format})")
+
+
 def main():
     """Main application function"""
     # Initialize session state and load CSS
@@ -52,12 +78,10 @@ def main():
 
     # Sidebar navigation
     st.sidebar.title("📋 CV Sections")
-    st.sidebar.markdown(
-        """
+    st.sidebar.markdown("""
     Navigate through different sections to build your comprehensive CV.
-    All data is automatically saved during your session.
-    """
-    )
+    Your changes are saved as you go; bookmark this page to come back to it.
+    """)
 
     sections = [
         "Personal Information",
@@ -83,14 +107,18 @@ def main():
     cv_data = st.session_state.cv_data
     personal = cv_data["personal_info"]
 
+    # Counts come from the store for sections no page has loaded yet
+    def has_entries(*names):
+        return any(section_size(st.session_state, name) for name in names)
+
     progress_items = [
         ("Personal Info", bool(personal.get("full_name") and personal.get("email"))),
-        ("Education", bool(cv_data["education"])),
-        ("Experience", bool(cv_data["experience"])),
+        ("Education", has_entries("education")),
+        ("Experience", has_entries("experience")),
         ("Skills", bool(any(cv_data["skills"].values()))),
-        ("Projects", bool(cv_data["projects"])),
-        ("Publications", bool(cv_data["publications"])),
-        ("Certifications", bool(cv_data["certifications"] or cv_data["awards"])),
+        ("Projects", has_entries("projects")),
+        ("Publications", has_entries("publications")),
+        ("Certifications", has_entries("certifications", "awards")),
     ]
 
     completed = sum(1 for _, status in progress_items if status)
@@ -102,6 +130,9 @@ def main():
         f"Completion: {completed}/{total} sections ({progress_percentage:.1f}%)"
     )
 
+    # Filled in once the page has applied this run's edits
+    length_slot = st.sidebar.empty()
+
     # Show completion status for each section
     for item, status in progress_items:
         icon = "✅" if status else "⬜"
@@ -112,7 +143,7 @@ def main():
     st.sidebar.subheader("💡 Tips")
 
     tips = [
-        "💾 Your data is automatically saved during your session",
+        "💾 Your changes are saved automatically; bookmark the page to return",
         "📤 Export your data as JSON for backup",
         "📄 Choose from 4 professional PDF templates",
         "🔗 Add LinkedIn and GitHub links for networking",
@@ -124,22 +155,28 @@ def main():
         st.sidebar.write(tip)
 
     # Main content area based on selected section
-    if selected_section == "Personal Information":
-        personal_info_section()
-    elif selected_section == "Education":
-        education_section()
-    elif selected_section == "Work Experience":
-        experience_section()
-    elif selected_section == "Skills":
-        skills_section()
-    elif selected_section == "Projects":
-        projects_section()
-    elif selected_section == "Publications":
-        publications_section()
-    elif selected_section == "Certifications & Awards":
-        certifications_awards_section()
-    elif selected_section == "Preview & Export":
-        preview_export_section()
+    try:
+        if selected_section == "Personal Information":
+            personal_info_section()
+        elif selected_section == "Education":
+            education_section()
+        elif selected_section == "Work Experience":
+            experience_section()
+        elif selected_section == "Skills":
+            skills_section()
+        elif selected_section == "Projects":
+            projects_section()
+        elif selected_section == "Publications":
+            publications_section()
+        elif selected_section == "Certifications & Awards":
+            certifications_awards_section()
+        elif selected_section == "Preview & Export":
+            preview_export_section()
+    finally:
+        # Also runs when a form calls st.rerun() after adding an entry
+        save_cv_changes(st.session_state)
+
+    show_length_estimate(length_slot)
 
     # Footer
     st.markdown("---")
@@ -0,0 +1,99 @@
+"""
+Benchmark debounced autosave against writing every rerun synchronously.
+
+Simulates typing a summary on a large CV: each rerun adds a few characters
+and saves. Autosave's script-thread cost (change detection plus handing
+the changes to the writer) is compared with committing the same changes
+on the script thread, and the writer's counters show how many row writes
+coalescing saved.
+
+Usage:
+    python benchmarks/bench_autosave.py [--reruns 200] [--interval-ms 20]
+        [--debounce-ms 250] [--publications 2000]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.cv_data import cv_from_json  # noqa: E402
+from src.models.sample_cv import build_sample_cv  # noqa: E402
+from src.utils import cv_store  # noqa: E402
+from src.utils.autosave import autosave_writer  # noqa: E402
+from src.utils.cv_session import (  # noqa: E402
+    collect_changes,
+    open_cv,
+    save_cv_changes,
+)
+
+
+def session(publications):
+    state = {}
+    open_cv(state, {})
+    state["cv_data"] = cv_from_json(build_sample_cv(publications=publications))
+    save_cv_changes(state)
+    return state
+
+
+def type_summary(state, reruns, interval, save):
+    """Median and max milliseconds ``save(state)`` took per rerun"""
+    timings = []
+    for rerun in range(reruns):
+        state["cv_data"]["personal_info"]["summary"] += f" word{rerun}"
+        started = time.perf_counter()
+        save(state)
+        timings.append((time.perf_counter() - started) * 1000)
+        time.sleep(interval)
+    return statistics.median(timings), max(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--reruns", type=int, default=200)
+    parser.add_argument("--interval-ms", type=int, default=20)
+    parser.add_argument("--debounce-ms", type=int, default=250)
+    parser.add_argument("--publications", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ[cv_store.STORE_PATH_ENV] = os.path.join(directory, "cvs.sqlite3")
+        store = cv_store.cv_store()
+
+        def save_now(state):
+            changes, state["_cv_snapshot"] = collect_changes(state)
+            store.write(state["_cv_id"], changes)
+
+        state = session(args.publications)
+        save_now(state)
+        sync = type_summary(state, args.reruns, args.interval_ms / 1000, save_now)
+
+        autosave_writer.debounce = args.debounce_ms / 1000
+        state = session(args.publications)
+        autosave_writer.flush()
+        base = autosave_writer.stats()
+        debounced = type_summary(
+            state, args.reruns, args.interval_ms / 1000, save_cv_changes
+        )
+        autosave_writer.flush()
+        stats = {
+            key: value - base[key] for key, value in autosave_writer.stats().items()
+        }
+
+    print(f"{args.reruns} reruns, {args.interval_ms} ms apart")
+    print(f"{'Save':<12} {'Median ms':>10} {'Max ms':>8}")
+    print(f"{'synchronous':<12} {sync[0]:>10.3f} {sync[1]:>8.3f}")
+    print(f"{'autosave':<12} {debounced[0]:>10.3f} {debounced[1]:>8.3f}")
+    print(
+        f"Autosave: {stats['submitted']} changes submitted, {stats['written']} "
+        f"rows written in {stats['batches']} batches, {stats['coalesced']} "
+        "writes saved by coalescing"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark saving and loading a CV as JSON and as a .cvb file.
+
+The JSON columns use the export's indented format; loads go through
+``load_cv_file`` like an upload and end with record entries.
+
+Usage:
+    python benchmarks/bench_cv_files.py [--publications 5000] [--repeat 7]
+"""
+
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.cv_data import cv_from_json  # noqa: E402
+from src.models.sample_cv import build_sample_cv  # noqa: E402
+from src.utils.cv_file import _dump_cvb, _dump_json, load_cv_file  # noqa: E402
+
+
+def median_ms(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--publications", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    cv_data = cv_from_json(
+        build_sample_cv(
+            publications=args.publications,
+            experience=args.publications // 10,
+            with_photo=True,
+        )
+    )
+    print(f"{'Format':<8} {'Bytes':>10} {'Save ms':>8} {'Load ms':>8}")
+    for name, dump in (("json", _dump_json), ("cvb", _dump_cvb)):
+        data = dump(cv_data)
+        save = median_ms(lambda: dump(cv_data), args.repeat)
+        load = median_ms(lambda: load_cv_file(io.BytesIO(data)), args.repeat)
+        print(f"{name:<8} {len(data):>10} {save:>8.1f} {load:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
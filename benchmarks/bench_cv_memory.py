@@ -0,0 +1,77 @@
+"""
+Benchmark the per-session memory of a CV held as dicts or as slotted records.
+
+Both models are loaded from the same exported JSON, as an import would, and
+measured with tracemalloc while only the CV is alive. Conversion times to
+and from the JSON shape are reported too.
+
+Usage:
+    python benchmarks/bench_cv_memory.py [--publications 1000 5000] [--repeat 5]
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.cv_data import cv_from_json, cv_to_json  # noqa: E402
+from src.models.sample_cv import build_sample_cv  # noqa: E402
+
+
+def retained_bytes(load):
+    """Bytes still allocated by ``load()``'s result once temporaries are freed"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = load()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def median_ms(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--publications", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'Publications':>12} {'Dict KiB':>10} {'Record KiB':>11} {'Saved':>6} "
+        f"{'To records ms':>14} {'To JSON ms':>11}"
+    )
+    for count in args.publications:
+        text = json.dumps(build_sample_cv(publications=count, experience=count // 10))
+        dict_bytes = retained_bytes(lambda: json.loads(text))
+        record_bytes = retained_bytes(lambda: cv_from_json(json.loads(text)))
+
+        cv_json = json.loads(text)
+        cv_records = cv_from_json(cv_json)
+        to_records = median_ms(lambda: cv_from_json(cv_json), args.repeat)
+        to_json = median_ms(lambda: cv_to_json(cv_records), args.repeat)
+        print(
+            f"{count:>12} {dict_bytes / 1024:>10.0f} {record_bytes / 1024:>11.0f} "
+            f"{1 - record_bytes / dict_bytes:>6.0%} {to_records:>14.1f} "
+            f"{to_json:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
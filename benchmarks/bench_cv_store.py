@@ -0,0 +1,94 @@
+"""
+Benchmark the per-entry SQLite CV store.
+
+Saves a large sample CV, then times what a session does with it: opening
+it (personal info, skills and photo only), loading one section as the
+Publications page does, loading every section as Preview & Export does,
+and saving one added entry, which is a single-row insert. Saves are
+flushed through the autosave writer so the write itself is timed.
+
+Usage:
+    python benchmarks/bench_cv_store.py [--publications 5000] [--repeat 7]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.cv_data import Publication, cv_from_json  # noqa: E402
+from src.models.sample_cv import build_sample_cv  # noqa: E402
+from src.utils import cv_store  # noqa: E402
+from src.utils.autosave import autosave_writer  # noqa: E402
+from src.utils.cv_session import (  # noqa: E402
+    cv_section,
+    load_full_cv,
+    open_cv,
+    save_cv_changes,
+)
+
+
+def median_ms(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def opened(cv_id):
+    state = {}
+    open_cv(state, {"cv": cv_id})
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--publications", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ[cv_store.STORE_PATH_ENV] = os.path.join(directory, "cvs.sqlite3")
+        state = {}
+        params = {}
+        open_cv(state, params)
+        cv_id = params["cv"]
+        sample = cv_from_json(
+            build_sample_cv(
+                publications=args.publications,
+                experience=args.publications // 10,
+                with_photo=True,
+            )
+        )
+        state["cv_data"] = sample
+        started = time.perf_counter()
+        save_cv_changes(state)
+        autosave_writer.flush()
+        print(f"Initial save: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+        steps = {
+            "Open CV": lambda: opened(cv_id),
+            "Load publications": lambda: cv_section(opened(cv_id), "publications"),
+            "Load whole CV": lambda: load_full_cv(opened(cv_id)),
+        }
+        for name, step in steps.items():
+            print(f"{name:<20} {median_ms(step, args.repeat):>8.2f} ms")
+
+        publications = state["cv_data"]["publications"]
+
+        def add_entry():
+            publications.append(Publication(title="New paper", year=2025))
+            save_cv_changes(state)
+            autosave_writer.flush()
+
+        print(f"{'Add one entry':<20} {median_ms(add_entry, args.repeat):>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
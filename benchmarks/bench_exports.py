@@ -0,0 +1,58 @@
+"""
+Benchmark normalizing a CV once and serializing it to every export format.
+
+Each repeat edits the summary so nothing is served from a cache; the
+document is built once and then written as PDF, DOCX and plain text.
+
+Usage:
+    python benchmarks/bench_exports.py [--repeat 5] [--publications 50]
+"""
+
+import argparse
+import copy
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.sample_cv import build_sample_cv  # noqa: E402
+from src.utils.document_ir import build_document  # noqa: E402
+from src.utils.exporters import EXPORT_FORMATS  # noqa: E402
+from src.utils.template_styles import DEFAULT_TEMPLATE  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--publications", type=int, default=50)
+    args = parser.parse_args()
+
+    base = build_sample_cv(publications=args.publications, with_photo=True)
+    timings = {"document": []}
+    timings.update((name, []) for name in EXPORT_FORMATS)
+    sizes = {}
+    for repeat in range(args.repeat):
+        cv_data = copy.deepcopy(base)
+        cv_data["personal_info"]["summary"] += f" Revision {repeat}."
+
+        started = time.perf_counter()
+        build_document(cv_data)
+        timings["document"].append((time.perf_counter() - started) * 1000)
+        for name, export in EXPORT_FORMATS.items():
+            started = time.perf_counter()
+            data = export.render(cv_data, DEFAULT_TEMPLATE, "A4")
+            timings[name].append((time.perf_counter() - started) * 1000)
+            sizes[name] = len(data)
+
+    print(f"{'Step':<10} {'Bytes':>10} {'Median ms':>10} {'Min ms':>8}")
+    for name, values in timings.items():
+        print(
+            f"{name:<10} {sizes.get(name, ''):>10} "
+            f"{statistics.median(values):>10.1f} {min(values):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
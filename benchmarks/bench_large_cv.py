@@ -0,0 +1,58 @@
+"""
+Benchmark how render time scales with the number of CV entries.
+
+Usage:
+    python benchmarks/bench_large_cv.py [--sizes 10 100 1000 5000] [--words 5000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.sample_cv import build_sample_cv  # noqa: E402
+from src.utils.pdf_generator import LAYOUT_MODES, generate_pdf_cv  # noqa: E402
+from src.utils.render_cache import paragraph_parse_cache  # noqa: E402
+
+# Words in one repetition of the sample job description
+_DESCRIPTION_WORDS = 26
+
+
+def timed_render(cv_data, layout):
+    """Render without any warm caches and return (seconds, bytes)"""
+    paragraph_parse_cache.clear()
+    started = time.perf_counter()
+    pdf_bytes = generate_pdf_cv(cv_data, use_cache=False, layout=layout)
+    return time.perf_counter() - started, len(pdf_bytes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--words", type=int, default=5000)
+    args = parser.parse_args()
+
+    layouts = [layout for layout in LAYOUT_MODES if layout != "auto"]
+    print(f"{'Entries':>8} {'Layout':<9} {'Seconds':>8} {'ms/entry':>9} {'Bytes':>9}")
+    for size in args.sizes:
+        cv_data = build_sample_cv(publications=size, experience=max(1, size // 10))
+        entries = len(cv_data["publications"]) + len(cv_data["experience"])
+        for layout in layouts:
+            seconds, size_bytes = timed_render(cv_data, layout)
+            print(
+                f"{entries:>8} {layout:<9} {seconds:>8.2f} "
+                f"{seconds * 1000 / entries:>9.2f} {size_bytes:>9}"
+            )
+
+    sentences = max(1, args.words // _DESCRIPTION_WORDS)
+    cv_data = build_sample_cv(
+        publications=1, experience=1, description_sentences=sentences
+    )
+    seconds, size_bytes = timed_render(cv_data, "auto")
+    print(f"\nOne {args.words}-word description: {seconds:.2f}s, {size_bytes} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark output size and render time for each render profile.
+
+Each profile is rendered once untimed first, then the profiles take turns
+within every repeat so drift over the run (CPU frequency, caches) affects
+them alike. Times are reported as the median with the min-max spread.
+
+Usage:
+    python benchmarks/bench_render_profiles.py [--repeat 5] [--publications 50]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.sample_cv import build_sample_cv  # noqa: E402
+from src.utils.pdf_generator import generate_pdf_cv  # noqa: E402
+from src.utils.render_profiles import RENDER_PROFILES  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--publications", type=int, default=50)
+    args = parser.parse_args()
+
+    cv_data = build_sample_cv(publications=args.publications, with_photo=True)
+
+    def render(profile):
+        return generate_pdf_cv(cv_data, profile=profile, use_cache=False)
+
+    sizes = {profile: len(render(profile)) for profile in RENDER_PROFILES}
+    timings = {profile: [] for profile in RENDER_PROFILES}
+    profiles = list(RENDER_PROFILES)
+    for repeat in range(args.repeat):
+        # Rotate the order so no profile always runs first
+        shift = repeat % len(profiles)
+        for profile in profiles[shift:] + profiles[:shift]:
+            started = time.perf_counter()
+            render(profile)
+            timings[profile].append((time.perf_counter() - started) * 1000)
+
+    print(
+        f"{'Profile':<15} {'Bytes':>10} {'Median ms':>10} {'Min ms':>8} {'Max ms':>8}"
+    )
+    for profile, times in timings.items():
+        print(
+            f"{profile:<15} {sizes[profile]:>10} "
+            f"{statistics.median(times):>10.1f} {min(times):>8.1f} {max(times):>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark the schema-compiled entry validators against hand-written loops.
+
+The hand-written validators below are the ones ``cv_data`` had before the
+schemas, with the hardcoded publication year bound replaced by a constant
+from ``latest_year()``. Each runs over every entry of a sample CV, as dicts
+(a JSON import) and as records (the session state); ``validate_cv`` times
+a whole-CV import check.
+
+Usage:
+    python benchmarks/bench_validation.py [--publications 1000] [--repeat 7]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.cv_data import (  # noqa: E402
+    ENTRY_CHECKS,
+    cv_from_json,
+    latest_year,
+)
+from src.models.sample_cv import build_sample_cv  # noqa: E402
+from src.utils.cv_validation import validate_cv  # noqa: E402
+
+LATEST_YEAR = latest_year()
+
+
+def hand_written_education(education):
+    required_fields = ["degree", "institution"]
+    errors = []
+    for field in required_fields:
+        if not education.get(field, "").strip():
+            errors.append(f"{field.replace('_', ' ').title()} is required")
+    start_year = education.get("start_year", 0)
+    end_year = education.get("end_year", 0)
+    if start_year and end_year and start_year > end_year:
+        errors.append("Start year cannot be greater than end year")
+    return errors
+
+
+def hand_written_experience(experience):
+    required_fields = ["job_title", "company"]
+    errors = []
+    for field in required_fields:
+        if not experience.get(field, "").strip():
+            errors.append(f"{field.replace('_', ' ').title()} is required")
+    return errors
+
+
+def hand_written_project(project):
+    required_fields = ["name", "description"]
+    errors = []
+    for field in required_fields:
+        if not project.get(field, "").strip():
+            errors.append(f"{field.replace('_', ' ').title()} is required")
+    return errors
+
+
+def hand_written_publication(publication):
+    required_fields = ["title", "authors", "journal", "year"]
+    errors = []
+    for field in required_fields:
+        if not str(publication.get(field, "")).strip():
+            errors.append(f"{field.replace('_', ' ').title()} is required")
+    year = publication.get("year", 0)
+    if year and (year < 1900 or year > LATEST_YEAR):
+        errors.append("Please enter a valid publication year")
+    return errors
+
+
+HAND_WRITTEN = {
+    "education": hand_written_education,
+    "experience": hand_written_experience,
+    "projects": hand_written_project,
+    "publications": hand_written_publication,
+}
+
+
+def median_ms(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def run_hand_written(cv_data):
+    for section, validate in HAND_WRITTEN.items():
+        for entry in cv_data[section]:
+            validate(entry)
+
+
+def run_compiled(cv_data):
+    for section in HAND_WRITTEN:
+        check = ENTRY_CHECKS[section]
+        for entry in cv_data[section]:
+            check(entry, LATEST_YEAR, [])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--publications", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    as_dicts = build_sample_cv(
+        publications=args.publications, experience=args.publications // 10
+    )
+    as_records = cv_from_json(as_dicts)
+    entries = sum(len(as_dicts[section]) for section in HAND_WRITTEN)
+    print(f"{entries} entries")
+    print(f"{'Entries':<8} {'Hand-written ms':>16} {'Compiled ms':>12} {'Speed-up':>9}")
+    for name, cv_data in (("dicts", as_dicts), ("records", as_records)):
+        hand = median_ms(lambda: run_hand_written(cv_data), args.repeat)
+        compiled = median_ms(lambda: run_compiled(cv_data), args.repeat)
+        print(f"{name:<8} {hand:>16.2f} {compiled:>12.2f} {hand / compiled:>8.1f}x")
+    for name, cv_data in (("dicts", as_dicts), ("records", as_records)):
+        whole = median_ms(lambda: validate_cv(cv_data), args.repeat)
+        print(f"validate_cv on {name}: {whole:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
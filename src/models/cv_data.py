@@ -2,6 +2,11 @@
 Data models and initialization for CV Builder application.
 """
 
+import sys
+from collections import namedtuple
+from datetime import date
+from operator import attrgetter, itemgetter
+
 
 def init_cv_data():
     """Initialize the CV data structure"""
@@ -36,78 +41,418 @@ def init_cv_data():
     }
 
 
-def validate_personal_info(personal_info):
-    """Validate personal information data"""
-    required_fields = ["full_name", "email"]
-    errors = []
+class Record:
+    """Slotted CV entry with the same keys as its JSON object
+
+    Entries used to be one dict each, repeating every key; records store
+    their fields in slots and intern enum-like values such as ``job_type``,
+    so long lists take a fraction of the memory. Item access (``entry["x"]``,
+    ``get``, ``keys``) works as on the dicts, so renderers and validators
+    take either. Keys a record doesn't define (e.g. from a newer export) are
+    kept in ``_extra`` and written back by ``to_dict``.
+    """
+
+    __slots__ = ("_extra",)
+    # Field names in JSON order; every field defaults to ""
+    FIELDS = ()
+    # Fields that repeat across entries (types, venues, places), so equal
+    # values share one string via sys.intern
+    INTERNED = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls.FIELDS)
+
+    def __init__(self, **values):
+        self._extra = None
+        for name in self.FIELDS:
+            self[name] = values.pop(name, "")
+        for key, value in values.items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a record from its JSON object"""
+        record = cls.__new__(cls)
+        get = data.get
+        for name in cls.FIELDS:
+            setattr(record, name, get(name, ""))
+        for name in cls.INTERNED:
+            value = getattr(record, name)
+            if type(value) is str:
+                setattr(record, name, sys.intern(value))
+        record._extra = None
+        if not cls._field_set.issuperset(data):
+            record._extra = {
+                key: value for key, value in data.items() if key not in cls._field_set
+            }
+        return record
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a record from its field values, in ``FIELDS`` order"""
+        record = cls.__new__(cls)
+        for name, value in zip(cls.FIELDS, row):
+            setattr(record, name, value)
+        for name in cls.FIELDS[len(row) :]:
+            setattr(record, name, "")
+        for name in cls.INTERNED:
+            value = getattr(record, name)
+            if type(value) is str:
+                setattr(record, name, sys.intern(value))
+        record._extra = None
+        return record
+
+    def to_dict(self):
+        """The record's JSON object"""
+        data = {name: getattr(self, name) for name in self.FIELDS}
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            return getattr(self, key)
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self._field_set:
+            if key in self.INTERNED and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key):
+        return key in self._field_set or bool(self._extra and key in self._extra)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [*self.FIELDS, *(self._extra or ())]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.FIELDS) + len(self._extra or ())
+
+    def __eq__(self, other):
+        if isinstance(other, Record):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Education(Record):
+    FIELDS = (
+        "degree",
+        "institution",
+        "location",
+        "start_year",
+        "end_year",
+        "thesis_title",
+        "advisor",
+        "gpa",
+        "description",
+    )
+    __slots__ = FIELDS
+
+
+class Experience(Record):
+    FIELDS = (
+        "job_title",
+        "company",
+        "location",
+        "start_date",
+        "end_date",
+        "job_type",
+        "description",
+    )
+    INTERNED = ("location", "job_type", "end_date")
+    __slots__ = FIELDS
+
+
+class Project(Record):
+    FIELDS = (
+        "name",
+        "type",
+        "start_date",
+        "end_date",
+        "technologies",
+        "github_link",
+        "publication_link",
+        "description",
+    )
+    INTERNED = ("type", "end_date")
+    __slots__ = FIELDS
+
+
+class Publication(Record):
+    FIELDS = (
+        "title",
+        "authors",
+        "journal",
+        "year",
+        "volume",
+        "pages",
+        "doi",
+        "pmid",
+        "url",
+        "type",
+    )
+    INTERNED = ("journal", "type")
+    __slots__ = FIELDS
+
+
+class Certification(Record):
+    FIELDS = (
+        "name",
+        "issuing_org",
+        "issue_date",
+        "expiry_date",
+        "credential_id",
+        "url",
+    )
+    INTERNED = ("expiry_date",)
+    __slots__ = FIELDS
+
+
+class Award(Record):
+    FIELDS = ("name", "awarding_org", "date", "description")
+    __slots__ = FIELDS
+
+
+# Entry list sections of cv_data and their record types
+SECTION_RECORDS = {
+    "education": Education,
+    "experience": Experience,
+    "projects": Project,
+    "publications": Publication,
+    "certifications": Certification,
+    "awards": Award,
+}
+
+
+def cv_from_json(data):
+    """Convert a CV in its JSON shape to one whose entries are records
+
+    Entries that already are records are kept; personal info and skills stay
+    dicts, as there is only one of each per CV.
+    """
+    cv_data = dict(data)
+    for section, record_type in SECTION_RECORDS.items():
+        if section in cv_data:
+            cv_data[section] = [
+                entry if isinstance(entry, Record) else record_type.from_dict(entry)
+                for entry in cv_data[section]
+            ]
+    return cv_data
+
+
+def cv_to_json(cv_data):
+    """Convert a CV with record entries back to its JSON shape"""
+    data = dict(cv_data)
+    for section in SECTION_RECORDS:
+        if section in data:
+            data[section] = [
+                entry.to_dict() if isinstance(entry, Record) else entry
+                for entry in data[section]
+            ]
+    return data
+
 
-    for field in required_fields:
-        if not personal_info.get(field, "").strip():
-            errors.append(f"{field.replace('_', ' ').title()} is required")
+# Earliest year accepted anywhere; the latest is a few years past today so
+# accepted papers and expected graduations can be entered
+MIN_YEAR = 1900
+YEARS_AHEAD = 5
 
-    # Email validation
-    email = personal_info.get("email", "")
-    if email and "@" not in email:
-        errors.append("Please enter a valid email address")
 
-    return errors
+def latest_year():
+    """Latest year accepted in year fields"""
+    return date.today().year + YEARS_AHEAD
 
 
-def validate_education_entry(education):
-    """Validate education entry"""
-    required_fields = ["degree", "institution"]
-    errors = []
+# Declarative content rules for one entry type:
+#   required: fields that must not be blank
+#   years:    (field, message) for whole-number fields between MIN_YEAR and
+#             latest_year(); "" means not given
+#   ordered:  (start, end, message) for year pairs that must not be reversed
+#   emails:   (field, message) for fields that must look like an email
+#   labels:   (field, label) overriding the title-cased field name in
+#             "<label> is required"
+EntrySchema = namedtuple(
+    "EntrySchema",
+    ["required", "years", "ordered", "emails", "labels"],
+    defaults=((), (), (), (), ()),
+)
 
-    for field in required_fields:
-        if not education.get(field, "").strip():
-            errors.append(f"{field.replace('_', ' ').title()} is required")
+PERSONAL_INFO_SCHEMA = EntrySchema(
+    required=("full_name", "email"),
+    emails=(("email", "Please enter a valid email address"),),
+)
 
-    # Year validation
-    start_year = education.get("start_year", 0)
-    end_year = education.get("end_year", 0)
+ENTRY_SCHEMAS = {
+    "education": EntrySchema(
+        required=("degree", "institution"),
+        years=(
+            ("start_year", "Please enter a valid start year"),
+            ("end_year", "Please enter a valid end year"),
+        ),
+        ordered=(
+            ("start_year", "end_year", "Start year cannot be greater than end year"),
+        ),
+    ),
+    "experience": EntrySchema(required=("job_title", "company")),
+    "projects": EntrySchema(required=("name", "description")),
+    "publications": EntrySchema(
+        required=("title", "authors", "journal", "year"),
+        years=(("year", "Please enter a valid publication year"),),
+    ),
+    "certifications": EntrySchema(
+        required=("name", "issuing_org"),
+        labels=(
+            ("name", "Certification name"),
+            ("issuing_org", "Issuing organization"),
+        ),
+    ),
+    "awards": EntrySchema(
+        required=("name", "awarding_org"),
+        labels=(("name", "Award name"), ("awarding_org", "Awarding organization")),
+    ),
+}
 
-    if start_year and end_year and start_year > end_year:
-        errors.append("Start year cannot be greater than end year")
 
-    return errors
+def _tuple_reader(getter, names):
+    """``read(entry)`` returning the named values as a tuple, even just one"""
+    read = getter(*names)
+    if len(names) == 1:
+        return lambda entry: (read(entry),)
+    return read
 
 
-def validate_experience_entry(experience):
-    """Validate work experience entry"""
-    required_fields = ["job_title", "company"]
-    errors = []
+def compile_schema(schema, record_type=None):
+    """Compile an ``EntrySchema`` into ``check(entry, latest, errors)``
 
-    for field in required_fields:
-        if not experience.get(field, "").strip():
-            errors.append(f"{field.replace('_', ' ').title()} is required")
+    Field names are resolved to positions and messages built once, so the
+    returned closure reads every field it needs in one ``attrgetter`` (for
+    ``record_type`` instances) or ``itemgetter`` (for dicts; ``get`` when a
+    key is missing) call and then runs each rule against that tuple. Problems
+    are appended to ``errors`` as ``(field, message)`` pairs; ``latest`` is
+    ``latest_year()``, passed in so a batch reads the clock once. Values are
+    assumed to have the types ``validate_cv`` checks.
+    """
+    labels = dict(schema.labels)
+    names = tuple(
+        dict.fromkeys(
+            [
+                *schema.required,
+                *(name for name, _ in schema.years),
+                *(name for start, end, _ in schema.ordered for name in (start, end)),
+                *(name for name, _ in schema.emails),
+            ]
+        )
+    )
+    if record_type is not None and not set(names) <= set(record_type.FIELDS):
+        raise ValueError(f"{record_type.__name__} has no field for every rule")
+    if not names:
+        return lambda entry, latest, errors: None
 
-    return errors
+    position = {name: index for index, name in enumerate(names)}
+    year_fields = {name for name, _ in schema.years}
+    required = [
+        (
+            position[name],
+            (name, f"{labels.get(name) or name.replace('_', ' ').title()} is required"),
+        )
+        for name in schema.required
+    ]
+    # Year fields hold numbers and are stringified before the blank check
+    texts = tuple(rule for rule in required if names[rule[0]] not in year_fields)
+    numbers = tuple(rule for rule in required if names[rule[0]] in year_fields)
+    years = tuple((position[name], (name, message)) for name, message in schema.years)
+    ordered = tuple(
+        (position[start], position[end], (end, message))
+        for start, end, message in schema.ordered
+    )
+    emails = tuple((position[name], (name, message)) for name, message in schema.emails)
+    blanks = ("",) * len(names)
+    read_record = _tuple_reader(attrgetter, names)
+    read_dict = _tuple_reader(itemgetter, names)
 
+    def check(entry, latest, errors):
+        if type(entry) is record_type:
+            values = read_record(entry)
+        else:
+            try:
+                values = read_dict(entry)
+            except KeyError:
+                values = tuple(map(entry.get, names, blanks))
+        for index, error in texts:
+            if not values[index].strip():
+                errors.append(error)
+        if numbers:
+            for index, error in numbers:
+                if not str(values[index]).strip():
+                    errors.append(error)
+        if years:
+            for index, error in years:
+                value = values[index]
+                if value != "" and not MIN_YEAR <= value <= latest:
+                    errors.append(error)
+        if ordered:
+            for start, end, error in ordered:
+                first = values[start]
+                last = values[end]
+                if first and last and first > last:
+                    errors.append(error)
+        if emails:
+            for index, error in emails:
+                value = values[index]
+                if value and "@" not in value:
+                    errors.append(error)
 
-def validate_project_entry(project):
-    """Validate project entry"""
-    required_fields = ["name", "description"]
-    errors = []
+    return check
 
-    for field in required_fields:
-        if not project.get(field, "").strip():
-            errors.append(f"{field.replace('_', ' ').title()} is required")
 
-    return errors
+def entry_validator(check):
+    """Form-style validator: the error messages for one entry"""
 
+    def validate(entry):
+        errors = []
+        check(entry, latest_year(), errors)
+        return [message for _, message in errors]
 
-def validate_publication_entry(publication):
-    """Validate publication entry"""
-    required_fields = ["title", "authors", "journal", "year"]
-    errors = []
+    return validate
 
-    for field in required_fields:
-        if not str(publication.get(field, "")).strip():
-            errors.append(f"{field.replace('_', ' ').title()} is required")
 
-    # Year validation
-    year = publication.get("year", 0)
-    if year and (year < 1900 or year > 2030):
-        errors.append("Please enter a valid publication year")
+# Compiled checks per section, shared by the forms and the import validator
+ENTRY_CHECKS = {
+    section: compile_schema(schema, SECTION_RECORDS[section])
+    for section, schema in ENTRY_SCHEMAS.items()
+}
 
-    return errors
+validate_personal_info = entry_validator(compile_schema(PERSONAL_INFO_SCHEMA))
+validate_education_entry = entry_validator(ENTRY_CHECKS["education"])
+validate_experience_entry = entry_validator(ENTRY_CHECKS["experience"])
+validate_project_entry = entry_validator(ENTRY_CHECKS["projects"])
+validate_publication_entry = entry_validator(ENTRY_CHECKS["publications"])
+validate_certification_entry = entry_validator(ENTRY_CHECKS["certifications"])
+validate_award_entry = entry_validator(ENTRY_CHECKS["awards"])
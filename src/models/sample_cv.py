@@ -0,0 +1,144 @@
+"""
+Synthetic reference CV used by benchmarks and template previews.
+"""
+
+from src.models.cv_data import init_cv_data
+from src.utils.photo import ingest_photo
+
+_DESCRIPTION = (
+    "Designed and maintained reproducible Snakemake pipelines for bulk and "
+    "single-cell RNA-seq, reducing turnaround from two weeks to three days. "
+    "Mentored graduate students and co-authored grant applications. "
+)
+
+
+def _sample_photo():
+    """Generate a synthetic portrait-sized JPEG and ingest it"""
+    from io import BytesIO
+
+    from PIL import Image
+
+    image = Image.radial_gradient("L").resize((1200, 1600)).convert("RGB")
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=92)
+    buffer.seek(0)
+    return ingest_photo(buffer, source_id="sample")
+
+
+def build_sample_cv(
+    publications=25, experience=4, description_sentences=3, with_photo=False
+):
+    """Build a realistic CV with the requested number of entries"""
+    cv_data = init_cv_data()
+    if with_photo:
+        cv_data["photo"] = _sample_photo()
+    cv_data["personal_info"].update(
+        {
+            "full_name": "Alex Morgan",
+            "title": "PhD Bioinformatician | Computational Biology Researcher",
+            "email": "alex.morgan@example.org",
+            "phone": "+44 20 7946 0000",
+            "location": "Cambridge, UK",
+            "linkedin": "https://linkedin.com/in/alexmorgan",
+            "github": "https://github.com/alexmorgan",
+            "orcid": "0000-0002-1825-0097",
+            "website": "https://alexmorgan.example.org",
+            "summary": (
+                "Computational biologist with ten years of experience in "
+                "genomics, transcriptomics and statistical modelling of "
+                "large-scale sequencing data."
+            ),
+        }
+    )
+    cv_data["skills"].update(
+        {
+            "programming_languages": ["Python", "R", "Bash", "C++"],
+            "bioinformatics_tools": ["GATK", "STAR", "Seurat", "Scanpy"],
+            "statistical_software": ["DESeq2", "limma"],
+            "databases": ["PostgreSQL", "Ensembl"],
+            "cloud_platforms": ["AWS", "Google Cloud"],
+            "other_technical": ["Snakemake", "Nextflow", "Docker"],
+        }
+    )
+    cv_data["education"] = [
+        {
+            "degree": "PhD in Bioinformatics",
+            "institution": "University of Cambridge",
+            "location": "Cambridge, UK",
+            "start_year": 2012,
+            "end_year": 2016,
+            "gpa": "",
+            "thesis_title": "Statistical methods for allele-specific expression",
+            "advisor": "Prof. Jane Doe",
+            "description": "",
+        },
+        {
+            "degree": "MSc in Computational Biology",
+            "institution": "University of Edinburgh",
+            "location": "Edinburgh, UK",
+            "start_year": 2011,
+            "end_year": 2012,
+            "gpa": "Distinction",
+            "thesis_title": "",
+            "advisor": "",
+            "description": "",
+        },
+    ]
+    cv_data["experience"] = [
+        {
+            "job_title": f"Senior Bioinformatician {i + 1}",
+            "company": "Genome Research Institute",
+            "location": "Hinxton, UK",
+            "start_date": f"{2016 + i}-01",
+            "end_date": "Present" if i == 0 else f"{2017 + i}-01",
+            "job_type": "Full-time",
+            "description": _DESCRIPTION * description_sentences,
+        }
+        for i in range(experience)
+    ]
+    cv_data["projects"] = [
+        {
+            "name": "scAtlas",
+            "type": "Open Source Software",
+            "start_date": "2019-03",
+            "end_date": "Ongoing",
+            "technologies": "Python, Scanpy, Dask",
+            "description": "Scalable integration of single-cell atlases.",
+            "github_link": "https://github.com/alexmorgan/scatlas",
+            "publication_link": "",
+        }
+    ]
+    cv_data["publications"] = [
+        {
+            "title": f"Resolving cell-type heterogeneity in tissue {i + 1}",
+            "authors": "Morgan, A., Smith, B., Doe, J.",
+            "journal": "Nature Methods",
+            "year": 2024 - i % 15,
+            "volume": str(10 + i % 12),
+            "pages": f"{100 + i}-{110 + i}",
+            "doi": f"10.1038/nmeth.{1000 + i}",
+            "pmid": "",
+            "url": "",
+            "type": "Journal Article",
+        }
+        for i in range(publications)
+    ]
+    cv_data["certifications"] = [
+        {
+            "name": "AWS Certified Solutions Architect",
+            "issuing_org": "Amazon Web Services",
+            "issue_date": "2021-06-01",
+            "expiry_date": "2024-06-01",
+            "credential_id": "",
+            "url": "",
+        }
+    ]
+    cv_data["awards"] = [
+        {
+            "name": "Early Career Research Award",
+            "awarding_org": "Genetics Society",
+            "date": "2020-09-15",
+            "description": "For contributions to single-cell methods.",
+        }
+    ]
+    return cv_data
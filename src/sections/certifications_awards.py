@@ -6,6 +6,13 @@ from datetime import datetime
 
 import streamlit as st
 
+from src.models.cv_data import (
+    Award,
+    Certification,
+    validate_award_entry,
+    validate_certification_entry,
+)
+from src.utils.cv_session import cv_section
 from src.utils.styles import display_section_header, display_success_message
 
 
@@ -15,7 +22,7 @@ def certifications_awards_section():
 
     # Certifications
     st.subheader("📜 Certifications")
-    certifications_list = st.session_state.cv_data["certifications"]
+    certifications_list = cv_section(st.session_state, "certifications")
 
     with st.expander("➕ Add New Certification"):
         with st.form("certification_form"):
@@ -54,21 +61,21 @@ def certifications_awards_section():
             )
 
             if st.form_submit_button("Add Certification", type="primary"):
-                new_cert = {
-                    "name": cert_name,
-                    "issuing_org": issuing_org,
-                    "issue_date": issue_date.strftime("%Y-%m-%d"),
-                    "expiry_date": (
+                new_cert = Certification(
+                    name=cert_name,
+                    issuing_org=issuing_org,
+                    issue_date=issue_date.strftime("%Y-%m-%d"),
+                    expiry_date=(
                         "No Expiry" if no_expiry else expiry_date.strftime("%Y-%m-%d")
                     ),
-                    "credential_id": credential_id,
-                    "url": cert_url,
-                }
+                    credential_id=credential_id,
+                    url=cert_url,
+                )
 
-                if not cert_name.strip() or not issuing_org.strip():
-                    st.error(
-                        "Certification name and issuing organization are required."
-                    )
+                errors = validate_certification_entry(new_cert)
+                if errors:
+                    for error in errors:
+                        st.error(error)
                 else:
                     certifications_list.append(new_cert)
                     display_success_message("Certification added successfully!")
@@ -103,7 +110,7 @@ def certifications_awards_section():
 
     # Awards
     st.subheader("🏅 Awards & Honors")
-    awards_list = st.session_state.cv_data["awards"]
+    awards_list = cv_section(st.session_state, "awards")
 
     with st.expander("➕ Add New Award"):
         with st.form("award_form"):
@@ -129,15 +136,17 @@ def certifications_awards_section():
             )
 
             if st.form_submit_button("Add Award", type="primary"):
-                new_award = {
-                    "name": award_name,
-                    "awarding_org": awarding_org,
-                    "date": award_date.strftime("%Y-%m-%d"),
-                    "description": award_description,
-                }
-
-                if not award_name.strip() or not awarding_org.strip():
-                    st.error("Award name and awarding organization are required.")
+                new_award = Award(
+                    name=award_name,
+                    awarding_org=awarding_org,
+                    date=award_date.strftime("%Y-%m-%d"),
+                    description=award_description,
+                )
+
+                errors = validate_award_entry(new_award)
+                if errors:
+                    for error in errors:
+                        st.error(error)
                 else:
                     awards_list.append(new_award)
                     display_success_message("Award added successfully!")
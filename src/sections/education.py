@@ -4,7 +4,13 @@ Education section for CV Builder.
 
 import streamlit as st
 
-from src.models.cv_data import validate_education_entry
+from src.models.cv_data import (
+    MIN_YEAR,
+    Education,
+    latest_year,
+    validate_education_entry,
+)
+from src.utils.cv_session import cv_section
 from src.utils.styles import display_section_header, display_success_message
 
 
@@ -12,7 +18,7 @@ def education_section():
     """Render the education section"""
     display_section_header("🎓 Education")
 
-    education_list = st.session_state.cv_data["education"]
+    education_list = cv_section(st.session_state, "education")
 
     # Add new education entry
     with st.expander("➕ Add New Education Entry"):
@@ -40,15 +46,15 @@ def education_section():
             with col2:
                 start_year = st.number_input(
                     "Start Year",
-                    min_value=1900,
-                    max_value=2030,
+                    min_value=MIN_YEAR,
+                    max_value=latest_year(),
                     value=2020,
                     help="Year you started the program",
                 )
                 end_year = st.number_input(
                     "End Year",
-                    min_value=1900,
-                    max_value=2030,
+                    min_value=MIN_YEAR,
+                    max_value=latest_year(),
                     value=2024,
                     help="Year you completed/will complete",
                 )
@@ -72,17 +78,17 @@ def education_section():
             )
 
             if st.form_submit_button("Add Education Entry", type="primary"):
-                new_education = {
-                    "degree": degree,
-                    "institution": institution,
-                    "location": location,
-                    "start_year": start_year,
-                    "end_year": end_year,
-                    "thesis_title": thesis_title,
-                    "advisor": advisor,
-                    "gpa": gpa,
-                    "description": description,
-                }
+                new_education = Education(
+                    degree=degree,
+                    institution=institution,
+                    location=location,
+                    start_year=start_year,
+                    end_year=end_year,
+                    thesis_title=thesis_title,
+                    advisor=advisor,
+                    gpa=gpa,
+                    description=description,
+                )
 
                 # Validate entry
                 errors = validate_education_entry(new_education)
@@ -6,7 +6,8 @@ from datetime import datetime
 
 import streamlit as st
 
-from src.models.cv_data import validate_experience_entry
+from src.models.cv_data import Experience, validate_experience_entry
+from src.utils.cv_session import cv_section
 from src.utils.styles import display_section_header, display_success_message
 
 
@@ -14,7 +15,7 @@ def experience_section():
     """Render the work experience section"""
     display_section_header("💼 Work Experience")
 
-    experience_list = st.session_state.cv_data["experience"]
+    experience_list = cv_section(st.session_state, "experience")
 
     # Add new experience entry
     with st.expander("➕ Add New Work Experience"):
@@ -74,17 +75,17 @@ def experience_section():
             )
 
             if st.form_submit_button("Add Experience", type="primary"):
-                new_experience = {
-                    "job_title": job_title,
-                    "company": company,
-                    "location": location,
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": (
+                new_experience = Experience(
+                    job_title=job_title,
+                    company=company,
+                    location=location,
+                    start_date=start_date.strftime("%Y-%m-%d"),
+                    end_date=(
                         "Present" if current_job else end_date.strftime("%Y-%m-%d")
                     ),
-                    "job_type": job_type,
-                    "description": description,
-                }
+                    job_type=job_type,
+                    description=description,
+                )
 
                 # Validate entry
                 errors = validate_experience_entry(new_experience)
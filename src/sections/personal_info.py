@@ -3,8 +3,8 @@ Personal Information section for CV Builder.
 """
 
 import streamlit as st
-from PIL import Image
 
+from src.utils.photo import ingest_photo, is_ingested_photo
 from src.utils.styles import display_section_header
 
 
@@ -20,14 +20,21 @@ def personal_info_section():
             "Upload your professional photo", type=["png", "jpg", "jpeg"]
         )
 
+        photo = st.session_state.cv_data.get("photo")
         if uploaded_file is not None:
-            image = Image.open(uploaded_file)
-            st.image(image, caption="Your Photo", width=200)
-            st.session_state.cv_data["photo"] = uploaded_file
-        elif st.session_state.cv_data.get("photo"):
-            st.image(
-                st.session_state.cv_data["photo"], caption="Current Photo", width=200
-            )
+            # Decode each upload once; later reruns reuse the stored renditions
+            source_id = getattr(uploaded_file, "file_id", uploaded_file.name)
+            if not is_ingested_photo(photo) or photo["source_id"] != source_id:
+                try:
+                    photo = ingest_photo(uploaded_file, source_id=source_id)
+                    st.session_state.cv_data["photo"] = photo
+                except Exception as e:
+                    st.error(f"Could not read the uploaded photo: {e}")
+                    photo = None
+            if is_ingested_photo(photo):
+                st.image(photo["preview"], caption="Your Photo", width=200)
+        elif is_ingested_photo(photo):
+            st.image(photo["preview"], caption="Current Photo", width=200)
 
     with col2:
         st.subheader("📝 Basic Information")
@@ -2,19 +2,66 @@
 Preview and Export section for CV Builder.
 """
 
-import json
+from concurrent.futures import CancelledError
+from concurrent.futures import wait as wait_for_futures
 
 import streamlit as st
 
-from src.utils.pdf_generator import generate_pdf_cv
+from src.utils.cv_file import (
+    CVB_EXTENSION,
+    CVB_MIME,
+    CVImportError,
+    dump_cvb,
+    dump_json,
+    load_cv_file,
+)
+from src.utils.cv_session import load_full_cv
+from src.utils.cv_validation import format_errors
+from src.utils.exporters import EXPORT_FORMATS, export_cv, export_filename
+from src.utils.pdf_generator import (
+    RenderError,
+    generate_all_templates_zip,
+    pdf_filename,
+)
+from src.utils.prerender import (
+    cancel_prerender,
+    queued_renderer,
+    request_render,
+    start_prerender,
+)
+from src.utils.preview_html import preview_html
+from src.utils.render_profiles import RENDER_PROFILES
+from src.utils.render_scheduler import render_scheduler
 from src.utils.styles import display_section_header, display_success_message
+from src.utils.thumbnails import template_thumbnails
+
+# Validation problems listed under a rejected import
+MAX_SHOWN_ERRORS = 20
+
+
+def wait_for_render(job):
+    """Wait for a queued render, showing its queue position and estimated wait"""
+    status = st.empty()
+    while not job.done():
+        position = render_scheduler.position(job)
+        eta = render_scheduler.estimated_wait(job)
+        if position:
+            status.info(
+                f"⏳ Waiting for a free renderer: position {position} in the "
+                f"queue, about {eta:.0f}s"
+            )
+        else:
+            status.info(f"🛠️ Generating PDF... about {eta:.0f}s left")
+        wait_for_futures([job.future], timeout=0.25)
+    status.empty()
+    return job.result()
 
 
 def preview_export_section():
     """Render the preview and export section"""
     display_section_header("👀 Preview & Export")
 
-    cv_data = st.session_state.cv_data
+    cv_data = load_full_cv(st.session_state)
     personal = cv_data["personal_info"]
 
     # Preview section
@@ -26,82 +73,8 @@ def preview_export_section():
         )
         return
 
-    # Create preview in a styled container
-    with st.container():
-        st.markdown('<div class="cv-preview">', unsafe_allow_html=True)
-
-        # Personal Info Preview
-        if personal["full_name"]:
-            st.markdown(f"### {personal['full_name']}")
-            if personal["title"]:
-                st.markdown(f"*{personal['title']}*")
-
-            contact_info = []
-            if personal["email"]:
-                contact_info.append(f"📧 {personal['email']}")
-            if personal["phone"]:
-                contact_info.append(f"📱 {personal['phone']}")
-            if personal["location"]:
-                contact_info.append(f"📍 {personal['location']}")
-
-            if contact_info:
-                st.write(" | ".join(contact_info))
-
-            # Online presence
-            online_presence = []
-            if personal["linkedin"]:
-                online_presence.append(f"💼 LinkedIn")
-            if personal["github"]:
-                online_presence.append(f"💻 GitHub")
-            if personal["orcid"]:
-                online_presence.append(f"🎓 ORCID")
-
-            if online_presence:
-                st.write(" | ".join(online_presence))
-
-            if personal["summary"]:
-                st.markdown("**Professional Summary:**")
-                st.write(personal["summary"])
-
-        # Skills Preview
-        if any(cv_data["skills"].values()):
-            st.markdown("**Technical Skills:**")
-            for category, skills_list in cv_data["skills"].items():
-                if skills_list:
-                    category_name = category.replace("_", " ").title()
-                    st.write(
-                        f"*{category_name}:* {', '.join(skills_list[:5])}{'...' if len(skills_list) > 5 else ''}"
-                    )
-
-        # Education Preview
-        if cv_data["education"]:
-            st.markdown("**Education:**")
-            for edu in cv_data["education"]:
-                st.write(
-                    f"• {edu['degree']} - {edu['institution']} ({edu['start_year']}-{edu['end_year']})"
-                )
-
-        # Experience Preview
-        if cv_data["experience"]:
-            st.markdown("**Work Experience:**")
-            for exp in cv_data["experience"]:
-                st.write(
-                    f"• {exp['job_title']} at {exp['company']} ({exp['start_date']} - {exp['end_date']})"
-                )
-
-        # Projects Preview
-        if cv_data["projects"]:
-            st.markdown("**Projects:**")
-            for project in cv_data["projects"][:3]:  # Show first 3 projects
-                st.write(f"• {project['name']} - {project['type']}")
-
-        # Publications Preview
-        if cv_data["publications"]:
-            st.markdown("**Publications:**")
-            for pub in cv_data["publications"][:3]:  # Show first 3 publications
-                st.write(f"• {pub['title']} ({pub['year']})")
-
-        st.markdown("</div>", unsafe_allow_html=True)
+    # One memoized HTML element instead of a websocket delta per line
+    st.markdown(preview_html(cv_data, style="summary"), unsafe_allow_html=True)
 
     # Export functionality
     st.subheader("💾 Export Options")
@@ -109,6 +82,16 @@ def preview_export_section():
 
     # PDF Template Selection
     st.subheader("📄 PDF Export Templates")
+
+    # Template gallery from thumbnails cached on disk, so browsing costs no renders
+    try:
+        thumbnails = template_thumbnails()
+    except RenderError:
+        thumbnails = {}
+    if thumbnails:
+        gallery = st.columns(len(thumbnails))
+        for column, (name, png) in zip(gallery, thumbnails.items()):
+            column.image(png, caption=name)
     template_col1, template_col2 = st.columns(2)
 
     with template_col1:
@@ -121,6 +104,7 @@ def preview_export_section():
                 "Scientific Research",
             ],
             help="Select a template that best fits your career focus",
+            key="pdf_template",
         )
 
         # Template descriptions
@@ -134,66 +118,148 @@ def preview_export_section():
 
     with template_col2:
         pdf_format = st.selectbox(
-            "PDF Format:", ["A4", "Letter"], help="Choose page size for your CV"
+            "PDF Format:",
+            ["A4", "Letter"],
+            help="Choose page size for your CV",
+            key="pdf_format",
         )
 
         compression_level = st.selectbox(
             "Compression Level:",
-            ["Standard", "High Quality", "Web Optimized"],
+            list(RENDER_PROFILES),
             help="Balance between file size and quality",
         )
 
+    # Remembered for the sidebar page estimate once this page is left
+    st.session_state.export_selection = (pdf_template, pdf_format)
+
+    # Start rendering the current selection in the background so the
+    # download button below usually finds the PDF ready
+    start_prerender(
+        st.session_state, cv_data, pdf_template, pdf_format, compression_level
+    )
+
     # Export buttons
     col1, col2, col3 = st.columns(3)
 
     with col1:
         if st.button("📄 Generate & Download PDF", type="primary"):
-            with st.spinner("Generating PDF..."):
-                pdf_file = generate_pdf_cv(
-                    cv_data, template=pdf_template, page_format=pdf_format
+            try:
+                job = request_render(
+                    st.session_state,
+                    cv_data,
+                    pdf_template,
+                    pdf_format,
+                    compression_level,
+                )
+                result = wait_for_render(job)
+            except CancelledError:
+                st.warning("This render was replaced by a newer request.")
+                result = None
+            except RenderError as e:
+                st.error(f"Error generating PDF: {e}")
+                result = None
+            if result is not None:
+                filename = pdf_filename(personal["full_name"], pdf_template)
+                st.download_button(
+                    label="⬇️ Download PDF",
+                    data=result.pdf,
+                    file_name=filename,
+                    mime="application/pdf",
+                    help="Click to download your formatted CV",
                 )
-                if pdf_file:
-                    filename = f"{personal['full_name'].replace(' ', '_')}_CV_{pdf_template.replace(' ', '_')}.pdf"
+                display_success_message("PDF generated successfully!")
+                st.caption(
+                    f"{result.page_count} page(s) · "
+                    f"{result.total_seconds * 1000:.0f} ms "
+                    f"(cache {result.cache_status})"
+                )
+
+        if st.button("🗂️ Generate All Templates (ZIP)"):
+            with st.spinner("Generating all templates..."):
+                try:
+                    zip_file = generate_all_templates_zip(
+                        cv_data,
+                        page_format=pdf_format,
+                        profile=compression_level,
+                        render=queued_renderer(st.session_state, "zip"),
+                    )
+                except RenderError as e:
+                    st.error(f"Error generating PDF archive: {e}")
+                    zip_file = None
+                if zip_file:
                     st.download_button(
-                        label="⬇️ Download PDF",
-                        data=pdf_file,
-                        file_name=filename,
-                        mime="application/pdf",
-                        help="Click to download your formatted CV",
+                        label="⬇️ Download ZIP",
+                        data=zip_file,
+                        file_name=f"{personal['full_name'].replace(' ', '_')}_CV_all_templates.zip",
+                        mime="application/zip",
+                        help="One PDF per template style",
                     )
-                    display_success_message("PDF generated successfully!")
+                    display_success_message("All templates generated successfully!")
 
     with col2:
-        # Export as JSON
-        json_data = json.dumps(cv_data, indent=2, default=str)
-        filename_json = (
-            f"{personal['full_name'].replace(' ', '_')}_CV_data.json"
+        # Word and plain-text versions serialize the same memoized document
+        for export_format in ("docx", "txt"):
+            export = EXPORT_FORMATS[export_format]
+            try:
+                data = export_cv(cv_data, export_format, pdf_template, pdf_format)
+            except RenderError as e:
+                st.error(f"Error exporting {export.label}: {e}")
+                continue
+            st.download_button(
+                label=f"📝 Export {export.label}",
+                data=data,
+                file_name=export_filename(
+                    personal["full_name"], pdf_template, export_format
+                ),
+                mime=export.mime,
+                help="Editable and applicant-tracking-system friendly versions",
+            )
+
+        # Export as JSON; both saves are memoized per CV
+        data_name = (
+            f"{personal['full_name'].replace(' ', '_')}_CV_data"
             if personal["full_name"]
-            else "CV_data.json"
+            else "CV_data"
         )
         st.download_button(
             label="💾 Export Data (JSON)",
-            data=json_data,
-            file_name=filename_json,
+            data=dump_json(cv_data),
+            file_name=f"{data_name}.json",
             mime="application/json",
-            help="Export your CV data for backup or transfer",
+            help="Export your CV data for backup or transfer (without the photo)",
+        )
+        st.download_button(
+            label="💾 Save CV File (.cvb)",
+            data=dump_cvb(cv_data),
+            file_name=f"{data_name}.{CVB_EXTENSION}",
+            mime=CVB_MIME,
+            help="Compact save including your photo; faster to save and load",
         )
 
     with col3:
-        # Import JSON data
-        uploaded_json = st.file_uploader(
+        # Import JSON or .cvb data
+        uploaded_file = st.file_uploader(
             "📂 Import CV Data",
-            type=["json"],
+            type=["json", CVB_EXTENSION],
             help="Import previously exported CV data",
         )
-        if uploaded_json is not None:
-            try:
-                imported_data = json.load(uploaded_json)
-                st.session_state.cv_data = imported_data
+        # The uploader keeps its file across reruns; import each upload once
+        if uploaded_file is not None:
+            if uploaded_file.file_id == st.session_state.get("imported_file_id"):
                 display_success_message("CV data imported successfully!")
-                st.rerun()
-            except Exception as e:
-                st.error(f"Error importing data: {e}")
+            else:
+                try:
+                    imported_data = load_cv_file(uploaded_file)
+                except CVImportError as e:
+                    st.error(f"Error importing data: {e}")
+                    if e.errors:
+                        st.code(format_errors(e.errors, limit=MAX_SHOWN_ERRORS))
+                else:
+                    st.session_state.cv_data = imported_data
+                    st.session_state.imported_file_id = uploaded_file.file_id
+                    cancel_prerender(st.session_state)
+                    st.rerun()
 
     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -6,7 +6,8 @@ from datetime import datetime
 
 import streamlit as st
 
-from src.models.cv_data import validate_project_entry
+from src.models.cv_data import Project, validate_project_entry
+from src.utils.cv_session import cv_section
 from src.utils.styles import display_section_header, display_success_message
 
 
@@ -14,7 +15,7 @@ def projects_section():
     """Render the projects section"""
     display_section_header("🚀 Projects")
 
-    projects_list = st.session_state.cv_data["projects"]
+    projects_list = cv_section(st.session_state, "projects")
 
     # Add new project
     with st.expander("➕ Add New Project"):
@@ -81,16 +82,16 @@ def projects_section():
             )
 
             if st.form_submit_button("Add Project", type="primary"):
-                new_project = {
-                    "name": project_name,
-                    "type": project_type,
-                    "start_date": start_date.strftime("%Y-%m-%d"),
-                    "end_date": "Ongoing" if ongoing else end_date.strftime("%Y-%m-%d"),
-                    "technologies": technologies,
-                    "github_link": github_link,
-                    "publication_link": publication_link,
-                    "description": description,
-                }
+                new_project = Project(
+                    name=project_name,
+                    type=project_type,
+                    start_date=start_date.strftime("%Y-%m-%d"),
+                    end_date="Ongoing" if ongoing else end_date.strftime("%Y-%m-%d"),
+                    technologies=technologies,
+                    github_link=github_link,
+                    publication_link=publication_link,
+                    description=description,
+                )
 
                 # Validate entry
                 errors = validate_project_entry(new_project)
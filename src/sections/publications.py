@@ -4,7 +4,13 @@ Publications section for CV Builder.
 
 import streamlit as st
 
-from src.models.cv_data import validate_publication_entry
+from src.models.cv_data import (
+    MIN_YEAR,
+    Publication,
+    latest_year,
+    validate_publication_entry,
+)
+from src.utils.cv_session import cv_section
 from src.utils.styles import display_section_header, display_success_message
 
 
@@ -12,7 +18,7 @@ def publications_section():
     """Render the publications section"""
     display_section_header("📚 Publications")
 
-    publications_list = st.session_state.cv_data["publications"]
+    publications_list = cv_section(st.session_state, "publications")
 
     # Add new publication
     with st.expander("➕ Add New Publication"):
@@ -35,8 +41,8 @@ def publications_section():
                 )
                 year = st.number_input(
                     "Year",
-                    min_value=1900,
-                    max_value=2030,
+                    min_value=MIN_YEAR,
+                    max_value=latest_year(),
                     value=2024,
                     help="Year of publication",
                 )
@@ -79,18 +85,18 @@ def publications_section():
                 )
 
             if st.form_submit_button("Add Publication", type="primary"):
-                new_publication = {
-                    "title": title,
-                    "authors": authors,
-                    "journal": journal,
-                    "year": year,
-                    "volume": volume,
-                    "pages": pages,
-                    "doi": doi,
-                    "pmid": pmid,
-                    "url": url,
-                    "type": pub_type,
-                }
+                new_publication = Publication(
+                    title=title,
+                    authors=authors,
+                    journal=journal,
+                    year=year,
+                    volume=volume,
+                    pages=pages,
+                    doi=doi,
+                    pmid=pmid,
+                    url=url,
+                    type=pub_type,
+                )
 
                 # Validate entry
                 errors = validate_publication_entry(new_publication)
@@ -177,8 +183,8 @@ def publications_section():
 
         with stats_col2:
             if publications_list:
-                latest_year = max(pub["year"] for pub in publications_list)
-                st.metric("Latest Publication", latest_year)
+                newest_year = max(pub["year"] for pub in publications_list)
+                st.metric("Latest Publication", newest_year)
 
         with stats_col3:
             # Count by type
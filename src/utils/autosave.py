@@ -0,0 +1,229 @@
+"""
+Debounced write-behind saving of CV changes to the SQLite store.
+
+Each rerun's changes are handed to ``autosave_writer.submit``, which only
+merges them into the CV's pending batch under a lock and returns; a
+background thread writes the batch once the CV has been quiet for the
+debounce window (``CV_AUTOSAVE_DEBOUNCE_MS``), or at the latest after
+``CV_AUTOSAVE_MAX_DELAY_MS`` of continuous editing. Changes to the same row
+coalesce: typing a summary over ten reruns writes the personal info row
+once, and a section rewrite drops the pending row changes it replaces.
+``stats()`` counts what was submitted, written and saved by coalescing.
+
+A failed write is retried with the batch merged under any newer changes,
+and pending batches are flushed when the process exits.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+
+from src.utils.cv_store import cv_store
+
+logger = logging.getLogger(__name__)
+
+DEBOUNCE_ENV = "CV_AUTOSAVE_DEBOUNCE_MS"
+MAX_DELAY_ENV = "CV_AUTOSAVE_MAX_DELAY_MS"
+
+
+def _change_key(change):
+    """Pending-batch key: changes with the same key overwrite each other"""
+    if change.kind in ("entry", "delete"):
+        return ("row", change.section, change.entry_id)
+    return (change.kind, change.section)
+
+
+class _Batch:
+    """Pending changes of one CV, in the order they must be applied"""
+
+    __slots__ = ("changes", "first_at", "last_at")
+
+    def __init__(self, now):
+        self.changes = {}
+        self.first_at = now
+        self.last_at = now
+
+    def merge(self, changes):
+        """Add changes, replacing pending ones they make redundant
+
+        Returns the number of pending changes dropped.
+        """
+        dropped = 0
+        pending = self.changes
+        for change in changes:
+            if change.kind == "section":
+                stale = [
+                    key
+                    for key in pending
+                    if key[0] == "row" and key[1] == change.section
+                ]
+                for key in stale:
+                    del pending[key]
+                dropped += len(stale)
+            key = _change_key(change)
+            # Re-inserting moves the key last, after what it depends on
+            if pending.pop(key, None) is not None:
+                dropped += 1
+            pending[key] = change
+        return dropped
+
+
+class AutosaveWriter:
+    """Coalesce CV changes per CV and write them on a background thread"""
+
+    def __init__(self, debounce=1.5, max_delay=10.0, write=None):
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.write = write or (lambda cv_id, changes: cv_store().write(cv_id, changes))
+        self._batches = {}
+        self._flush_now = set()
+        self._writing = None
+        self._writing_changes = ()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stats = {
+            "submitted": 0,
+            "coalesced": 0,
+            "written": 0,
+            "batches": 0,
+            "failures": 0,
+        }
+
+    def submit(self, cv_id, changes):
+        """Queue a CV's changes for saving; never waits for the disk"""
+        if not changes:
+            return
+        now = time.monotonic()
+        with self._cond:
+            batch = self._batches.get(cv_id)
+            if batch is None:
+                batch = self._batches[cv_id] = _Batch(now)
+            batch.last_at = now
+            self._stats["submitted"] += len(changes)
+            self._stats["coalesced"] += batch.merge(changes)
+            self._start_locked()
+            self._cond.notify()
+
+    def pending(self, cv_id):
+        """Whether the CV has changes not yet written"""
+        with self._cond:
+            return cv_id in self._batches or self._writing == cv_id
+
+    def pending_changes(self, cv_id):
+        """The CV's changes not yet written, in the order they apply
+
+        The batch being written comes before the one still waiting. A reader
+        applies them over what it reads from the store; applying one that
+        has just been written as well does no harm.
+        """
+        with self._cond:
+            changes = []
+            if self._writing == cv_id:
+                changes += self._writing_changes
+            batch = self._batches.get(cv_id)
+            if batch is not None:
+                changes += batch.changes.values()
+            return changes
+
+    def flush(self, cv_id=None, timeout=None):
+        """Write pending changes now and wait for them (all CVs by default)
+
+        Returns False if they weren't written within ``timeout`` seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+
+            def waiting():
+                if cv_id is None:
+                    return bool(self._batches) or self._writing is not None
+                return cv_id in self._batches or self._writing == cv_id
+
+            if cv_id is None:
+                self._flush_now.update(self._batches)
+            elif cv_id in self._batches:
+                self._flush_now.add(cv_id)
+            self._cond.notify_all()
+            while waiting():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def stats(self):
+        """Counters: submitted, coalesced, written, batches and failures"""
+        with self._cond:
+            return dict(self._stats)
+
+    def _start_locked(self):
+        """Start the writer thread on first use"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._work, name="cv-autosave", daemon=True
+            )
+            self._thread.start()
+
+    def _due_locked(self, now):
+        """``(cv_id, seconds until due)`` of the batch to write next"""
+        best = None
+        for cv_id, batch in self._batches.items():
+            if cv_id in self._flush_now:
+                return cv_id, 0.0
+            due = min(batch.last_at + self.debounce, batch.first_at + self.max_delay)
+            if best is None or due < best[1]:
+                best = (cv_id, due)
+        if best is None:
+            return None
+        return best[0], best[1] - now
+
+    def _work(self):
+        """Writer loop: wait for the next due batch and write it"""
+        while True:
+            with self._cond:
+                while True:
+                    due = self._due_locked(time.monotonic())
+                    if due is not None and due[1] <= 0:
+                        break
+                    self._cond.wait(None if due is None else due[1])
+                cv_id = due[0]
+                batch = self._batches.pop(cv_id)
+                self._flush_now.discard(cv_id)
+                self._writing = cv_id
+                changes = self._writing_changes = list(batch.changes.values())
+            try:
+                self.write(cv_id, changes)
+            except Exception as e:
+                logger.warning("Autosave of CV %s failed, will retry: %s", cv_id, e)
+                with self._cond:
+                    self._stats["failures"] += 1
+                    # Retry after a debounce window, under any newer changes
+                    newer = self._batches.pop(cv_id, None)
+                    batch.first_at = batch.last_at = time.monotonic()
+                    if newer is not None:
+                        dropped = batch.merge(newer.changes.values())
+                        self._stats["coalesced"] += dropped
+                    self._batches[cv_id] = batch
+            else:
+                with self._cond:
+                    self._stats["written"] += len(changes)
+                    self._stats["batches"] += 1
+            finally:
+                with self._cond:
+                    self._writing = None
+                    self._writing_changes = ()
+                    self._cond.notify_all()
+
+
+# Process-wide writer; tune with CV_AUTOSAVE_DEBOUNCE_MS / CV_AUTOSAVE_MAX_DELAY_MS
+autosave_writer = AutosaveWriter(
+    debounce=int(os.environ.get(DEBOUNCE_ENV, 1500)) / 1000,
+    max_delay=int(os.environ.get(MAX_DELAY_ENV, 10000)) / 1000,
+)
+
+
+@atexit.register
+def _flush_on_exit():
+    if not autosave_writer.flush(timeout=5.0):
+        logger.warning("Autosave: unsaved CV changes at exit")
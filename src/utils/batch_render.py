@@ -0,0 +1,240 @@
+"""
+Command-line batch rendering of exported CV JSON files to PDF.
+
+Files are loaded and validated by the same code as the app's import, so a
+file renders here exactly when the app would accept it; ``--check`` only
+validates, listing each problem with its JSON path.
+
+Usage:
+    python -m src.utils.batch_render exports/ --template "Academic Classic"
+    python -m src.utils.batch_render "round-3/*_CV_data.json" --workers 8
+    python -m src.utils.batch_render exports/ --check
+"""
+
+import argparse
+import glob
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.utils.cv_file import CVImportError, load_cv_file
+from src.utils.cv_validation import format_errors, problem_count
+from src.utils.pdf_generator import PAGE_SIZES, RenderError, render_pdf
+from src.utils.render_profiles import DEFAULT_PROFILE, RENDER_PROFILES
+from src.utils.template_styles import TEMPLATE_COLORS, warm_template_styles
+
+PAGE_FORMATS = list(PAGE_SIZES)
+# Validation problems printed per failing file
+MAX_PRINTED_ERRORS = 20
+
+
+def collect_input_files(patterns):
+    """Expand directories and glob patterns into a sorted list of JSON files"""
+    files = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.update(glob.glob(os.path.join(pattern, "*.json")))
+        else:
+            files.update(path for path in glob.glob(pattern) if os.path.isfile(path))
+    return sorted(files)
+
+
+def output_path_for(input_path, output_dir, template):
+    """Derive the PDF path for an input file and template"""
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    if stem.endswith("_CV_data"):
+        stem = stem[: -len("_CV_data")]
+    return os.path.join(output_dir, f"{stem}_CV_{template.replace(' ', '_')}.pdf")
+
+
+def load_input(input_path):
+    """Read a CV file exactly as the app imports it (see ``load_cv_file``)
+
+    Raises ``CVImportError``, with the validation problems in ``errors``.
+    """
+    with open(input_path, "rb") as f:
+        return load_cv_file(f)
+
+
+def check_files(files):
+    """Validate ``files`` without rendering; return the number that failed"""
+    failed = 0
+    for path in files:
+        try:
+            load_input(path)
+            errors = []
+        except CVImportError as e:
+            errors = e.errors or [("$", str(e))]
+        except OSError as e:
+            errors = [("$", f"unreadable: {e}")]
+        if errors:
+            failed += 1
+            print(f"INVALID {path}: {problem_count(errors)}", file=sys.stderr)
+            print(format_errors(errors, limit=MAX_PRINTED_ERRORS), file=sys.stderr)
+    return failed
+
+
+def _init_worker():
+    """Compile template styles once per worker process"""
+    warm_template_styles()
+
+
+def render_file(input_path, output_dir, template, page_format, profile):
+    """Render one CV JSON file; never raises so one bad file can't stop a batch"""
+    started = time.perf_counter()
+    try:
+        try:
+            cv_data = load_input(input_path)
+        except CVImportError as e:
+            if not e.errors:
+                raise
+            raise ValueError(
+                f"invalid CV data ({problem_count(e.errors)}), first: "
+                + format_errors(e.errors, limit=1).splitlines()[0]
+            ) from e
+        output_path = output_path_for(input_path, output_dir, template)
+        # Stream the document straight into the output file
+        try:
+            with open(output_path, "wb") as f:
+                result = render_pdf(
+                    cv_data,
+                    template=template,
+                    page_format=page_format,
+                    profile=profile,
+                    use_cache=False,
+                    output=f,
+                )
+        except RenderError:
+            os.remove(output_path)
+            raise
+        pages = result.page_count
+        error = None
+    except Exception as e:
+        output_path = None
+        pages = 0
+        error = f"{type(e).__name__}: {e}"
+    return {
+        "input": input_path,
+        "output": output_path,
+        "pages": pages,
+        "error": error,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_batch(files, output_dir, template, page_format, profile, workers=None):
+    """Render ``files`` across a process pool and return the per-file results"""
+    os.makedirs(output_dir, exist_ok=True)
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = [
+            pool.submit(render_file, path, output_dir, template, page_format, profile)
+            for path in files
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            if result["error"]:
+                print(f"FAILED {result['input']}: {result['error']}", file=sys.stderr)
+            results.append(result)
+    return results
+
+
+def format_summary(results, wall_seconds):
+    """Summarize throughput and latency of a finished batch"""
+    latencies = [r["seconds"] for r in results]
+    failed = sum(1 for r in results if r["error"])
+    throughput = len(results) / wall_seconds if wall_seconds else 0.0
+    return "\n".join(
+        [
+            f"Rendered {len(results) - failed}/{len(results)} files "
+            f"({failed} failed, {sum(r['pages'] for r in results)} pages) "
+            f"in {wall_seconds:.2f}s",
+            f"Throughput: {throughput:.1f} files/s",
+            f"Latency: p50 {percentile(latencies, 50) * 1000:.0f} ms, "
+            f"p95 {percentile(latencies, 95) * 1000:.0f} ms, "
+            f"max {max(latencies, default=0.0) * 1000:.0f} ms",
+        ]
+    )
+
+
+def main(argv=None):
+    """Entry point for the batch rendering CLI"""
+    parser = argparse.ArgumentParser(
+        description="Render exported CV JSON files to PDF in parallel."
+    )
+    parser.add_argument(
+        "inputs", nargs="+", help="CV JSON files, directories or glob patterns"
+    )
+    parser.add_argument(
+        "-o", "--output-dir", default="pdf_output", help="Directory for the PDFs"
+    )
+    parser.add_argument(
+        "-t",
+        "--template",
+        default="Professional Blue",
+        choices=list(TEMPLATE_COLORS),
+        help="PDF template style",
+    )
+    parser.add_argument(
+        "-f", "--page-format", default="A4", choices=PAGE_FORMATS, help="Page size"
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        default=DEFAULT_PROFILE,
+        choices=list(RENDER_PROFILES),
+        help="Render profile (size/speed trade-off)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only validate the files, listing every problem",
+    )
+    args = parser.parse_args(argv)
+
+    files = collect_input_files(args.inputs)
+    if not files:
+        parser.error("no CV JSON files matched the given inputs")
+
+    if args.check:
+        started = time.perf_counter()
+        failed = check_files(files)
+        print(
+            f"Validated {len(files)} files ({failed} invalid) "
+            f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+        return 1 if failed else 0
+
+    started = time.perf_counter()
+    results = run_batch(
+        files,
+        args.output_dir,
+        args.template,
+        args.page_format,
+        args.profile,
+        args.workers,
+    )
+    print(format_summary(results, time.perf_counter() - started))
+    return 1 if any(r["error"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
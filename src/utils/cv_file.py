@@ -0,0 +1,285 @@
+"""
+Saving and loading CV data files: JSON and the compact ``.cvb`` container.
+
+A ``.cvb`` file is a versioned binary container:
+
+    b"CVB" + version byte
+    u32 body length, body: compact UTF-8 JSON
+    u32 blob count, then u32 length + raw bytes per blob
+
+Entry sections are stored column-wise in the body (field names once, then
+one value row per entry), and ``bytes`` values such as the photo are stored
+as raw blobs referenced from the body, so a save needs no base64 and no
+indentation and a load builds records straight from rows. All integers are
+big-endian.
+
+Uploads are read in chunks and rejected as soon as they exceed
+``max_import_bytes()``, and ``.cvb`` lengths are checked against the data
+actually present, so a huge or malformed file fails fast with
+``CVImportError`` instead of tying up a server thread. JSON is not parsed
+incrementally: Streamlit holds the whole upload in memory before the app
+sees it, so the size cap is what bounds memory and parse time, and once the
+file is under it one C-level ``json.loads`` is much faster than a streaming
+parser in Python. The parsed data is then checked in one pass by
+``validate_cv``, so a file with wrongly typed values is rejected with every
+problem listed instead of breaking a renderer.
+"""
+
+import json
+import logging
+import os
+import struct
+
+from src.models.cv_data import (
+    SECTION_RECORDS,
+    Record,
+    cv_from_json,
+    cv_to_json,
+    init_cv_data,
+)
+from src.utils.cv_validation import problem_count, validate_cv
+from src.utils.render_cache import LRUCache, canonical_digest
+
+logger = logging.getLogger(__name__)
+
+CVB_MAGIC = b"CVB"
+CVB_VERSION = 1
+CVB_EXTENSION = "cvb"
+CVB_MIME = "application/octet-stream"
+
+MAX_IMPORT_BYTES_ENV = "CV_IMPORT_MAX_BYTES"
+DEFAULT_MAX_IMPORT_BYTES = 16 * 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+
+_U32 = struct.Struct(">I")
+# Marks a bytes value in the body; the value is the blob's index
+_BLOB_KEY = "$blob"
+
+# Saved files keyed by (CV digest, format)
+cv_file_cache = LRUCache(max_entries=16)
+
+
+class CVImportError(ValueError):
+    """An uploaded CV file is too large, malformed or not CV data
+
+    ``errors`` lists the ``(path, message)`` problems found when the file
+    parsed but failed validation.
+    """
+
+    def __init__(self, message, errors=()):
+        super().__init__(message)
+        self.errors = list(errors)
+
+
+def max_import_bytes():
+    """Largest CV file accepted for import, from ``CV_IMPORT_MAX_BYTES``"""
+    value = os.environ.get(MAX_IMPORT_BYTES_ENV)
+    return int(value) if value else DEFAULT_MAX_IMPORT_BYTES
+
+
+def read_capped(stream, max_bytes=None):
+    """Read a file-like object in chunks, failing once it exceeds ``max_bytes``"""
+    max_bytes = max_bytes or max_import_bytes()
+    chunks = []
+    total = 0
+    while True:
+        chunk = stream.read(READ_CHUNK_BYTES)
+        if not chunk:
+            return b"".join(chunks)
+        total += len(chunk)
+        if total > max_bytes:
+            raise CVImportError(
+                f"File is larger than the {max_bytes / 1024 / 1024:.0f} MB import limit"
+            )
+        chunks.append(chunk)
+
+
+def _memoized(cv_data, file_format, dump):
+    key = (canonical_digest(cv_data), file_format)
+    data = cv_file_cache.get(key)
+    if data is None:
+        data = dump(cv_data)
+        cv_file_cache.put(key, data)
+    return data
+
+
+def _dump_json(cv_data):
+    # The photo is binary and is not part of the JSON export
+    data = cv_to_json({**cv_data, "photo": None})
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
+
+def dump_json(cv_data):
+    """Human-readable JSON export of a CV (without the photo), memoized"""
+    return _memoized(cv_data, "json", _dump_json)
+
+
+def _encode_section(entries, fields):
+    """Column-wise section: field names, value rows and any extra keys"""
+    rows = []
+    extra = []
+    for index, entry in enumerate(entries):
+        rows.append([entry.get(field, "") for field in fields])
+        unknown = {key: entry[key] for key in entry.keys() if key not in fields}
+        if unknown:
+            extra.append([index, unknown])
+    section = {"fields": list(fields), "rows": rows}
+    if extra:
+        section["extra"] = extra
+    return section
+
+
+def _dump_cvb(cv_data):
+    blobs = []
+
+    def blob(value):
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            blobs.append(bytes(value))
+            return {_BLOB_KEY: len(blobs) - 1}
+        if isinstance(value, Record):
+            return value.to_dict()
+        raise TypeError(f"Can't save {type(value).__name__} values")
+
+    body = dict(cv_data)
+    for section, record_type in SECTION_RECORDS.items():
+        if section in body:
+            body[section] = _encode_section(body[section], record_type.FIELDS)
+    body = json.dumps(
+        body, separators=(",", ":"), ensure_ascii=False, default=blob
+    ).encode("utf-8")
+
+    parts = [CVB_MAGIC, bytes([CVB_VERSION]), _U32.pack(len(body)), body]
+    parts.append(_U32.pack(len(blobs)))
+    for data in blobs:
+        parts += [_U32.pack(len(data)), data]
+    return b"".join(parts)
+
+
+def dump_cvb(cv_data):
+    """Compact binary save of a CV, photo included, memoized"""
+    return _memoized(cv_data, "cvb", _dump_cvb)
+
+
+def _read_u32(data, offset):
+    if offset + _U32.size > len(data):
+        raise CVImportError("Truncated .cvb file")
+    return _U32.unpack_from(data, offset)[0], offset + _U32.size
+
+
+def _read_bytes(data, offset, length):
+    end = offset + length
+    if end > len(data):
+        raise CVImportError("Truncated .cvb file")
+    return data[offset:end], end
+
+
+def _decode_section(section, record_type):
+    """Rebuild a section's records from its field names and value rows"""
+    fields = section["fields"]
+    if fields == list(record_type.FIELDS):
+        records = [record_type.from_row(row) for row in section["rows"]]
+    else:
+        # Saved by a version with other fields; match values up by name
+        records = [
+            record_type.from_dict(dict(zip(fields, row))) for row in section["rows"]
+        ]
+    for index, extra in section.get("extra", ()):
+        for key, value in extra.items():
+            records[index][key] = value
+    return records
+
+
+def load_cvb(data):
+    """Parse a ``.cvb`` file into CV data with record entries"""
+    view = memoryview(data)
+    if bytes(view[:3]) != CVB_MAGIC or len(view) < 4:
+        raise CVImportError("Not a .cvb file")
+    version = view[3]
+    if version > CVB_VERSION:
+        raise CVImportError(
+            f".cvb version {version} is newer than this app supports ({CVB_VERSION})"
+        )
+    length, offset = _read_u32(view, 4)
+    body, offset = _read_bytes(view, offset, length)
+    count, offset = _read_u32(view, offset)
+    blobs = []
+    for _ in range(count):
+        length, offset = _read_u32(view, offset)
+        blob, offset = _read_bytes(view, offset, length)
+        blobs.append(bytes(blob))
+
+    def resolve(obj):
+        if len(obj) == 1 and _BLOB_KEY in obj:
+            return blobs[obj[_BLOB_KEY]]
+        return obj
+
+    try:
+        cv_data = json.loads(bytes(body), object_hook=resolve)
+        for section, record_type in SECTION_RECORDS.items():
+            if section in cv_data:
+                cv_data[section] = _decode_section(cv_data[section], record_type)
+    except (ValueError, RecursionError) as e:
+        raise CVImportError(f"Corrupt .cvb file: {e}") from e
+    except (KeyError, IndexError, TypeError, AttributeError) as e:
+        raise CVImportError(f"Corrupt .cvb file: {type(e).__name__}: {e}") from e
+    return cv_data
+
+
+def load_json(data):
+    """Parse a JSON export already capped by ``read_capped``"""
+    try:
+        return json.loads(data)
+    except (ValueError, RecursionError) as e:
+        raise CVImportError(f"Invalid JSON: {e}") from e
+
+
+def _drop_legacy_photo(cv_data):
+    """Drop the photo text older JSON exports wrote in place of the photo
+
+    Before the photo was left out of JSON exports it was dumped with
+    ``default=str``, so those files hold a string the renderer always
+    ignored. It can't be turned back into an image, so it is dropped
+    instead of failing the whole file.
+    """
+    if type(cv_data) is dict and isinstance(cv_data.get("photo"), str):
+        logger.warning("Dropping the photo of a legacy JSON export")
+        cv_data["photo"] = None
+
+
+def _with_defaults(cv_data):
+    """CV data with every section and every personal info and skills key
+
+    Files from older versions, or written by hand, may leave out keys the
+    forms and renderers index directly; those start empty.
+    """
+    defaults = init_cv_data()
+    complete = {**defaults, **cv_data}
+    for part in ("personal_info", "skills"):
+        complete[part] = {**defaults[part], **cv_data.get(part, {})}
+    return complete
+
+
+def load_cv_file(stream, max_bytes=None):
+    """Read an uploaded JSON or ``.cvb`` file into CV data
+
+    The format is detected from the content. Sections, personal info fields
+    and skill categories missing from the file start empty, and the unusable
+    photo text of old JSON exports is dropped.
+    Raises ``CVImportError`` for files over ``max_bytes``
+    (``max_import_bytes()`` by default) or that don't hold CV data.
+    """
+    data = read_capped(stream, max_bytes)
+    if data.startswith(CVB_MAGIC):
+        cv_data = load_cvb(data)
+    else:
+        cv_data = load_json(data)
+        _drop_legacy_photo(cv_data)
+    errors = validate_cv(cv_data)
+    if errors:
+        raise CVImportError(
+            f"File does not contain valid CV data ({problem_count(errors)})", errors
+        )
+    try:
+        return cv_from_json(_with_defaults(cv_data))
+    except (TypeError, AttributeError) as e:
+        raise CVImportError(f"File does not contain CV data: {e}") from e
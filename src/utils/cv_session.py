@@ -0,0 +1,235 @@
+"""
+Keep a session's CV in the SQLite store, loading it a section at a time.
+
+The CV id travels in the page URL (``?cv=<id>``), so reloading the page or
+reconnecting after a server restart picks the same CV up again.
+``open_cv`` loads personal info, skills and the photo; entry sections stay
+out of ``cv_data`` until ``cv_section`` (one section) or ``load_full_cv``
+(preview and export) needs them. Changes the autosave writer hasn't written
+yet are applied over what is read, so a reload right after an edit shows
+the edit without waiting for the disk. After each run ``save_cv_changes`` finds
+what the run changed and hands it to the debounced ``autosave_writer``: an
+added entry is one inserted row, a removed one a deleted row, edited
+personal info or skills one row each.
+
+Entries are compared by identity, so an edit replaces the entry (as the
+forms do) instead of changing it in place. When the store can't be opened
+the session keeps working in memory only.
+"""
+
+import json
+import logging
+import operator
+import sqlite3
+import uuid
+
+from src.models.cv_data import SECTION_RECORDS, init_cv_data
+from src.utils.autosave import autosave_writer
+from src.utils.cv_store import JSON_PARTS, Change, cv_store, dump_value
+
+logger = logging.getLogger(__name__)
+
+CV_ID_PARAM = "cv"
+CV_ID_KEY = "_cv_id"
+SNAPSHOT_KEY = "_cv_snapshot"
+COUNTS_KEY = "_cv_stored_counts"
+ENTRY_CHANGES = ("entry", "delete", "section")
+
+
+def _part_snapshot(cv_data, part):
+    """Copy of a single-object part, to compare against after the next run"""
+    value = cv_data[part]
+    if part == "skills":
+        return {category: list(skills) for category, skills in value.items()}
+    return dict(value)
+
+
+def _apply_pending(parts, sections, changes):
+    """Apply changes the autosave writer hasn't written over what was read
+
+    ``sections`` maps each section the changes touch to its ``(entry ids,
+    records)`` from the store. Applying a change the store already has
+    leaves the result unchanged.
+    """
+    for kind, section, entry_id, value in changes:
+        if kind == "part":
+            parts[section] = json.loads(value)
+        elif kind == "photo":
+            parts["photo"] = value
+        else:
+            entry_ids, records = sections[section]
+            record_type = SECTION_RECORDS[section]
+            index = entry_ids.index(entry_id) if entry_id in entry_ids else None
+            if kind == "section":
+                entry_ids[:] = [row_id for row_id, _ in value]
+                records[:] = [
+                    record_type.from_dict(json.loads(data)) for _, data in value
+                ]
+            elif kind == "delete":
+                if index is not None:
+                    del entry_ids[index], records[index]
+            elif index is None:
+                entry_ids.append(entry_id)
+                records.append(record_type.from_dict(json.loads(value)))
+            else:
+                records[index] = record_type.from_dict(json.loads(value))
+
+
+def open_cv(state, query_params):
+    """Set up ``state["cv_data"]`` for a new session from the store
+
+    Does nothing once the session has its CV. ``query_params`` is the
+    page's URL parameters (``st.query_params``); a new CV id is added to
+    them so a reload finds the CV again.
+    """
+    if "cv_data" in state:
+        return
+    cv_data = init_cv_data()
+    cv_id = query_params.get(CV_ID_PARAM) or uuid.uuid4().hex
+    counts = {}
+    loaded = {}
+    try:
+        # Taken before reading, so a change written meanwhile is either read
+        # or applied
+        pending = autosave_writer.pending_changes(cv_id)
+        store = cv_store()
+        parts = store.load_parts(cv_id)
+        counts = store.section_counts(cv_id)
+        for change in pending:
+            if change.kind in ENTRY_CHANGES and change.section not in loaded:
+                loaded[change.section] = store.load_section(cv_id, change.section)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("CV store unavailable; keeping the CV in memory: %s", e)
+        cv_id = None
+        loaded = {}
+    else:
+        _apply_pending(parts, loaded, pending)
+        for part in JSON_PARTS:
+            cv_data[part].update(parts.get(part, {}))
+        cv_data["photo"] = parts.get("photo")
+        query_params[CV_ID_PARAM] = cv_id
+
+    sections = {}
+    for section in SECTION_RECORDS:
+        if section in loaded:
+            entry_ids, records = loaded[section]
+            cv_data[section] = records
+            sections[section] = (list(records), entry_ids)
+        elif counts.get(section):
+            # Loaded by cv_section() when a page first shows it
+            del cv_data[section]
+        else:
+            sections[section] = ([], [])
+    state[CV_ID_KEY] = cv_id
+    state[COUNTS_KEY] = counts
+    state[SNAPSHOT_KEY] = {
+        "parts": {part: _part_snapshot(cv_data, part) for part in JSON_PARTS},
+        "photo": cv_data["photo"],
+        "sections": sections,
+    }
+    state["cv_data"] = cv_data
+
+
+def cv_section(state, section):
+    """The entry list of ``section``, loading it from the store if needed"""
+    cv_data = state["cv_data"]
+    if section not in cv_data:
+        entry_ids, records = cv_store().load_section(state[CV_ID_KEY], section)
+        cv_data[section] = records
+        state[SNAPSHOT_KEY]["sections"][section] = (list(records), entry_ids)
+    return cv_data[section]
+
+
+def load_full_cv(state):
+    """``cv_data`` with every section loaded, for previews and exports"""
+    for section in SECTION_RECORDS:
+        cv_section(state, section)
+    return state["cv_data"]
+
+
+def section_size(state, section):
+    """Number of entries in ``section`` without loading it"""
+    cv_data = state["cv_data"]
+    if section in cv_data:
+        return len(cv_data[section])
+    return state[COUNTS_KEY].get(section, 0)
+
+
+def _new_entry_id():
+    return uuid.uuid4().hex
+
+
+def _section_changes(section, entries, snapshot):
+    """Changes turning the snapshot of a section into ``entries``
+
+    Returns ``(changes, new snapshot)``. Added entries get a new id and are
+    appended by the store, and removed entries are deleted by id; anything
+    else (a reorder, an insert before a saved entry, a section that was
+    never loaded, e.g. after an import) rewrites the whole section.
+    """
+    if snapshot is not None:
+        old_entries, old_ids = snapshot
+        if len(entries) == len(old_entries) and all(
+            map(operator.is_, entries, old_entries)
+        ):
+            return [], snapshot
+        saved = {id(entry): index for index, entry in enumerate(old_entries)}
+        changes = []
+        entry_ids = []
+        last = -1
+        appending = False
+        for entry in entries:
+            index = saved.pop(id(entry), None)
+            if index is None:
+                entry_id = _new_entry_id()
+                appending = True
+                changes.append(Change("entry", section, entry_id, dump_value(entry)))
+            elif appending or index < last:
+                break
+            else:
+                entry_id = old_ids[index]
+                last = index
+            entry_ids.append(entry_id)
+        else:
+            changes += [
+                Change("delete", section, old_ids[index], None)
+                for index in saved.values()
+            ]
+            return changes, (list(entries), entry_ids)
+    entry_ids = [_new_entry_id() for _ in entries]
+    rows = [
+        (entry_id, dump_value(entry)) for entry_id, entry in zip(entry_ids, entries)
+    ]
+    return [Change("section", section, None, rows)], (list(entries), entry_ids)
+
+
+def collect_changes(state):
+    """``(changes, new snapshot)`` for everything edited since the last save"""
+    cv_data = state["cv_data"]
+    snapshot = state[SNAPSHOT_KEY]
+    changes = []
+    parts = dict(snapshot["parts"])
+    for part in JSON_PARTS:
+        if cv_data[part] != parts[part]:
+            changes.append(Change("part", part, None, dump_value(cv_data[part])))
+            parts[part] = _part_snapshot(cv_data, part)
+    photo = cv_data.get("photo")
+    if photo is not snapshot["photo"]:
+        changes.append(Change("photo", None, None, photo))
+    sections = dict(snapshot["sections"])
+    for section in SECTION_RECORDS:
+        if section in cv_data:
+            section_changes, sections[section] = _section_changes(
+                section, cv_data[section], sections.get(section)
+            )
+            changes += section_changes
+    return changes, {"parts": parts, "photo": photo, "sections": sections}
+
+
+def save_cv_changes(state):
+    """Queue what this session changed since its last save for autosave"""
+    if state.get(CV_ID_KEY) is None or "cv_data" not in state:
+        return
+    changes, snapshot = collect_changes(state)
+    autosave_writer.submit(state[CV_ID_KEY], changes)
+    state[SNAPSHOT_KEY] = snapshot
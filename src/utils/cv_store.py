@@ -0,0 +1,269 @@
+"""
+Durable CV storage in SQLite, one row per entry.
+
+Each CV is identified by a ``cv_id``. Personal info and skills are one JSON
+row each, the photo one row of blobs, and every education, experience, ...
+entry its own row with an ``entry_id`` chosen by the session that added it
+and a ``position`` the store allocates when the row is inserted. Positions
+only grow within a section, so adding an entry is a single-row insert and
+removing one a single-row delete; the other rows are never rewritten. Two
+sessions adding entries to the same CV get distinct rows, as the position
+is taken inside the write transaction.
+Sections are loaded on their own, so a page that shows publications
+deserializes publications and nothing else.
+
+The database runs in WAL mode, so readers never wait for the writer, and
+each thread gets its own connection. Changes are applied as a batch in one
+transaction by ``CVStore.write``:
+
+    Change("part", "personal_info", None, json_text)
+    Change("photo", None, None, photo_or_None)
+    Change("entry", "publications", entry_id, json_text)  # append or update
+    Change("delete", "publications", entry_id, None)
+    Change("section", "publications", None, [(entry_id, json_text), ...])
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from src.models.cv_data import SECTION_RECORDS
+
+STORE_PATH_ENV = "CV_STORE_PATH"
+DEFAULT_STORE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+    "cv_store.sqlite3",
+)
+# Single-object parts of a CV stored as JSON rows
+JSON_PARTS = ("personal_info", "skills")
+# Seconds a connection waits for another process's write lock
+BUSY_TIMEOUT = 5.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cvs (
+    cv_id TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cv_parts (
+    cv_id TEXT NOT NULL,
+    part TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (cv_id, part)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cv_photos (
+    cv_id TEXT PRIMARY KEY,
+    pdf BLOB NOT NULL,
+    preview BLOB NOT NULL,
+    source_id TEXT,
+    digest TEXT
+);
+CREATE TABLE IF NOT EXISTS cv_entries (
+    cv_id TEXT NOT NULL,
+    section TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    entry_id TEXT,
+    PRIMARY KEY (cv_id, section, position)
+);
+"""
+# Stores created before entries had ids use the position as the id
+ENTRY_ID_MIGRATION = """
+ALTER TABLE cv_entries ADD COLUMN entry_id TEXT;
+UPDATE cv_entries SET entry_id = CAST(position AS TEXT);
+"""
+ENTRY_ID_INDEX = """
+CREATE UNIQUE INDEX IF NOT EXISTS cv_entries_entry_id
+ON cv_entries (cv_id, section, entry_id);
+"""
+
+Change = namedtuple("Change", ["kind", "section", "entry_id", "value"])
+
+
+def store_path():
+    """SQLite file holding saved CVs, from ``CV_STORE_PATH``"""
+    return os.environ.get(STORE_PATH_ENV) or DEFAULT_STORE_PATH
+
+
+def dump_value(value):
+    """Compact JSON text of a part or entry, as stored in a row"""
+    if hasattr(value, "to_dict"):
+        value = value.to_dict()
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class CVStore:
+    """Per-entry CV storage in one SQLite database file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as connection:
+            connection.executescript(SCHEMA)
+            columns = [
+                row[1] for row in connection.execute("PRAGMA table_info(cv_entries)")
+            ]
+            if "entry_id" not in columns:
+                connection.executescript(ENTRY_ID_MIGRATION)
+            connection.executescript(ENTRY_ID_INDEX)
+
+    def _connection(self):
+        """This thread's connection, opened on first use"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # WAL makes NORMAL durable across application crashes; only an
+            # OS crash can lose the last transactions
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def close(self):
+        """Close this thread's connection"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def exists(self, cv_id):
+        row = (
+            self._connection()
+            .execute("SELECT 1 FROM cvs WHERE cv_id = ?", (cv_id,))
+            .fetchone()
+        )
+        return row is not None
+
+    def load_parts(self, cv_id):
+        """The CV's personal info, skills and photo that have been saved"""
+        connection = self._connection()
+        parts = {
+            part: json.loads(data)
+            for part, data in connection.execute(
+                "SELECT part, data FROM cv_parts WHERE cv_id = ?", (cv_id,)
+            )
+        }
+        row = connection.execute(
+            "SELECT pdf, preview, source_id, digest FROM cv_photos WHERE cv_id = ?",
+            (cv_id,),
+        ).fetchone()
+        if row is not None:
+            parts["photo"] = dict(zip(("pdf", "preview", "source_id", "digest"), row))
+        return parts
+
+    def section_counts(self, cv_id):
+        """Number of saved entries per section"""
+        return dict(
+            self._connection().execute(
+                "SELECT section, COUNT(*) FROM cv_entries WHERE cv_id = ? "
+                "GROUP BY section",
+                (cv_id,),
+            )
+        )
+
+    def load_section(self, cv_id, section):
+        """``(entry ids, records)`` of one section, in order"""
+        record_type = SECTION_RECORDS[section]
+        # One JSON array per column, so the rows are parsed in one call; both
+        # come from the same aggregate pass, so ids line up with rows
+        entry_ids, rows = (
+            self._connection()
+            .execute(
+                "SELECT json_group_array(entry_id), "
+                "'[' || COALESCE(group_concat(data), '') || ']' FROM ("
+                "SELECT entry_id, data FROM cv_entries "
+                "WHERE cv_id = ? AND section = ? ORDER BY position)",
+                (cv_id, section),
+            )
+            .fetchone()
+        )
+        records = [record_type.from_dict(entry) for entry in json.loads(rows)]
+        return json.loads(entry_ids), records
+
+    def write(self, cv_id, changes):
+        """Apply a batch of ``Change``s in one transaction"""
+        if not changes:
+            return
+        connection = self._connection()
+        with connection:
+            for change in changes:
+                self._apply(connection, cv_id, change)
+            connection.execute(
+                "INSERT INTO cvs (cv_id, updated_at) VALUES (?, ?) "
+                "ON CONFLICT (cv_id) DO UPDATE SET updated_at = excluded.updated_at",
+                (cv_id, time.time()),
+            )
+
+    def _apply(self, connection, cv_id, change):
+        kind, section, entry_id, value = change
+        if kind == "entry":
+            # A new entry goes after every row saved so far, by any session
+            connection.execute(
+                "INSERT INTO cv_entries (cv_id, section, position, data, entry_id) "
+                "SELECT ?, ?, COALESCE(MAX(position), -1) + 1, ?, ? "
+                "FROM cv_entries WHERE cv_id = ? AND section = ? "
+                "ON CONFLICT (cv_id, section, entry_id) "
+                "DO UPDATE SET data = excluded.data",
+                (cv_id, section, value, entry_id, cv_id, section),
+            )
+        elif kind == "delete":
+            connection.execute(
+                "DELETE FROM cv_entries "
+                "WHERE cv_id = ? AND section = ? AND entry_id = ?",
+                (cv_id, section, entry_id),
+            )
+        elif kind == "section":
+            connection.execute(
+                "DELETE FROM cv_entries WHERE cv_id = ? AND section = ?",
+                (cv_id, section),
+            )
+            connection.executemany(
+                "INSERT INTO cv_entries (cv_id, section, position, data, entry_id) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (cv_id, section, index, data, entry_id)
+                    for index, (entry_id, data) in enumerate(value)
+                ],
+            )
+        elif kind == "part":
+            connection.execute(
+                "INSERT INTO cv_parts (cv_id, part, data) VALUES (?, ?, ?) "
+                "ON CONFLICT (cv_id, part) DO UPDATE SET data = excluded.data",
+                (cv_id, section, value),
+            )
+        elif kind == "photo":
+            if value is None:
+                connection.execute("DELETE FROM cv_photos WHERE cv_id = ?", (cv_id,))
+            else:
+                connection.execute(
+                    "INSERT OR REPLACE INTO cv_photos "
+                    "(cv_id, pdf, preview, source_id, digest) VALUES (?, ?, ?, ?, ?)",
+                    (
+                        cv_id,
+                        value["pdf"],
+                        value["preview"],
+                        value.get("source_id"),
+                        value.get("digest"),
+                    ),
+                )
+        else:
+            raise ValueError(f"Unknown change kind: {kind!r}")
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def cv_store():
+    """Process-wide store at ``store_path()``, opened on first use"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CVStore(store_path())
+        return _store
@@ -0,0 +1,228 @@
+"""
+One-pass validation of whole CVs, e.g. before an import is used.
+
+The structural rules (which keys hold objects, lists, text or whole numbers)
+are compiled once into one checker per section, so validating a CV is a
+plain loop over its entries with no per-field lookups of what to expect.
+Entries that pass are then checked against the section's content schema
+(``ENTRY_CHECKS`` in ``cv_data``, the same compiled rules the forms use).
+Every problem is collected with its JSON path, e.g.
+``$.publications[3].year: expected a whole number, got str``, instead of
+stopping at the first one.
+
+Missing keys are fine, and so are keys this version doesn't know: entries
+default missing fields to "", and ``load_cv_file`` fills in missing
+sections, personal info fields and skill categories before the data is
+used. An explicit ``null`` or a value of the wrong type is an error, since
+renderers and form validators would fail on it later.
+"""
+
+from operator import attrgetter
+
+from src.models.cv_data import (
+    ENTRY_CHECKS,
+    PERSONAL_INFO_SCHEMA,
+    SECTION_RECORDS,
+    Record,
+    compile_schema,
+    init_cv_data,
+    latest_year,
+)
+
+# Entry fields holding whole numbers (form number inputs); "" means unset.
+# Every other entry field is text.
+NUMBER_FIELDS = {
+    "education": ("start_year", "end_year"),
+    "publications": ("year",),
+}
+PHOTO_KEYS = ("pdf", "preview")
+TEXT_ONLY = {str}
+
+_MISSING = object()
+
+
+def _kind(value):
+    """JSON-ish name of a value's type for error messages"""
+    if value is None:
+        return "null"
+    if isinstance(value, (dict, Record)):
+        return "object"
+    if isinstance(value, list):
+        return "array"
+    return type(value).__name__
+
+
+def problem_count(errors):
+    """``"1 problem"`` / ``"3 problems"``"""
+    return f"{len(errors)} problem{'' if len(errors) == 1 else 's'}"
+
+
+def format_errors(errors, limit=None):
+    """Render ``(path, message)`` pairs one per line, optionally capped"""
+    shown = errors if limit is None else errors[:limit]
+    lines = [f"{path}: {message}" for path, message in shown]
+    if len(shown) < len(errors):
+        lines.append(f"... and {len(errors) - len(shown)} more")
+    return "\n".join(lines)
+
+
+def _compile_entry(section, record_type, check_content):
+    """Checker for one entry of ``section``"""
+    numbers = NUMBER_FIELDS.get(section, ())
+    texts = tuple(name for name in record_type.FIELDS if name not in numbers)
+    text_defaults = ("",) * len(texts)
+    read_texts = attrgetter(*texts)
+
+    def report(entry, index, errors):
+        """Spell out the type problems of an entry that failed the fast check"""
+        get = entry.get
+        for name in texts:
+            value = get(name, "")
+            if type(value) is not str:
+                errors.append(
+                    (
+                        f"$.{section}[{index}].{name}",
+                        f"expected text, got {_kind(value)}",
+                    )
+                )
+        for name in numbers:
+            value = get(name, "")
+            if type(value) is not int and value != "":
+                errors.append(
+                    (
+                        f"$.{section}[{index}].{name}",
+                        f"expected a whole number, got {_kind(value)}",
+                    )
+                )
+
+    def check(entry, index, latest, errors):
+        if type(entry) is record_type:
+            values = read_texts(entry)
+            get = entry.get
+        elif type(entry) is dict or isinstance(entry, Record):
+            get = entry.get
+            values = map(get, texts, text_defaults)
+        else:
+            errors.append(
+                (f"$.{section}[{index}]", f"expected an object, got {_kind(entry)}")
+            )
+            return
+        # One set of the value types instead of a type test per field
+        valid = {*map(type, values)} == TEXT_ONLY
+        for name in numbers:
+            value = get(name, "")
+            if type(value) is not int and value != "":
+                valid = False
+        if not valid:
+            report(entry, index, errors)
+            return
+        reported = len(errors)
+        check_content(entry, latest, errors)
+        for position in range(reported, len(errors)):
+            name, message = errors[position]
+            errors[position] = (f"$.{section}[{index}].{name}", message)
+
+    return check
+
+
+def _check_personal_info(personal_info, fields, check_content, latest, errors):
+    if type(personal_info) is not dict:
+        errors.append(
+            ("$.personal_info", f"expected an object, got {_kind(personal_info)}")
+        )
+        return
+    reported = len(errors)
+    for name in fields:
+        value = personal_info.get(name, "")
+        if type(value) is not str:
+            errors.append(
+                (f"$.personal_info.{name}", f"expected text, got {_kind(value)}")
+            )
+    if len(errors) == reported:
+        check_content(personal_info, latest, errors)
+        for position in range(reported, len(errors)):
+            name, message = errors[position]
+            errors[position] = (f"$.personal_info.{name}", message)
+
+
+def _check_skills(skills, errors):
+    if type(skills) is not dict:
+        errors.append(("$.skills", f"expected an object, got {_kind(skills)}"))
+        return
+    for category, values in skills.items():
+        if type(values) is not list:
+            errors.append(
+                (f"$.skills.{category}", f"expected an array, got {_kind(values)}")
+            )
+            continue
+        for index, value in enumerate(values):
+            if type(value) is not str:
+                errors.append(
+                    (
+                        f"$.skills.{category}[{index}]",
+                        f"expected text, got {_kind(value)}",
+                    )
+                )
+
+
+def _check_photo(photo, errors):
+    if photo is None:
+        return
+    if type(photo) is not dict:
+        errors.append(("$.photo", f"expected an object or null, got {_kind(photo)}"))
+        return
+    for key in PHOTO_KEYS:
+        value = photo.get(key, _MISSING)
+        if value is _MISSING:
+            errors.append((f"$.photo.{key}", "missing"))
+        elif not isinstance(value, (bytes, bytearray)):
+            errors.append((f"$.photo.{key}", f"expected bytes, got {_kind(value)}"))
+
+
+def compile_cv_validator():
+    """Compile the CV rules into one ``validate(cv_data) -> errors`` function"""
+    personal_fields = tuple(init_cv_data()["personal_info"])
+    # Saved drafts may not have a name or email yet; only check what's given
+    check_personal_info = compile_schema(PERSONAL_INFO_SCHEMA._replace(required=()))
+    sections = tuple(
+        (
+            section,
+            _compile_entry(section, record_type, ENTRY_CHECKS[section]),
+        )
+        for section, record_type in SECTION_RECORDS.items()
+    )
+
+    def validate(cv_data):
+        errors = []
+        if type(cv_data) is not dict:
+            errors.append(("$", f"expected an object, got {_kind(cv_data)}"))
+            return errors
+        latest = latest_year()
+        get = cv_data.get
+        _check_personal_info(
+            get("personal_info", {}),
+            personal_fields,
+            check_personal_info,
+            latest,
+            errors,
+        )
+        _check_skills(get("skills", {}), errors)
+        _check_photo(get("photo"), errors)
+        for section, check_entry in sections:
+            entries = get(section, _MISSING)
+            if entries is _MISSING:
+                continue
+            if type(entries) is not list:
+                errors.append(
+                    (f"$.{section}", f"expected an array, got {_kind(entries)}")
+                )
+                continue
+            for index, entry in enumerate(entries):
+                check_entry(entry, index, latest, errors)
+        return errors
+
+    return validate
+
+
+validate_cv = compile_cv_validator()
+validate_cv.__doc__ = "Every problem in ``cv_data`` as (path, message) pairs"
@@ -0,0 +1,175 @@
+"""
+Normalized CV document shared by every export format.
+
+``build_document`` turns ``cv_data`` into a ``Document`` once: it decides
+which sections and lines a CV has and formats dates, details and labels,
+so the PDF, DOCX and plain-text writers only serialize it. Documents are
+memoized on a digest of the CV, so exporting several formats of one CV
+costs one normalization pass.
+
+Documents are plain tuples of strings, so they are immutable, safe to share
+between threads and can be hashed with ``canonical_digest``. The photo is
+not part of a document; the PDF renderer takes it from ``cv_data``.
+"""
+
+from collections import namedtuple
+
+from src.utils.render_cache import LRUCache, canonical_digest
+
+# Whole CV: personal header, then sections in story order
+Document = namedtuple("Document", "header sections")
+# ``contacts`` holds (label, value) pairs in display order
+Header = namedtuple("Header", "name title contacts summary")
+# ``entries`` holds ``Entry`` records, or ``SkillGroup`` ones for skills
+Section = namedtuple("Section", "key title entries")
+# One education, job, project... Parts are listed in display order: title
+# and subtitle, detail lines, (label, value) fields, free-text description
+# and (label, value) links
+Entry = namedtuple("Entry", "title subtitle details fields description links")
+SkillGroup = namedtuple("SkillGroup", "name skills")
+
+CONTACT_FIELDS = (
+    ("email", "Email"),
+    ("phone", "Phone"),
+    ("location", "Location"),
+    ("linkedin", "LinkedIn"),
+    ("github", "GitHub"),
+    ("orcid", "ORCID"),
+)
+
+# Documents keyed by the digest of the CV without its photo
+document_cache = LRUCache(max_entries=64)
+
+
+def _field(label, value):
+    return ((label, str(value)),) if value else ()
+
+
+def _skill_groups(skills_data):
+    return tuple(
+        SkillGroup(category.replace("_", " ").title(), tuple(map(str, skills)))
+        for category, skills in skills_data.items()
+        if skills
+    )
+
+
+def _education_entry(edu):
+    return Entry(
+        edu["degree"],
+        edu["institution"],
+        (f"{edu['start_year']} - {edu['end_year']} | {edu['location']}",),
+        _field("Thesis", edu["thesis_title"])
+        + _field("Advisor", edu["advisor"])
+        + _field("GPA", edu["gpa"]),
+        edu["description"],
+        (),
+    )
+
+
+def _experience_entry(exp):
+    return Entry(
+        exp["job_title"],
+        exp["company"],
+        (
+            f"{exp['start_date']} - {exp['end_date']} | {exp['location']} "
+            f"| {exp['job_type']}",
+        ),
+        (),
+        exp["description"],
+        (),
+    )
+
+
+def _project_entry(project):
+    details = f"{project['start_date']} - {project['end_date']}"
+    if project["technologies"]:
+        details += f" | Technologies: {project['technologies']}"
+    return Entry(
+        project["name"],
+        project["type"],
+        (details,),
+        (),
+        project["description"],
+        _field("Repository", project["github_link"]),
+    )
+
+
+def _publication_entry(pub):
+    details = f"{pub['authors']} ({pub['year']}). {pub['journal']}"
+    if pub["volume"] and pub["pages"]:
+        details += f", Vol. {pub['volume']}, pp. {pub['pages']}"
+    return Entry(pub["title"], "", (details,), (), "", _field("DOI", pub["doi"]))
+
+
+def _certification_entry(cert):
+    return Entry(
+        cert["name"],
+        cert["issuing_org"],
+        (f"Issued: {cert['issue_date']} | Expires: {cert['expiry_date']}",),
+        (),
+        "",
+        (),
+    )
+
+
+def _award_entry(award):
+    return Entry(
+        award["name"],
+        award["awarding_org"],
+        (f"Date: {award['date']}",),
+        (),
+        award["description"],
+        (),
+    )
+
+
+# Sections in story order: (cv_data key, title, entry builder)
+DOCUMENT_SECTIONS = (
+    ("education", "EDUCATION", _education_entry),
+    ("experience", "WORK EXPERIENCE", _experience_entry),
+    ("projects", "PROJECTS", _project_entry),
+    ("publications", "PUBLICATIONS", _publication_entry),
+    ("certifications", "CERTIFICATIONS", _certification_entry),
+    ("awards", "AWARDS & HONORS", _award_entry),
+)
+SKILLS_TITLE = "TECHNICAL SKILLS"
+
+
+def _build_document(cv_data):
+    personal = cv_data["personal_info"]
+    header = Header(
+        personal["full_name"],
+        personal["title"],
+        tuple((label, personal[key]) for key, label in CONTACT_FIELDS if personal[key]),
+        personal["summary"],
+    )
+    sections = []
+    skills = _skill_groups(cv_data["skills"])
+    if skills:
+        sections.append(Section("skills", SKILLS_TITLE, skills))
+    for key, title, build_entry in DOCUMENT_SECTIONS:
+        if cv_data[key]:
+            entries = tuple(build_entry(entry) for entry in cv_data[key])
+            sections.append(Section(key, title, entries))
+    return Document(header, tuple(sections))
+
+
+def document_digest(cv_data):
+    """Digest of everything a CV's document depends on (not its photo)"""
+    return canonical_digest(
+        {key: value for key, value in cv_data.items() if key != "photo"}
+    )
+
+
+def build_document(cv_data):
+    """Normalize a CV into a ``Document``, memoized per CV digest
+
+    Raises ``KeyError``/``TypeError`` for CV data missing fields, like the
+    renderers always have.
+    """
+    key = document_digest(cv_data)
+    document = document_cache.get(key)
+    if document is None:
+        document = _build_document(cv_data)
+        document_cache.put(key, document)
+    return document
@@ -0,0 +1,189 @@
+"""
+DOCX export of a CV document.
+
+Writes a minimal WordprocessingML package with the standard library, so no
+Word library is needed. The name, title and section headings use Word's
+built-in Title, Subtitle and Heading 1 styles in the template's colors,
+which keeps the file editable and lets applicant tracking systems find the
+sections. Archive timestamps are fixed, so a CV always produces the same
+bytes.
+"""
+
+import io
+import re
+import zipfile
+from xml.sax.saxutils import escape
+
+from src.utils.pdf_generator import PAGE_MARGIN, PAGE_SIZES
+from src.utils.template_styles import DEFAULT_TEMPLATE, get_template_colors
+
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Characters XML 1.0 can't hold; user text occasionally has them pasted in
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+_ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+# Space after the last paragraph of an entry, in twentieths of a point
+_ENTRY_SPACING = 160
+
+_W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_OFFICE_RELS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+
+_CONTENT_TYPES = (
+    _XML_DECLARATION
+    + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '<Override PartName="/word/styles.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+    "</Types>"
+)
+_PACKAGE_RELS = (
+    _XML_DECLARATION + f'<Relationships xmlns="{_RELS}">'
+    f'<Relationship Id="rId1" Type="{_OFFICE_RELS}/officeDocument" '
+    'Target="word/document.xml"/></Relationships>'
+)
+_DOCUMENT_RELS = (
+    _XML_DECLARATION + f'<Relationships xmlns="{_RELS}">'
+    f'<Relationship Id="rId1" Type="{_OFFICE_RELS}/styles" '
+    'Target="styles.xml"/></Relationships>'
+)
+
+
+def _heading_style(style_id, name, size, color, bold=True, before=0, outline=None):
+    """A paragraph style for the name, title or a section heading"""
+    outline = f'<w:outlineLvl w:val="{outline}"/>' if outline is not None else ""
+    return (
+        f'<w:style w:type="paragraph" w:styleId="{style_id}">'
+        f'<w:name w:val="{name}"/><w:basedOn w:val="Normal"/>'
+        '<w:next w:val="Normal"/><w:qFormat/>'
+        f'<w:pPr><w:keepNext/><w:spacing w:before="{before}" w:after="80"/>'
+        f"{outline}</w:pPr>"
+        f'<w:rPr>{"<w:b/>" if bold else ""}'
+        f'<w:color w:val="{color.lstrip("#").upper()}"/>'
+        f'<w:sz w:val="{size * 2}"/></w:rPr></w:style>'
+    )
+
+
+def _styles_xml(template):
+    """Default body text plus the heading styles, in the template's colors"""
+    colors = get_template_colors(template)
+    return (
+        _XML_DECLARATION + f'<w:styles xmlns:w="{_W}">'
+        "<w:docDefaults><w:rPrDefault><w:rPr>"
+        '<w:rFonts w:ascii="Arial" w:hAnsi="Arial" w:eastAsia="Arial" '
+        'w:cs="Arial"/><w:sz w:val="20"/></w:rPr></w:rPrDefault>'
+        '<w:pPrDefault><w:pPr><w:spacing w:after="40"/></w:pPr></w:pPrDefault>'
+        "</w:docDefaults>"
+        '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+        '<w:name w:val="Normal"/><w:qFormat/></w:style>'
+        + _heading_style("Title", "Title", 24, colors["title"])
+        + _heading_style("Subtitle", "Subtitle", 14, colors["subtitle"], bold=False)
+        + _heading_style(
+            "Heading1", "heading 1", 14, colors["section"], before=240, outline=0
+        )
+        + "</w:styles>"
+    )
+
+
+def _run(text, bold=False, italic=False):
+    text = _XML_INVALID.sub("", str(text))
+    props = ("<w:b/>" if bold else "") + ("<w:i/>" if italic else "")
+    props = f"<w:rPr>{props}</w:rPr>" if props else ""
+    return f'<w:r>{props}<w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+
+
+def _paragraph(runs, style=None, space_after=None):
+    props = f'<w:pStyle w:val="{style}"/>' if style else ""
+    if space_after is not None:
+        props += f'<w:spacing w:after="{space_after}"/>'
+    props = f"<w:pPr>{props}</w:pPr>" if props else ""
+    return f"<w:p>{props}{''.join(runs)}</w:p>"
+
+
+def _free_text(text):
+    """Runs for each non-blank line of free text"""
+    lines = str(text).replace("\r\n", "\n").split("\n")
+    return [[_run(line)] for line in lines if line.strip()]
+
+
+def _entry_lines(entry):
+    """Runs for each paragraph of an ``Entry``"""
+    title = [_run(entry.title, bold=True)]
+    if entry.subtitle:
+        title.append(_run(f" - {entry.subtitle}"))
+    lines = [title, *([_run(line)] for line in entry.details)]
+    lines += [
+        [_run(f"{label}: ", italic=True), _run(value)] for label, value in entry.fields
+    ]
+    if entry.description:
+        lines += _free_text(entry.description)
+    lines += [[_run(f"{label}: {value}")] for label, value in entry.links]
+    return lines
+
+
+def _section_paragraphs(section):
+    paragraphs = [_paragraph([_run(section.title)], style="Heading1")]
+    if section.key == "skills":
+        for group in section.entries:
+            runs = [_run(f"{group.name}: ", bold=True), _run(", ".join(group.skills))]
+            paragraphs.append(_paragraph(runs))
+        return paragraphs
+    for entry in section.entries:
+        lines = _entry_lines(entry)
+        paragraphs += [_paragraph(runs) for runs in lines[:-1]]
+        paragraphs.append(_paragraph(lines[-1], space_after=_ENTRY_SPACING))
+    return paragraphs
+
+
+def _document_xml(document, page_format):
+    header = document.header
+    paragraphs = []
+    if header.name:
+        paragraphs.append(_paragraph([_run(header.name)], style="Title"))
+    if header.title:
+        paragraphs.append(_paragraph([_run(header.title)], style="Subtitle"))
+    paragraphs += [
+        _paragraph([_run(f"{label}: ", bold=True), _run(value)])
+        for label, value in header.contacts
+    ]
+    if header.summary:
+        paragraphs.append(_paragraph([_run("PROFESSIONAL SUMMARY")], style="Heading1"))
+        paragraphs += [_paragraph(runs) for runs in _free_text(header.summary)]
+    for section in document.sections:
+        paragraphs += _section_paragraphs(section)
+
+    width, height = PAGE_SIZES[page_format]
+    margin = round(PAGE_MARGIN * 20)
+    section_properties = (
+        f'<w:sectPr><w:pgSz w:w="{round(width * 20)}" w:h="{round(height * 20)}"/>'
+        f'<w:pgMar w:top="{margin}" w:right="{margin}" w:bottom="{margin}" '
+        f'w:left="{margin}" w:header="708" w:footer="708" w:gutter="0"/>'
+        "</w:sectPr>"
+    )
+    return (
+        _XML_DECLARATION + f'<w:document xmlns:w="{_W}"><w:body>'
+        f"{''.join(paragraphs)}{section_properties}</w:body></w:document>"
+    )
+
+
+def render_docx(document, template=DEFAULT_TEMPLATE, page_format="A4"):
+    """Serialize a ``Document`` as DOCX bytes"""
+    parts = (
+        ("[Content_Types].xml", _CONTENT_TYPES),
+        ("_rels/.rels", _PACKAGE_RELS),
+        ("word/_rels/document.xml.rels", _DOCUMENT_RELS),
+        ("word/document.xml", _document_xml(document, page_format)),
+        ("word/styles.xml", _styles_xml(template)),
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, xml in parts:
+            info = zipfile.ZipInfo(name, date_time=_ZIP_DATE)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, xml.encode("utf-8"))
+    return buffer.getvalue()
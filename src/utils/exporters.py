@@ -0,0 +1,88 @@
+"""
+Export formats for a CV, all serialized from the shared document model.
+
+Each entry of ``EXPORT_FORMATS`` is a backend taking ``(cv_data, template,
+page_format)`` and returning the file's bytes. The DOCX and plain-text
+backends serialize the memoized ``build_document`` result, and the PDF
+backend builds its story from the same document, so exporting one CV in
+several formats normalizes it once. DOCX and text exports are cheap but
+still memoized, so download buttons can offer them on every rerun.
+"""
+
+from collections import namedtuple
+
+from src.utils.document_ir import build_document, document_digest
+from src.utils.docx_export import DOCX_MIME, render_docx
+from src.utils.pdf_generator import (
+    DEFAULT_LAYOUT,
+    CVDataError,
+    RenderOptionError,
+    check_render_options,
+    generate_pdf_cv,
+)
+from src.utils.render_cache import LRUCache
+from src.utils.template_styles import DEFAULT_TEMPLATE
+from src.utils.text_export import render_text
+
+ExportFormat = namedtuple("ExportFormat", "label extension mime render")
+
+# Serialized DOCX and text exports keyed by (CV digest, format, options)
+export_cache = LRUCache(max_entries=64)
+
+
+def _pdf(cv_data, template, page_format):
+    return generate_pdf_cv(cv_data, template=template, page_format=page_format)
+
+
+def _docx(cv_data, template, page_format):
+    return render_docx(build_document(cv_data), template, page_format)
+
+
+def _text(cv_data, template, page_format):
+    return render_text(build_document(cv_data)).encode("utf-8")
+
+
+EXPORT_FORMATS = {
+    "pdf": ExportFormat("PDF", "pdf", "application/pdf", _pdf),
+    "docx": ExportFormat("Word (DOCX)", "docx", DOCX_MIME, _docx),
+    "txt": ExportFormat("Plain text (ATS)", "txt", "text/plain", _text),
+}
+
+
+def export_cv(
+    cv_data, export_format="pdf", template=DEFAULT_TEMPLATE, page_format="A4"
+):
+    """Export the CV in one of ``EXPORT_FORMATS`` and return the file's bytes
+
+    Raises ``RenderError`` (or a subclass) when the CV can't be exported.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise RenderOptionError(
+            f"Unsupported export format {export_format!r}; "
+            f"expected one of {', '.join(EXPORT_FORMATS)}"
+        )
+    check_render_options(page_format, DEFAULT_LAYOUT)
+    render = EXPORT_FORMATS[export_format].render
+    if export_format == "pdf":
+        # PDFs have their own render cache
+        return render(cv_data, template, page_format)
+
+    try:
+        key = (document_digest(cv_data), export_format, template, page_format)
+        data = export_cache.get(key)
+        if data is None:
+            data = render(cv_data, template, page_format)
+            export_cache.put(key, data)
+    except (KeyError, TypeError, AttributeError) as e:
+        raise CVDataError(f"Invalid CV data: {type(e).__name__}: {e}") from e
+    return data
+
+
+def export_filename(full_name, template, export_format):
+    """Download file name for a CV exported in a format"""
+    name = f"{full_name.replace(' ', '_')}_CV" if full_name else "CV"
+    extension = EXPORT_FORMATS[export_format].extension
+    if export_format == "txt":
+        # Plain text looks the same in every template
+        return f"{name}.{extension}"
+    return f"{name}_{template.replace(' ', '_')}.{extension}"
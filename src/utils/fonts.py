@@ -0,0 +1,213 @@
+"""
+Process-wide font registry with per-glyph fallback.
+
+Template text is set in a standard PDF font family (``BASE_FONT_FAMILY``),
+which only has glyphs for the Windows-1252 character set. Characters outside
+it are split into their own paragraph fragments set in the first fallback
+TrueType family that has them, in the same weight and slant, so a Polish,
+Greek or Chinese name renders in a real font while the rest of the line
+keeps the template's font.
+
+Fallback families are found by file name in ``font_dirs()`` and registered
+once per process, the first time a character needs them. ReportLab embeds
+only the glyphs a document uses; the subset font programs are cached per
+character set in ``font_subset_cache``, so repeated renders of the same
+names don't rebuild them.
+"""
+
+import functools
+import logging
+import os
+import re
+import threading
+from itertools import groupby
+from operator import itemgetter
+
+from reportlab.lib.fonts import ps2tt, tt2ps
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFError, TTFont
+
+from src.utils.render_cache import font_subset_cache
+
+logger = logging.getLogger(__name__)
+
+FONT_DIRS_ENV = "CV_FONT_DIRS"
+# Bundled fonts directory at the repository root, then the system fonts
+BUNDLED_FONT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "fonts",
+)
+SYSTEM_FONT_DIR = "/usr/share/fonts"
+
+# Standard PDF font family used by every template style and the contact table
+BASE_FONT_FAMILY = "Helvetica"
+# Characters the standard fonts can draw (their WinAnsi encoding)
+BASE_FONT_ENCODING = "cp1252"
+
+# Fallback families in lookup order, with font files for normal, bold,
+# italic and bold italic; a missing variant falls back to the regular file
+FALLBACK_FAMILIES = (
+    (
+        "DejaVuSans",
+        (
+            "DejaVuSans.ttf",
+            "DejaVuSans-Bold.ttf",
+            "DejaVuSans-Oblique.ttf",
+            "DejaVuSans-BoldOblique.ttf",
+        ),
+    ),
+    ("DroidSansFallback", ("DroidSansFallbackFull.ttf",)),
+)
+_VARIANTS = ("", "-Bold", "-Italic", "-BoldItalic")
+_WORDS = re.compile(r"\s+|\S+")
+
+_fallback_fonts = None
+_register_lock = threading.Lock()
+
+
+def base_font(bold=False, italic=False):
+    """Font name for a variant of the base family"""
+    return tt2ps(BASE_FONT_FAMILY, int(bold), int(italic))
+
+
+def font_dirs():
+    """Directories searched for fallback font files, in priority order"""
+    extra = os.environ.get(FONT_DIRS_ENV, "")
+    return [BUNDLED_FONT_DIR, *filter(None, extra.split(os.pathsep)), SYSTEM_FONT_DIR]
+
+
+def _font_files():
+    """Map font file names to paths, the first directory winning"""
+    files = {}
+    for directory in font_dirs():
+        for root, _, names in os.walk(directory):
+            for name in names:
+                files.setdefault(name, os.path.join(root, name))
+    return files
+
+
+def _cache_subsets(font):
+    """Serve a font's subset programs from ``font_subset_cache``"""
+    face = font.face
+    make_subset = face.makeSubset
+
+    def cached_subset(subset):
+        key = (face.filename, tuple(subset))
+        data = font_subset_cache.get(key)
+        if data is None:
+            data = make_subset(subset)
+            font_subset_cache.put(key, data)
+        return data
+
+    face.makeSubset = cached_subset
+
+
+def _register_family(family, filenames, files):
+    """Register a family's available variants; return its regular font"""
+    paths = [files.get(name) for name in filenames]
+    if not paths[0]:
+        return None
+    paths += [None] * (len(_VARIANTS) - len(paths))
+    names = []
+    for suffix, path in zip(_VARIANTS, paths):
+        if not path:
+            names.append(names[0])
+            continue
+        font = TTFont(family + suffix, path)
+        _cache_subsets(font)
+        pdfmetrics.registerFont(font)
+        names.append(font.fontName)
+    pdfmetrics.registerFontFamily(
+        family, normal=names[0], bold=names[1], italic=names[2], boldItalic=names[3]
+    )
+    return pdfmetrics.getFont(names[0])
+
+
+def register_fonts():
+    """Register the available fallback families once; return their names"""
+    global _fallback_fonts
+    with _register_lock:
+        if _fallback_fonts is None:
+            files = _font_files()
+            fonts = {}
+            for family, filenames in FALLBACK_FAMILIES:
+                try:
+                    font = _register_family(family, filenames, files)
+                except (TTFError, OSError) as e:
+                    logger.warning("Skipping font family %s: %s", family, e)
+                    continue
+                if font is not None:
+                    fonts[family] = font
+            _fallback_fonts = fonts
+    return list(_fallback_fonts)
+
+
+def _has_glyph(family, char):
+    """Check whether a registered fallback family can draw ``char``"""
+    return bool(_fallback_fonts[family].face.charToGlyph.get(ord(char)))
+
+
+@functools.lru_cache(maxsize=4096)
+def glyph_family(char):
+    """Fallback family to draw ``char`` in, or None for the base font
+
+    Characters no family covers stay in the base font.
+    """
+    try:
+        char.encode(BASE_FONT_ENCODING)
+        return None
+    except UnicodeEncodeError:
+        pass
+    for family in register_fonts():
+        if _has_glyph(family, char):
+            return family
+    return None
+
+
+def needs_font_fallback(text):
+    """Check whether ``text`` has characters the base font can't draw"""
+    try:
+        text.encode(BASE_FONT_ENCODING)
+        return False
+    except UnicodeEncodeError:
+        return any(glyph_family(char) for char in text)
+
+
+def apply_font_fallback(frags):
+    """Split paragraph fragments so characters the base font lacks use a fallback
+
+    Each fallback run keeps its fragment's weight and slant. Returns
+    ``frags`` itself when no fragment needs a fallback.
+    """
+    if not any(needs_font_fallback(getattr(frag, "text", "")) for frag in frags):
+        return frags
+    result = []
+    for frag in frags:
+        text = getattr(frag, "text", "")
+        if not needs_font_fallback(text):
+            result.append(frag)
+            continue
+        _, bold, italic = ps2tt(frag.fontName)
+        for family, runs in groupby(_fallback_runs(text), key=itemgetter(0)):
+            part = frag.clone(text="".join(run for _, run in runs))
+            if family is not None:
+                part.fontName = tt2ps(family, bold, italic)
+            result.append(part)
+    return result
+
+
+def _fallback_runs(text):
+    """Yield ``(family, text)`` runs, None being the base font
+
+    A word is set entirely in its fallback family when that family has all
+    of its glyphs, so a name doesn't switch typeface mid-word.
+    """
+    for word in _WORDS.findall(text):
+        families = {glyph_family(char) for char in word} - {None}
+        if len(families) == 1:
+            family = families.pop()
+            if all(_has_glyph(family, char) for char in word):
+                yield family, word
+                continue
+        for family, chars in groupby(word, key=glyph_family):
+            yield family, "".join(chars)
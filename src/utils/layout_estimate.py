@@ -0,0 +1,158 @@
+"""
+Page-count and section-span estimation without building a PDF.
+
+Flows the same story ``generate_pdf_cv`` builds through a simulated frame of
+the document's size, calling only ``wrap`` and ``split`` on the flowables.
+Nothing is drawn or serialized, and line breaks are shared with the story
+cache, so an estimate for an edited CV costs a fraction of a render.
+"""
+
+from collections import deque
+
+from reportlab import rl_config
+
+from src.utils.pdf_generator import (
+    DEFAULT_LAYOUT,
+    PAGE_MARGIN,
+    PAGE_SIZES,
+    CVDataError,
+    DocumentLayoutError,
+    check_render_options,
+    create_pdf_styles,
+    story_sections,
+)
+from src.utils.render_cache import LRUCache, canonical_digest
+from src.utils.template_styles import DEFAULT_TEMPLATE, template_style_digest
+
+# Matches the default padding of the frame SimpleDocTemplate lays pages into
+FRAME_PADDING = 6
+# Same tolerance ReportLab's Frame uses when deciding whether a flowable fits
+_FUZZ = 1e-6
+
+# Estimates keyed by (CV, template styles, page format, layout)
+layout_estimate_cache = LRUCache(max_entries=256)
+
+
+class LayoutEstimate:
+    """Page count of a CV and the pages each section occupies
+
+    ``section_pages`` maps ``"personal_info"`` and each document section key
+    to its ``(first_page, last_page)``, 1-based.
+    """
+
+    __slots__ = ("page_count", "section_pages")
+
+    def __init__(self, page_count, section_pages):
+        self.page_count = page_count
+        self.section_pages = section_pages
+
+    def fits(self, max_pages):
+        """Check whether the CV fits in ``max_pages`` pages"""
+        return self.page_count <= max_pages
+
+    def __repr__(self):
+        return (
+            f"LayoutEstimate(page_count={self.page_count}, "
+            f"section_pages={self.section_pages!r})"
+        )
+
+
+def frame_size(page_format):
+    """Width and height available to flowables on a page"""
+    width, height = PAGE_SIZES[page_format]
+    padding = 2 * (PAGE_MARGIN + FRAME_PADDING)
+    return width - padding, height - padding
+
+
+def flow_pages(sections, avail_width, avail_height):
+    """Flow ``(section, flowables)`` pairs onto pages like a ReportLab frame
+
+    Returns ``(page_count, section_pages)``. Raises ``DocumentLayoutError``
+    for a flowable that doesn't fit even on an empty page, as a real build
+    would.
+    """
+    pending = deque(
+        (section, flowable) for section, flowables in sections for flowable in flowables
+    )
+    section_pages = {}
+    page = 1
+    remaining = avail_height
+    at_top = True
+    # Frames overlap a flowable's spaceBefore with the previous spaceAfter
+    overlap = rl_config.overlapAttachedSpace
+    previous_after = 0
+
+    def place(section, flowable, height, space):
+        nonlocal remaining, at_top, previous_after
+        after = flowable.getSpaceAfter()
+        used = space + height + after
+        remaining -= used
+        previous_after = after
+        if used:
+            at_top = False
+        first, _ = section_pages.get(section, (page, page))
+        section_pages[section] = (first, page)
+
+    while pending:
+        section, flowable = pending.popleft()
+        space = 0
+        if not at_top:
+            space = flowable.getSpaceBefore()
+            if overlap:
+                space = max(space - previous_after, 0)
+        room = remaining - space
+        if room > 0:
+            height = flowable.wrap(avail_width, room)[1]
+            if room - height >= -_FUZZ:
+                place(section, flowable, height, space)
+                continue
+            parts = flowable.split(avail_width, room)
+            if parts:
+                first = parts[0]
+                height = first.wrap(avail_width, room)[1]
+                place(section, first, height, space)
+                pending.extendleft((section, part) for part in reversed(parts[1:]))
+                continue
+        if at_top:
+            raise DocumentLayoutError(
+                f"{type(flowable).__name__} in {section} is too large for the page"
+            )
+        pending.appendleft((section, flowable))
+        page += 1
+        remaining = avail_height
+        at_top = True
+        previous_after = 0
+
+    return page, section_pages
+
+
+def estimate_layout(
+    cv_data, template=DEFAULT_TEMPLATE, page_format="A4", layout=DEFAULT_LAYOUT
+):
+    """Estimate the page count and per-section page spans of a CV
+
+    Uses the story cache and memoizes results, so it is cheap enough to run
+    after every edit. Raises ``RenderError`` subclasses like ``render_pdf``.
+    """
+    check_render_options(page_format, layout)
+    key = canonical_digest(
+        cv_data, template, template_style_digest(template), page_format, layout
+    )
+    estimate = layout_estimate_cache.get(key)
+    if estimate is not None:
+        return estimate
+
+    styles = create_pdf_styles(template)
+    sections = story_sections(
+        cv_data,
+        styles,
+        style_key=template_style_digest(template),
+        layout=layout,
+    )
+    try:
+        page_count, section_pages = flow_pages(sections, *frame_size(page_format))
+    except (KeyError, TypeError, AttributeError) as e:
+        raise CVDataError(f"Invalid CV data: {type(e).__name__}: {e}") from e
+    estimate = LayoutEstimate(page_count, section_pages)
+    layout_estimate_cache.put(key, estimate)
+    return estimate
@@ -1,17 +1,24 @@
 """
 PDF generation utilities for CV export with multiple templates.
+
+This module has no UI dependencies so batch jobs and worker processes can
+import it cheaply. Failures are raised as ``RenderError`` subclasses; the
+Streamlit sections catch them and report them to the user.
 """
 
-from io import BytesIO
+import copy
+import threading
+import time
+import zipfile
+from html import escape
+from tempfile import SpooledTemporaryFile
 
-import streamlit as st
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.enums import TA_LEFT, TA_RIGHT
 from reportlab.lib.pagesizes import A4, letter
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.pdfgen import canvas
 from reportlab.platypus import (
+    Flowable,
     KeepTogether,
     Paragraph,
     SimpleDocTemplate,
@@ -19,123 +26,194 @@ from reportlab.platypus import (
     Table,
     TableStyle,
 )
+from reportlab.platypus.doctemplate import LayoutError
+
+from src.utils.document_ir import build_document
+from src.utils.fonts import apply_font_fallback, base_font, needs_font_fallback
+from src.utils.photo import PHOTO_PDF_INCHES, photo_for_profile, photo_image_reader
+from src.utils.render_cache import (
+    canonical_digest,
+    paragraph_parse_cache,
+    pdf_render_cache,
+    section_flowable_cache,
+)
+from src.utils.render_profiles import DEFAULT_PROFILE, get_render_profile
+from src.utils.template_styles import (
+    TEMPLATE_COLORS,
+    get_template_styles,
+    style_fingerprint,
+    styles_digest,
+    template_style_digest,
+)
+
+# Layout modes: "standard" keeps one flowable per line of every entry,
+# "large" uses compact, lazily built entries for long sections and "auto"
+# switches to it once a section has more than LARGE_SECTION_ENTRIES entries
+LAYOUT_MODES = ("auto", "standard", "large")
+DEFAULT_LAYOUT = "auto"
+LARGE_SECTION_ENTRIES = 150
+# Free text longer than this is split into several paragraphs
+TEXT_CHUNK_CHARS = 2000
+
+PAGE_SIZES = {"A4": A4, "Letter": letter}
+PAGE_MARGIN = 0.75 * inch
+# Contact values that need fallback glyphs; matches the table's plain text
+CONTACT_VALUE_STYLE = ParagraphStyle("ContactValue", fontName=base_font(), fontSize=9)
+
+
+class RenderError(Exception):
+    """Base class for errors raised while rendering a CV"""
+
+
+class RenderOptionError(RenderError, ValueError):
+    """An unsupported page format or layout mode was requested"""
+
+
+class CVDataError(RenderError):
+    """The CV data is missing fields or holds values that can't be rendered"""
+
+
+class DocumentLayoutError(RenderError):
+    """Content could not be placed on the page, e.g. an oversized table cell"""
+
+
+class RenderResult:
+    """Outcome of ``render_pdf``
+
+    ``pdf`` holds whatever the requested output produced (``bytes``, a
+    spooled file or the caller's sink). ``timings`` maps each phase
+    (``styles``, ``story``, ``layout``) to seconds; phases skipped on a cache
+    hit stay at zero. ``cache_status`` is ``"hit"``, ``"miss"`` or
+    ``"bypass"`` when caching was disabled.
+    """
+
+    __slots__ = ("pdf", "page_count", "cache_status", "timings")
+
+    def __init__(self, pdf, page_count, cache_status, timings):
+        self.pdf = pdf
+        self.page_count = page_count
+        self.cache_status = cache_status
+        self.timings = timings
+
+    def __repr__(self):
+        return (
+            f"RenderResult(page_count={self.page_count}, "
+            f"cache_status={self.cache_status!r}, timings={self.timings!r})"
+        )
 
+    @property
+    def total_seconds(self):
+        return sum(self.timings.values())
 
-def get_template_colors(template):
-    """Get color scheme for different PDF templates"""
-    template_colors = {
-        "Professional Blue": {
-            "title": "#1e3a8a",
-            "subtitle": "#1e40af",
-            "section": "#1e40af",
-            "border": "#3b82f6",
-        },
-        "Academic Classic": {
-            "title": "#0f172a",
-            "subtitle": "#374151",
-            "section": "#374151",
-            "border": "#6b7280",
-        },
-        "Modern Minimal": {
-            "title": "#111827",
-            "subtitle": "#4b5563",
-            "section": "#6b7280",
-            "border": "#d1d5db",
-        },
-        "Scientific Research": {
-            "title": "#065f46",
-            "subtitle": "#047857",
-            "section": "#059669",
-            "border": "#10b981",
-        },
-    }
-    return template_colors.get(template, template_colors["Professional Blue"])
+
+def _text(value):
+    """Escape user-entered text for use in Paragraph markup"""
+    return escape(str(value), quote=False)
+
+
+def _contact_cell(value):
+    """Contact table text, as a Paragraph when it needs fallback glyphs"""
+    if not needs_font_fallback(value):
+        return value
+    return SharedLayoutParagraph(_text(value), CONTACT_VALUE_STYLE)
 
 
 def create_pdf_styles(template):
-    """Create PDF styles based on template"""
-    colors_scheme = get_template_colors(template)
-    styles = getSampleStyleSheet()
-
-    # Title style
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24 if template != "Modern Minimal" else 22,
-        spaceAfter=6,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor(colors_scheme["title"]),
-    )
+    """Get the shared PDF styles for a template from the style registry"""
+    return get_template_styles(template)
 
-    # Subtitle style
-    subtitle_style = ParagraphStyle(
-        "CustomSubtitle",
-        parent=styles["Heading2"],
-        fontSize=14,
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor(colors_scheme["subtitle"]),
-    )
 
-    # Section header style
-    section_style = ParagraphStyle(
-        "SectionHeader",
-        parent=styles["Heading2"],
-        fontSize=14 if template != "Modern Minimal" else 12,
-        spaceBefore=12,
-        spaceAfter=6,
-        textColor=colors.HexColor(colors_scheme["section"]),
-        borderWidth=1 if template != "Modern Minimal" else 0,
-        borderColor=(
-            colors.HexColor(colors_scheme["border"])
-            if template != "Modern Minimal"
-            else None
-        ),
-        borderPadding=3 if template != "Modern Minimal" else 0,
-    )
+class PhotoFlowable(Flowable):
+    """Draw a profile photo from a shared, cached ImageReader"""
 
-    # Body text style
-    body_style = ParagraphStyle(
-        "CustomBody",
-        parent=styles["Normal"],
-        fontSize=10,
-        spaceBefore=3,
-        spaceAfter=3,
-        leftIndent=0,
-    )
+    # ImageReader rewinds a shared file handle while embedding JPEG data
+    _draw_lock = threading.Lock()
 
-    return {
-        "title": title_style,
-        "subtitle": subtitle_style,
-        "section": section_style,
-        "body": body_style,
-    }
+    def __init__(self, jpeg_bytes, size):
+        Flowable.__init__(self)
+        self.jpeg_bytes = jpeg_bytes
+        self.width = self.height = size
 
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
 
-def add_personal_info_section(story, personal, styles):
-    """Add personal information section to PDF"""
-    if personal["full_name"]:
-        title = Paragraph(f"<b>{personal['full_name']}</b>", styles["title"])
-        story.append(title)
+    def draw(self):
+        with self._draw_lock:
+            self.canv.drawImage(
+                photo_image_reader(self.jpeg_bytes), 0, 0, self.width, self.height
+            )
 
-    if personal["title"]:
-        subtitle = Paragraph(personal["title"], styles["subtitle"])
-        story.append(subtitle)
+
+class SharedLayoutParagraph(Paragraph):
+    """Paragraph whose markup parse and line breaking are shared
+
+    Parsed fragments are looked up in ``paragraph_parse_cache`` by
+    (text, style fingerprint), so repeated strings such as journal names or
+    section headers are parsed once per process. Characters the template
+    font lacks are moved into fallback-font fragments when first parsed. Line breaking only depends
+    on the available width, so copies of a cached body paragraph in later
+    renders, or in other templates, reuse the first result instead of
+    measuring every word again.
+    """
+
+    def __init__(self, text, style=None, *args, **kwargs):
+        if text is not None and style is not None and "frags" not in kwargs:
+            key = (text, style_fingerprint(style))
+            frags = paragraph_parse_cache.get(key)
+            if frags is None:
+                Paragraph.__init__(self, text, style, *args, **kwargs)
+                self.frags = apply_font_fallback(self.frags)
+                paragraph_parse_cache.put(key, self.frags)
+            else:
+                Paragraph.__init__(self, text, style, *args, frags=frags, **kwargs)
+        else:
+            Paragraph.__init__(self, text, style, *args, **kwargs)
+        self._layouts = {}
+
+    def wrap(self, availWidth, availHeight):
+        layout = self._layouts.get(availWidth)
+        if layout is None:
+            Paragraph.wrap(self, availWidth, availHeight)
+            layout = (self.width, self._wrapWidths, self.blPara, self.height)
+            self._layouts[availWidth] = layout
+        self.width, self._wrapWidths, self.blPara, self.height = layout
+        return self.width, self.height
+
+
+def add_personal_info_section(story, personal, styles, photo=None):
+    """Add the document's personal ``Header`` to PDF"""
+    header = []
+    if personal.name:
+        title = SharedLayoutParagraph(f"<b>{_text(personal.name)}</b>", styles["title"])
+        header.append(title)
+
+    if personal.title:
+        subtitle = SharedLayoutParagraph(_text(personal.title), styles["subtitle"])
+        header.append(subtitle)
+
+    if photo:
+        # Name and title on the left, photo on the right
+        photo_size = PHOTO_PDF_INCHES * inch
+        header_table = Table(
+            [[header, PhotoFlowable(photo, photo_size)]],
+            colWidths=[6 * inch - photo_size, photo_size],
+        )
+        header_table.setStyle(
+            TableStyle(
+                [
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
+                    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+                ]
+            )
+        )
+        story.append(header_table)
+        story.append(Spacer(1, 6))
+    else:
+        story.extend(header)
 
     # Contact Information
-    contact_data = []
-    if personal["email"]:
-        contact_data.append(["Email:", personal["email"]])
-    if personal["phone"]:
-        contact_data.append(["Phone:", personal["phone"]])
-    if personal["location"]:
-        contact_data.append(["Location:", personal["location"]])
-    if personal["linkedin"]:
-        contact_data.append(["LinkedIn:", personal["linkedin"]])
-    if personal["github"]:
-        contact_data.append(["GitHub:", personal["github"]])
-    if personal["orcid"]:
-        contact_data.append(["ORCID:", personal["orcid"]])
+    contact_data = [[f"{label}:", value] for label, value in personal.contacts]
 
     if contact_data:
         # Split contact data into two columns
@@ -151,9 +229,9 @@ def add_personal_info_section(story, personal, styles):
         for i in range(len(col1)):
             row = [
                 col1[i][0],
-                col1[i][1],
+                _contact_cell(col1[i][1]),
                 col2[i][0] if i < len(col2) else "",
-                col2[i][1] if i < len(col2) else "",
+                _contact_cell(col2[i][1]) if i < len(col2) else "",
             ]
             contact_table_data.append(row)
 
@@ -165,9 +243,9 @@ def add_personal_info_section(story, personal, styles):
                 [
                     ("FONTSIZE", (0, 0), (-1, -1), 9),
                     ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-                    ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                    ("FONTNAME", (2, 0), (2, -1), "Helvetica-Bold"),
+                    ("FONTNAME", (0, 0), (-1, -1), base_font()),
+                    ("FONTNAME", (0, 0), (0, -1), base_font(bold=True)),
+                    ("FONTNAME", (2, 0), (2, -1), base_font(bold=True)),
                 ]
             )
         )
@@ -175,183 +253,521 @@ def add_personal_info_section(story, personal, styles):
         story.append(Spacer(1, 12))
 
     # Professional Summary
-    if personal["summary"]:
-        story.append(Paragraph("<b>PROFESSIONAL SUMMARY</b>", styles["section"]))
-        summary = Paragraph(personal["summary"], styles["body"])
+    if personal.summary:
+        story.append(
+            SharedLayoutParagraph("<b>PROFESSIONAL SUMMARY</b>", styles["section"])
+        )
+        summary = SharedLayoutParagraph(_text(personal.summary), styles["body"])
         story.append(summary)
         story.append(Spacer(1, 6))
 
 
-def add_skills_section(story, skills_data, styles):
-    """Add skills section to PDF"""
-    if any(skills_data.values()):
-        story.append(Paragraph("<b>TECHNICAL SKILLS</b>", styles["section"]))
-
-        for category, skills_list in skills_data.items():
-            if skills_list:
-                category_name = category.replace("_", " ").title()
-                skills_text = f"<b>{category_name}:</b> {', '.join(skills_list)}"
-                skills_para = Paragraph(skills_text, styles["body"])
-                story.append(skills_para)
-        story.append(Spacer(1, 6))
-
-
-def add_education_section(story, education_list, styles):
-    """Add education section to PDF"""
-    if education_list:
-        story.append(Paragraph("<b>EDUCATION</b>", styles["section"]))
-        for edu in education_list:
-            edu_title = f"<b>{edu['degree']}</b> - {edu['institution']}"
-            story.append(Paragraph(edu_title, styles["body"]))
-
-            edu_details = f"{edu['start_year']} - {edu['end_year']} | {edu['location']}"
-            story.append(Paragraph(edu_details, styles["body"]))
-
-            if edu["thesis_title"]:
-                thesis = f"<i>Thesis:</i> {edu['thesis_title']}"
-                story.append(Paragraph(thesis, styles["body"]))
-
-            if edu["advisor"]:
-                advisor = f"<i>Advisor:</i> {edu['advisor']}"
-                story.append(Paragraph(advisor, styles["body"]))
-
-            if edu["gpa"]:
-                gpa = f"<i>GPA:</i> {edu['gpa']}"
-                story.append(Paragraph(gpa, styles["body"]))
-
-            if edu["description"]:
-                story.append(Paragraph(edu["description"], styles["body"]))
-
-            story.append(Spacer(1, 6))
-
-
-def add_experience_section(story, experience_list, styles):
-    """Add work experience section to PDF"""
-    if experience_list:
-        story.append(Paragraph("<b>WORK EXPERIENCE</b>", styles["section"]))
-        for exp in experience_list:
-            exp_title = f"<b>{exp['job_title']}</b> - {exp['company']}"
-            story.append(Paragraph(exp_title, styles["body"]))
-
-            exp_details = f"{exp['start_date']} - {exp['end_date']} | {exp['location']} | {exp['job_type']}"
-            story.append(Paragraph(exp_details, styles["body"]))
-
-            if exp["description"]:
-                story.append(Paragraph(exp["description"], styles["body"]))
-
-            story.append(Spacer(1, 6))
-
-
-def add_projects_section(story, projects_list, styles):
-    """Add projects section to PDF"""
-    if projects_list:
-        story.append(Paragraph("<b>PROJECTS</b>", styles["section"]))
-        for project in projects_list:
-            project_title = f"<b>{project['name']}</b> - {project['type']}"
-            story.append(Paragraph(project_title, styles["body"]))
-
-            project_details = f"{project['start_date']} - {project['end_date']}"
-            if project["technologies"]:
-                project_details += f" | Technologies: {project['technologies']}"
-            story.append(Paragraph(project_details, styles["body"]))
-
-            if project["description"]:
-                story.append(Paragraph(project["description"], styles["body"]))
-
-            if project["github_link"]:
-                github = f"Repository: {project['github_link']}"
-                story.append(Paragraph(github, styles["body"]))
-
-            story.append(Spacer(1, 6))
-
-
-def add_publications_section(story, publications_list, styles):
-    """Add publications section to PDF"""
-    if publications_list:
-        story.append(Paragraph("<b>PUBLICATIONS</b>", styles["section"]))
-        for pub in publications_list:
-            pub_title = f"<b>{pub['title']}</b>"
-            story.append(Paragraph(pub_title, styles["body"]))
-
-            pub_details = f"{pub['authors']} ({pub['year']}). {pub['journal']}"
-            if pub["volume"] and pub["pages"]:
-                pub_details += f", Vol. {pub['volume']}, pp. {pub['pages']}"
-            story.append(Paragraph(pub_details, styles["body"]))
-
-            if pub["doi"]:
-                doi = f"DOI: {pub['doi']}"
-                story.append(Paragraph(doi, styles["body"]))
-
-            story.append(Spacer(1, 6))
-
-
-def add_certifications_section(story, certifications_list, styles):
-    """Add certifications section to PDF"""
-    if certifications_list:
-        story.append(Paragraph("<b>CERTIFICATIONS</b>", styles["section"]))
-        for cert in certifications_list:
-            cert_title = f"<b>{cert['name']}</b> - {cert['issuing_org']}"
-            story.append(Paragraph(cert_title, styles["body"]))
+def _chunk_text(text, max_chars=None):
+    """Split text into pieces of at most ``max_chars``, preferring sentence ends"""
+    max_chars = max_chars or TEXT_CHUNK_CHARS
+    chunks = []
+    start = 0
+    while len(text) - start > max_chars:
+        window_end = start + max_chars
+        cut = text.rfind(". ", start, window_end)
+        if cut > start:
+            cut += 1
+        else:
+            cut = text.rfind(" ", start, window_end)
+            if cut <= start:
+                cut = window_end
+        chunks.append(text[start:cut])
+        start = cut
+        while start < len(text) and text[start] == " ":
+            start += 1
+    chunks.append(text[start:])
+    return chunks
+
+
+def _text_paragraphs(text, style):
+    """Build body paragraphs for free text, chunking oversized text
+
+    Splitting one huge Paragraph across pages re-breaks all of its remaining
+    lines on every page, so a 5,000-word description costs quadratic time;
+    bounded chunks keep it linear.
+    """
+    return [
+        SharedLayoutParagraph(_text(chunk), style) for chunk in _chunk_text(str(text))
+    ]
+
+
+def add_skills_entries(story, groups, styles):
+    """Add the skill category lines to PDF"""
+    for group in groups:
+        skills_text = f"<b>{_text(group.name)}:</b> {_text(', '.join(group.skills))}"
+        story.append(SharedLayoutParagraph(skills_text, styles["body"]))
+    story.append(Spacer(1, 6))
+
+
+def _entry_markup(entry):
+    """Markup record for an ``Entry``: (lines, free text, trailing lines)"""
+    title = f"<b>{_text(entry.title)}</b>"
+    if entry.subtitle:
+        title += f" - {_text(entry.subtitle)}"
+    lines = (title, *map(_text, entry.details))
+    lines += tuple(
+        f"<i>{_text(label)}:</i> {_text(value)}" for label, value in entry.fields
+    )
+    links = tuple(_text(f"{label}: {value}") for label, value in entry.links)
+    return lines, entry.description, links
+
+
+def _entry_flowables(record, styles):
+    """Build the flowables for one entry markup record"""
+    lines, description, links = record
+    body = styles["body"]
+    flowables = [SharedLayoutParagraph(line, body) for line in lines]
+    if description:
+        flowables.extend(_text_paragraphs(description, body))
+    flowables.extend(SharedLayoutParagraph(line, body) for line in links)
+    flowables.append(Spacer(1, 6))
+    return flowables
+
+
+def add_entries(story, entries, styles):
+    """Add a section's ``Entry`` records to PDF"""
+    for entry in entries:
+        story.extend(_entry_flowables(_entry_markup(entry), styles))
+
+
+# Sections that switch to the compact layout for long lists
+COMPACT_SECTIONS = ("publications", "experience")
+
+
+class LazyEntryList(Flowable):
+    """Lay out a long entry list one frame at a time
+
+    Entry flowables are only built when the frame reaches them. Each split
+    places what fits and hands the rest on as a new, smaller LazyEntryList,
+    so the story stays short and layout work grows linearly with the number
+    of entries. Instances are never mutated, which keeps shallow copies from
+    the section cache safe to share.
+    """
+
+    def __init__(self, entries, styles, start=0, pending=()):
+        Flowable.__init__(self)
+        self.entries = entries
+        self.styles = styles
+        self.start = start
+        self.pending = pending
+
+    def wrap(self, availWidth, availHeight):
+        # Never claims to fit whole; the frame then asks split() for a page
+        return availWidth, availHeight + 1
+
+    def split(self, availWidth, availHeight):
+        placed = []
+        pending = list(self.pending)
+        index = self.start
+        used = 0
+        while True:
+            if not pending:
+                if index == len(self.entries):
+                    return placed
+                pending = _entry_flowables(self.entries[index], self.styles)
+                index += 1
+            flowable = pending[0]
+            space = flowable.getSpaceBefore()
+            remaining = availHeight - used - space
+            if remaining > 0:
+                height = flowable.wrap(availWidth, remaining)[1]
+                if height <= remaining:
+                    placed.append(flowable)
+                    pending.pop(0)
+                    used += space + height + flowable.getSpaceAfter()
+                    continue
+                parts = flowable.split(availWidth, remaining)
+                if parts:
+                    placed.append(parts[0])
+                    pending[0:1] = parts[1:]
+            break
+        if not placed:
+            return []
+        return placed + [
+            LazyEntryList(self.entries, self.styles, index, tuple(pending))
+        ]
+
+    def draw(self):
+        pass
+
+
+def add_large_entries(story, entries, styles):
+    """Add a long section as a lazily laid out list of entry markup records
+
+    Each entry is kept as a tuple of markup strings until layout reaches it,
+    instead of three or four flowables per entry in the story.
+    """
+    # Formatting is cheap and snapshots the data; parsing waits for layout
+    story.append(LazyEntryList(tuple(map(_entry_markup, entries)), styles))
+
+
+def use_large_layout(section, entries, layout=DEFAULT_LAYOUT):
+    """Decide whether a section is rendered with the compact large-CV layout"""
+    if section not in COMPACT_SECTIONS or layout == "standard":
+        return False
+    return layout == "large" or len(entries) > LARGE_SECTION_ENTRIES
+
+
+def add_section_header(story, title, styles):
+    """Add a template-styled section header to PDF"""
+    story.append(SharedLayoutParagraph(f"<b>{title}</b>", styles["section"]))
+
+
+def _section_entries_builder(section, large):
+    """Pick the function that adds a document section's entries to PDF"""
+    if large:
+        return add_large_entries
+    if section == "skills":
+        return add_skills_entries
+    return add_entries
+
+
+# Documents larger than this spill from memory to disk in "spooled" mode
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+
+def _render_copy(flowable):
+    """Copy of a cached flowable that one render can lay out and draw
+
+    Layout and drawing store per-document state (wrapped width, line breaks,
+    the canvas) on each flowable, so a shallow copy is enough for the story's
+    own flowables. Tables also draw the flowables in their cells, such as
+    the header photo, and are deep-copied so concurrent renders never share
+    them.
+    """
+    if isinstance(flowable, Table):
+        return copy.deepcopy(flowable)
+    return copy.copy(flowable)
+
+
+def _cached_flowables(section, key, build):
+    """Return copies of a section's memoized flowables, building them on a miss
+
+    See ``_render_copy`` for how cached flowables are copied before use.
+    """
+    flowables = section_flowable_cache.get(section, key)
+    if flowables is None:
+        flowables = []
+        build(flowables)
+        section_flowable_cache.put(section, key, flowables)
+    return [_render_copy(flowable) for flowable in flowables]
+
+
+def story_sections(
+    cv_data,
+    styles,
+    use_cache=True,
+    style_key=None,
+    render_profile=None,
+    layout=DEFAULT_LAYOUT,
+):
+    """Yield ``(section, flowables)`` in story order, starting with the header
+
+    The CV is normalized with ``build_document`` first, which is memoized,
+    and ``section`` is ``"personal_info"`` or a document ``Section`` key. The
+    personal header depends on every template style and is cached per
+    template. Section entries only use the body style, which all templates
+    share, so their parsed paragraphs are reused across templates and only
+    the section headers are rebuilt when the template changes. Long
+    publication and experience lists use the compact layout according to
+    ``layout`` (see ``LAYOUT_MODES``).
+    """
+    document = build_document(cv_data)
+    header = document.header
+    photo = photo_for_profile(
+        cv_data.get("photo"), render_profile or get_render_profile(DEFAULT_PROFILE)
+    )
 
-            cert_details = (
-                f"Issued: {cert['issue_date']} | Expires: {cert['expiry_date']}"
+    if use_cache:
+        if style_key is None:
+            style_key = styles_digest(styles)
+        body_key = styles_digest({"body": styles["body"]})
+        yield "personal_info", _cached_flowables(
+            "personal_info",
+            (canonical_digest(header, photo), style_key),
+            lambda out: add_personal_info_section(out, header, styles, photo),
+        )
+    else:
+        flowables = []
+        add_personal_info_section(flowables, header, styles, photo)
+        yield "personal_info", flowables
+
+    for section in document.sections:
+        flowables = []
+        add_section_header(flowables, section.title, styles)
+        large = use_large_layout(section.key, section.entries, layout)
+        add_entries = _section_entries_builder(section.key, large)
+        if use_cache:
+            flowables.extend(
+                _cached_flowables(
+                    section.key,
+                    (canonical_digest(section), body_key, large),
+                    lambda out: add_entries(out, section.entries, styles),
+                )
             )
-            story.append(Paragraph(cert_details, styles["body"]))
-
-            story.append(Spacer(1, 6))
-
-
-def add_awards_section(story, awards_list, styles):
-    """Add awards section to PDF"""
-    if awards_list:
-        story.append(Paragraph("<b>AWARDS & HONORS</b>", styles["section"]))
-        for award in awards_list:
-            award_title = f"<b>{award['name']}</b> - {award['awarding_org']}"
-            story.append(Paragraph(award_title, styles["body"]))
+        else:
+            add_entries(flowables, section.entries, styles)
+        yield section.key, flowables
+
+
+def build_story(
+    cv_data,
+    styles,
+    use_cache=True,
+    style_key=None,
+    render_profile=None,
+    layout=DEFAULT_LAYOUT,
+):
+    """Build the PDF story, reusing flowables of unchanged sections
+
+    See ``story_sections`` for what is cached and reused.
+    """
+    story = []
+    for _, flowables in story_sections(
+        cv_data, styles, use_cache, style_key, render_profile, layout
+    ):
+        story.extend(flowables)
+    return story
+
+
+def pdf_cache_key(
+    cv_data, template, page_format, profile=DEFAULT_PROFILE, layout=DEFAULT_LAYOUT
+):
+    """Build the render cache key for a CV and its render options"""
+    return canonical_digest(
+        cv_data,
+        template,
+        template_style_digest(template),
+        page_format,
+        get_render_profile(profile),
+        layout,
+    )
 
-            award_details = f"Date: {award['date']}"
-            story.append(Paragraph(award_details, styles["body"]))
 
-            if award["description"]:
-                story.append(Paragraph(award["description"], styles["body"]))
+class _PDFCapture:
+    """Write-only sink that keeps the document ReportLab hands to ``write``
+
+    ReportLab serializes the whole PDF into a single ``bytes`` object before
+    writing it out, so holding on to that object (instead of copying it into
+    a ``BytesIO`` and out again) leaves exactly one copy of the document.
+    An optional ``target`` sink receives the same object unchanged.
+    """
+
+    name = "<cv-pdf>"
+
+    def __init__(self, target=None):
+        self.target = target
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+        if self.target is not None:
+            self.target.write(data)
+        return len(data)
+
+    def flush(self):
+        if self.target is not None and hasattr(self.target, "flush"):
+            self.target.flush()
+
+    def getvalue(self):
+        if len(self.chunks) == 1:
+            return self.chunks[0]
+        return b"".join(self.chunks)
+
+
+def _deliver(pdf_bytes, output):
+    """Hand a finished document to the requested output"""
+    if output is None:
+        return pdf_bytes
+    if output == "spooled":
+        spooled = SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+        spooled.write(pdf_bytes)
+        spooled.seek(0)
+        return spooled
+    output.write(pdf_bytes)
+    return output
+
+
+def check_render_options(page_format, layout):
+    """Reject render options the core does not support"""
+    if page_format not in PAGE_SIZES:
+        raise RenderOptionError(
+            f"Unsupported page format {page_format!r}; "
+            f"expected one of {', '.join(PAGE_SIZES)}"
+        )
+    if layout not in LAYOUT_MODES:
+        raise RenderOptionError(
+            f"Unsupported layout {layout!r}; expected one of {', '.join(LAYOUT_MODES)}"
+        )
 
-            story.append(Spacer(1, 6))
 
+def render_pdf(
+    cv_data,
+    template="Professional Blue",
+    page_format="A4",
+    profile=DEFAULT_PROFILE,
+    use_cache=True,
+    output=None,
+    layout=DEFAULT_LAYOUT,
+):
+    """Render the CV to PDF and return a ``RenderResult``
+
+    Rendered documents are memoized in ``pdf_render_cache`` so repeated
+    downloads of an unchanged CV skip the layout pass entirely. On a miss,
+    only the sections whose data changed are rebuilt (see ``build_story``).
+    ``profile`` names a size/speed trade-off from ``RENDER_PROFILES`` and
+    ``layout`` one of ``LAYOUT_MODES``.
+
+    ``output`` selects what ``RenderResult.pdf`` holds:
+    - ``None``: the PDF as ``bytes`` (the object ReportLab produced, shared
+      with the cache rather than copied)
+    - ``"spooled"``: a rewound ``SpooledTemporaryFile`` that moves to disk
+      once the document exceeds ``SPOOL_MAX_MEMORY``
+    - a writable file-like object: the PDF is written straight into it and
+      the same object is returned (it is not rewound)
+
+    Raises ``RenderError`` (or a subclass) when the CV can't be rendered.
+    """
+    check_render_options(page_format, layout)
+    timings = {"styles": 0.0, "story": 0.0, "layout": 0.0}
+
+    cache_key = None
+    cache_status = "bypass"
+    if use_cache:
+        cache_key = pdf_cache_key(cv_data, template, page_format, profile, layout)
+        cached = pdf_render_cache.get(cache_key)
+        if cached is not None:
+            pdf_bytes, page_count = cached
+            return RenderResult(_deliver(pdf_bytes, output), page_count, "hit", timings)
+        cache_status = "miss"
+
+    spooled = output == "spooled"
+    if spooled:
+        output = SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    sink = _PDFCapture(target=output)
 
-def generate_pdf_cv(cv_data, template="Professional Blue", page_format="A4"):
-    """Generate comprehensive PDF version of the CV with template options"""
     try:
         # Page setup
-        pagesize = A4 if page_format == "A4" else letter
-        buffer = BytesIO()
+        render_profile = get_render_profile(profile)
         doc = SimpleDocTemplate(
-            buffer,
-            pagesize=pagesize,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch,
+            sink,
+            pagesize=PAGE_SIZES[page_format],
+            pageCompression=render_profile["page_compression"],
+            rightMargin=PAGE_MARGIN,
+            leftMargin=PAGE_MARGIN,
+            topMargin=PAGE_MARGIN,
+            bottomMargin=PAGE_MARGIN,
         )
 
         # Get styles for the selected template
+        started = time.perf_counter()
         styles = create_pdf_styles(template)
-        story = []
-
-        # Add all sections
-        add_personal_info_section(story, cv_data["personal_info"], styles)
-        add_skills_section(story, cv_data["skills"], styles)
-        add_education_section(story, cv_data["education"], styles)
-        add_experience_section(story, cv_data["experience"], styles)
-        add_projects_section(story, cv_data["projects"], styles)
-        add_publications_section(story, cv_data["publications"], styles)
-        add_certifications_section(story, cv_data["certifications"], styles)
-        add_awards_section(story, cv_data["awards"], styles)
+        style_key = template_style_digest(template)
+        timings["styles"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        try:
+            story = build_story(
+                cv_data,
+                styles,
+                use_cache=use_cache,
+                style_key=style_key,
+                render_profile=render_profile,
+                layout=layout,
+            )
+        except (KeyError, TypeError, AttributeError) as e:
+            raise CVDataError(f"Invalid CV data: {type(e).__name__}: {e}") from e
+        timings["story"] = time.perf_counter() - started
 
         # Build the PDF
+        started = time.perf_counter()
         doc.build(story)
-        buffer.seek(0)
-        return buffer.getvalue()
-
+        timings["layout"] = time.perf_counter() - started
+    except RenderError:
+        raise
+    except LayoutError as e:
+        raise DocumentLayoutError(str(e)) from e
     except Exception as e:
-        st.error(f"Error generating PDF: {e}")
-        return None
+        raise RenderError(f"Error generating PDF: {e}") from e
+
+    pdf_bytes = sink.getvalue()
+    page_count = doc.page
+    if cache_key is not None:
+        pdf_render_cache.put(cache_key, (pdf_bytes, page_count))
+    if output is None:
+        output = pdf_bytes
+    elif spooled:
+        output.seek(0)
+    return RenderResult(output, page_count, cache_status, timings)
+
+
+def generate_pdf_cv(
+    cv_data,
+    template="Professional Blue",
+    page_format="A4",
+    profile=DEFAULT_PROFILE,
+    use_cache=True,
+    output=None,
+    layout=DEFAULT_LAYOUT,
+):
+    """Generate comprehensive PDF version of the CV with template options
+
+    Shorthand for ``render_pdf(...).pdf``; raises ``RenderError`` on failure.
+    """
+    return render_pdf(
+        cv_data,
+        template=template,
+        page_format=page_format,
+        profile=profile,
+        use_cache=use_cache,
+        output=output,
+        layout=layout,
+    ).pdf
+
+
+def pdf_filename(full_name, template):
+    """Build the download file name for a CV rendered with a template"""
+    return f"{full_name.replace(' ', '_')}_CV_{template.replace(' ', '_')}.pdf"
+
+
+def generate_all_templates_zip(
+    cv_data, page_format="A4", profile=DEFAULT_PROFILE, output=None, render=None
+):
+    """Render the CV with every template into a single ZIP archive
+
+    Section entries are parsed and line-broken once and shared by all
+    templates (see ``build_story``), so only the personal header, section
+    headers and page drawing are repeated per template. ``output`` accepts
+    the same values as in ``render_pdf``; raises ``RenderError`` on failure.
+    ``render`` replaces ``render_pdf`` for the individual PDFs, e.g. with a
+    render service client.
+    """
+    render = render or render_pdf
+    check_render_options(page_format, DEFAULT_LAYOUT)
+    spooled = output == "spooled"
+    if spooled:
+        output = SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    sink = output if output is not None else _PDFCapture()
+
+    try:
+        full_name = cv_data["personal_info"]["full_name"] or "CV"
+    except (KeyError, TypeError) as e:
+        raise CVDataError(f"Invalid CV data: {type(e).__name__}: {e}") from e
+    # PDF page streams are already compressed; storing avoids a second pass
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+        for template in TEMPLATE_COLORS:
+            result = render(
+                cv_data, template=template, page_format=page_format, profile=profile
+            )
+            archive.writestr(pdf_filename(full_name, template), result.pdf)
+
+    if output is None:
+        return sink.getvalue()
+    if spooled:
+        output.seek(0)
+    return output
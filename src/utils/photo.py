@@ -0,0 +1,86 @@
+"""
+Profile photo ingestion and PDF embedding helpers.
+
+Uploaded photos are decoded once, cropped to a square and re-encoded at the
+sizes the PDF and the on-screen preview need. Only those compact JPEG bytes
+are kept in ``cv_data["photo"]``; the original upload is never stored.
+"""
+
+import hashlib
+from functools import lru_cache
+from io import BytesIO
+
+# Edge length of the stored PDF master; covers the High Quality profile
+# (300 dpi at PHOTO_PDF_INCHES)
+PHOTO_PDF_PX = 400
+PHOTO_PREVIEW_PX = 200
+# Printed edge length of the photo in the PDF header
+PHOTO_PDF_INCHES = 1.25
+
+
+def _encode_jpeg(image, quality):
+    """Encode a Pillow image as an optimized JPEG"""
+    out = BytesIO()
+    image.save(out, format="JPEG", quality=quality, optimize=True)
+    return out.getvalue()
+
+
+def ingest_photo(uploaded_file, source_id=None):
+    """Decode an uploaded photo once and return its compact renditions
+
+    JPEGs are decoded with Pillow's draft mode, which lets libjpeg scale by
+    1/2, 1/4 or 1/8 during decoding, so a 12 MB phone photo never has to be
+    expanded at full resolution.
+    """
+    from PIL import Image, ImageOps
+
+    image = Image.open(uploaded_file)
+    if image.format == "JPEG":
+        image.draft("RGB", (PHOTO_PDF_PX, PHOTO_PDF_PX))
+    image = ImageOps.exif_transpose(image).convert("RGB")
+
+    pdf_image = ImageOps.fit(image, (PHOTO_PDF_PX, PHOTO_PDF_PX), Image.LANCZOS)
+    preview_image = pdf_image.resize(
+        (PHOTO_PREVIEW_PX, PHOTO_PREVIEW_PX), Image.LANCZOS
+    )
+    pdf_bytes = _encode_jpeg(pdf_image, quality=95)
+    return {
+        "pdf": pdf_bytes,
+        "preview": _encode_jpeg(preview_image, quality=85),
+        "source_id": source_id,
+        "digest": hashlib.sha256(pdf_bytes).hexdigest(),
+    }
+
+
+def is_ingested_photo(photo):
+    """Check whether ``photo`` holds renditions produced by ``ingest_photo``"""
+    return isinstance(photo, dict) and isinstance(photo.get("pdf"), bytes)
+
+
+@lru_cache(maxsize=32)
+def _photo_for_profile(pdf_bytes, size_px, quality):
+    """Downsample and re-encode the PDF master for a render profile"""
+    from PIL import Image
+
+    image = Image.open(BytesIO(pdf_bytes))
+    if image.size[0] > size_px:
+        image = image.resize((size_px, size_px), Image.LANCZOS)
+    return _encode_jpeg(image, quality)
+
+
+def photo_for_profile(photo, render_profile):
+    """Return the JPEG bytes to embed for a render profile, or None"""
+    if not is_ingested_photo(photo):
+        return None
+    size_px = round(render_profile["image_dpi"] * PHOTO_PDF_INCHES)
+    return _photo_for_profile(
+        photo["pdf"], min(size_px, PHOTO_PDF_PX), render_profile["image_quality"]
+    )
+
+
+@lru_cache(maxsize=32)
+def photo_image_reader(jpeg_bytes):
+    """Return a shared ReportLab ImageReader for embedded photo bytes"""
+    from reportlab.lib.utils import ImageReader
+
+    return ImageReader(BytesIO(jpeg_bytes))
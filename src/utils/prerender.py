@@ -0,0 +1,70 @@
+"""
+Speculative background PDF rendering for the Preview & Export page.
+
+When the page loads, the PDF for the current selection is queued on the
+shared ``render_scheduler`` so that the "Generate & Download PDF" click
+usually finds it ready (or already in the render cache). Jobs are keyed by a
+per-session id kept in a caller-provided mapping such as
+``st.session_state``. Renders go through ``render_cv``, so they run on the
+render service when one is configured.
+"""
+
+import uuid
+
+from src.utils.render_profiles import DEFAULT_PROFILE
+from src.utils.render_scheduler import RenderQueueFull, render_scheduler
+
+SESSION_ID_KEY = "_render_session_id"
+
+
+def session_id(state):
+    """Return this session's render queue id, creating it on first use"""
+    if SESSION_ID_KEY not in state:
+        state[SESSION_ID_KEY] = uuid.uuid4().hex
+    return state[SESSION_ID_KEY]
+
+
+def start_prerender(state, cv_data, template, page_format, profile=DEFAULT_PROFILE):
+    """Queue the current selection unless it is already queued or running
+
+    A queued job for a different selection or older data is cancelled
+    first; one that has already started is left to finish and warm the
+    render cache. Returns the job, or None when the queue is full.
+    """
+    try:
+        return render_scheduler.submit(
+            session_id(state), cv_data, template, page_format, profile
+        )
+    except RenderQueueFull:
+        # Speculative work is the first thing to shed under load
+        return None
+
+
+def cancel_prerender(state):
+    """Cancel this session's queued job, if any"""
+    render_scheduler.cancel(session_id(state))
+
+
+def request_render(state, cv_data, template, page_format, profile=DEFAULT_PROFILE):
+    """Return the session's job for the selection, joining a matching one
+
+    Raises ``RenderQueueFull`` when a new job can't be queued.
+    """
+    return render_scheduler.submit(
+        session_id(state), cv_data, template, page_format, profile
+    )
+
+
+def queued_renderer(state, purpose):
+    """Return a ``render_cv``-style callable whose renders wait in the queue
+
+    ``purpose`` gives the renders their own per-session slot, so e.g. the
+    all-templates ZIP doesn't cancel the session's speculative job.
+    """
+    queue_id = f"{session_id(state)}:{purpose}"
+
+    def render(cv_data, template, page_format, profile=DEFAULT_PROFILE):
+        job = render_scheduler.submit(queue_id, cv_data, template, page_format, profile)
+        return job.result()
+
+    return render
@@ -0,0 +1,298 @@
+"""
+On-screen CV preview rendered as a single HTML document.
+
+Rendering the preview with one ``st.markdown`` call per line sent dozens of
+websocket deltas on every rerun. ``preview_html`` renders it to one HTML
+string from the templates below instead, memoized on a digest of the CV,
+so a rerun sends a single element and an unchanged CV isn't re-rendered.
+A long preview is also large enough for Streamlit's forward-message cache,
+so reruns with an unchanged CV send only a reference to it.
+
+The output has no blank lines, so Streamlit's Markdown renderer passes it
+through as one raw HTML block; all user text is escaped.
+"""
+
+from html import escape
+from string import Template
+
+from src.utils.render_cache import LRUCache, canonical_digest
+
+# "full" is the main preview page, "summary" the compact Preview & Export one
+PREVIEW_STYLES = ("full", "summary")
+# Entries and skills per category listed in the summary preview
+SUMMARY_ENTRIES = 3
+SUMMARY_SKILLS = 5
+
+# Rendered previews keyed by (CV digest, style)
+preview_html_cache = LRUCache(max_entries=64)
+
+_DOCUMENT = Template('<div class="cv-preview">$body</div>')
+_HEADER = Template("$name$title$contact$links<hr>")
+_SECTION = Template("<h2>$title</h2>$content")
+_CARD = Template('<div class="info-card">$content</div>')
+_SKILLS = Template('<div class="skills-grid">$categories</div>')
+_SKILL_CATEGORY = Template("<div><p><b>$name:</b></p><p>$tags</p></div>")
+_SUMMARY_SECTION = Template("<p><b>$title:</b></p>$content")
+
+
+def _text(value):
+    """Escape user text for HTML, keeping its line breaks"""
+    return escape(str(value)).replace("\r\n", "\n").replace("\n", "<br>")
+
+
+def _link(url, label):
+    """Link to a user-supplied URL; anything but http(s) stays plain text"""
+    url = str(url).strip()
+    if not url.lower().startswith(("http://", "https://")):
+        return _text(label)
+    return f'<a href="{escape(url)}" target="_blank">{_text(label)}</a>'
+
+
+def _lines(*lines):
+    """Join the non-empty lines as paragraphs"""
+    return "".join(f"<p>{line}</p>" for line in lines if line)
+
+
+def _optional(label, value):
+    return f"<b>{label}:</b> {_text(value)}" if value else ""
+
+
+def _contact_line(personal):
+    icons = (("email", "📧"), ("phone", "📱"), ("location", "📍"))
+    parts = [f"{icon} {_text(personal[key])}" for key, icon in icons if personal[key]]
+    return " | ".join(parts)
+
+
+def _full_header(personal):
+    links = [
+        _link(personal[key], label)
+        for key, label in (
+            ("linkedin", "LinkedIn"),
+            ("github", "GitHub"),
+            ("orcid", "ORCID"),
+            ("website", "Website"),
+        )
+        if personal.get(key)
+    ]
+    return _HEADER.substitute(
+        name=(
+            f"<h1>{_text(personal['full_name'])}</h1>" if personal["full_name"] else ""
+        ),
+        title=(
+            f"<h3><i>{_text(personal['title'])}</i></h3>" if personal["title"] else ""
+        ),
+        contact=_lines(_contact_line(personal)),
+        links=_lines(" • ".join(links)),
+    )
+
+
+def _full_skills(skills):
+    categories = [
+        _SKILL_CATEGORY.substitute(
+            name=_text(category.replace("_", " ").title()),
+            tags="".join(
+                f'<span class="skill-tag">{_text(skill)}</span>' for skill in entries
+            ),
+        )
+        for category, entries in skills.items()
+        if entries
+    ]
+    return _SKILLS.substitute(categories="".join(categories))
+
+
+def _education_card(edu):
+    return _lines(
+        f"<b>{_text(edu['degree'])}</b>",
+        f"<i>{_text(edu['institution'])}</i> • {_text(edu['location'])}",
+        f"📅 {_text(edu['start_year'])} - {_text(edu['end_year'])}",
+        _optional("Thesis", edu["thesis_title"]),
+        _optional("Advisor", edu["advisor"]),
+        _optional("GPA", edu["gpa"]),
+        _text(edu["description"]),
+    )
+
+
+def _experience_card(exp):
+    return _lines(
+        f"<b>{_text(exp['job_title'])}</b>",
+        f"<i>{_text(exp['company'])}</i> • {_text(exp['location'])}",
+        f"📅 {_text(exp['start_date'])} - {_text(exp['end_date'])} • "
+        f"{_text(exp['job_type'])}",
+        _text(exp["description"]),
+    )
+
+
+def _project_card(project):
+    links = []
+    if project["github_link"]:
+        links.append(_link(project["github_link"], "GitHub"))
+    if project["publication_link"]:
+        links.append(_link(project["publication_link"], "Publication"))
+    return _lines(
+        f"<b>{_text(project['name'])}</b> - <i>{_text(project['type'])}</i>",
+        f"📅 {_text(project['start_date'])} - {_text(project['end_date'])}",
+        _optional("Technologies", project["technologies"]),
+        " • ".join(links),
+        _text(project["description"]),
+    )
+
+
+def _publication_card(pub):
+    volume = ""
+    if pub["volume"] and pub["pages"]:
+        volume = f"Vol. {_text(pub['volume'])}, pp. {_text(pub['pages'])}"
+    return _lines(
+        f"<b>{_text(pub['title'])}</b>",
+        f"<i>{_text(pub['authors'])}</i>",
+        f"📖 {_text(pub['journal'])} ({_text(pub['year'])})",
+        volume,
+        f"DOI: {_text(pub['doi'])}" if pub["doi"] else "",
+        _link(pub["url"], "Read Publication") if pub["url"] else "",
+    )
+
+
+def _certification_card(cert):
+    return _lines(
+        f"<b>{_text(cert['name'])}</b>",
+        f"<i>{_text(cert['issuing_org'])}</i>",
+        f"📅 Issued: {_text(cert['issue_date'])} • "
+        f"Expires: {_text(cert['expiry_date'])}",
+        _link(cert["url"], "View Credential") if cert["url"] else "",
+    )
+
+
+def _award_card(award):
+    return _lines(
+        f"<b>{_text(award['name'])}</b>",
+        f"<i>{_text(award['awarding_org'])}</i>",
+        f"📅 {_text(award['date'])}",
+        _text(award["description"]),
+    )
+
+
+# Sections of the full preview: (cv_data key, heading, card renderer)
+FULL_SECTIONS = (
+    ("education", "🎓 Education", _education_card),
+    ("experience", "💼 Work Experience", _experience_card),
+    ("projects", "🚀 Projects", _project_card),
+    ("publications", "📚 Publications", _publication_card),
+    ("certifications", "📜 Certifications", _certification_card),
+    ("awards", "🏆 Awards & Honors", _award_card),
+)
+
+
+def _full_body(cv_data):
+    """Every section with one card per entry, as on the main preview page"""
+    personal = cv_data["personal_info"]
+    parts = [_full_header(personal)]
+    if personal["summary"]:
+        summary = _CARD.substitute(content=_text(personal["summary"]))
+        parts.append(
+            _SECTION.substitute(title="📝 Professional Summary", content=summary)
+        )
+    if any(cv_data["skills"].values()):
+        skills = _full_skills(cv_data["skills"])
+        parts.append(_SECTION.substitute(title="🛠️ Technical Skills", content=skills))
+    for key, title, card in FULL_SECTIONS:
+        if cv_data[key]:
+            cards = "".join(
+                _CARD.substitute(content=card(entry)) for entry in cv_data[key]
+            )
+            parts.append(_SECTION.substitute(title=title, content=cards))
+    return "".join(parts)
+
+
+def _education_line(edu):
+    return (
+        f"{edu['degree']} - {edu['institution']} "
+        f"({edu['start_year']}-{edu['end_year']})"
+    )
+
+
+def _experience_line(exp):
+    return (
+        f"{exp['job_title']} at {exp['company']} "
+        f"({exp['start_date']} - {exp['end_date']})"
+    )
+
+
+def _project_line(project):
+    return f"{project['name']} - {project['type']}"
+
+
+def _publication_line(pub):
+    return f"{pub['title']} ({pub['year']})"
+
+
+# Sections of the summary preview: (cv_data key, heading, entry limit, line)
+SUMMARY_SECTIONS = (
+    ("education", "Education", None, _education_line),
+    ("experience", "Work Experience", None, _experience_line),
+    ("projects", "Projects", SUMMARY_ENTRIES, _project_line),
+    ("publications", "Publications", SUMMARY_ENTRIES, _publication_line),
+)
+
+
+def _bullets(items):
+    return "".join(f"<p>• {item}</p>" for item in items)
+
+
+def _summary_body(cv_data):
+    """Headline facts of each section, as on the Preview & Export page"""
+    personal = cv_data["personal_info"]
+    parts = [f"<h3>{_text(personal['full_name'])}</h3>"]
+    if personal["title"]:
+        parts.append(f"<p><i>{_text(personal['title'])}</i></p>")
+    online = [
+        label
+        for key, label in (
+            ("linkedin", "💼 LinkedIn"),
+            ("github", "💻 GitHub"),
+            ("orcid", "🎓 ORCID"),
+        )
+        if personal[key]
+    ]
+    parts.append(_lines(_contact_line(personal), " | ".join(online)))
+    if personal["summary"]:
+        parts.append(
+            _SUMMARY_SECTION.substitute(
+                title="Professional Summary",
+                content=_lines(_text(personal["summary"])),
+            )
+        )
+
+    if any(cv_data["skills"].values()):
+        skills = []
+        for category, entries in cv_data["skills"].items():
+            if entries:
+                shown = ", ".join(entries[:SUMMARY_SKILLS])
+                more = "..." if len(entries) > SUMMARY_SKILLS else ""
+                name = category.replace("_", " ").title()
+                skills.append(f"<i>{_text(name)}:</i> {_text(shown)}{more}")
+        parts.append(
+            _SUMMARY_SECTION.substitute(
+                title="Technical Skills", content=_lines(*skills)
+            )
+        )
+
+    for key, title, limit, line in SUMMARY_SECTIONS:
+        entries = cv_data[key][:limit]
+        if entries:
+            content = _bullets(_text(line(entry)) for entry in entries)
+            parts.append(_SUMMARY_SECTION.substitute(title=title, content=content))
+    return "".join(parts)
+
+
+def preview_html(cv_data, style="full"):
+    """Render the CV preview as one HTML string, memoized per CV and style"""
+    if style not in PREVIEW_STYLES:
+        raise ValueError(f"Unknown preview style {style!r}")
+    # The photo isn't part of the preview, so don't hash it on every rerun
+    content = {key: value for key, value in cv_data.items() if key != "photo"}
+    key = (canonical_digest(content), style)
+    html = preview_html_cache.get(key)
+    if html is None:
+        body = _full_body(cv_data) if style == "full" else _summary_body(cv_data)
+        html = _DOCUMENT.substitute(body=body)
+        preview_html_cache.put(key, html)
+    return html
@@ -0,0 +1,233 @@
+"""
+Content-addressed caching for rendered CV documents.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from src.models.cv_data import Record
+
+
+def _json_default(value):
+    """Serialize values the standard JSON encoder does not understand"""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"__bytes__": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, Record):
+        # Same digest as the entry's JSON object
+        return value.to_dict()
+    return str(value)
+
+
+def canonical_digest(*parts):
+    """Return a stable SHA-256 hex digest for JSON-like data
+
+    Dictionaries are hashed with sorted keys so that two structurally equal
+    CVs always produce the same digest, regardless of insertion order.
+    """
+    payload = json.dumps(
+        parts,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=_json_default,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """Thread-safe LRU cache of rendered documents bounded by total byte size
+
+    ``sizeof`` returns the byte size of a cached value; it defaults to
+    ``len`` for plain ``bytes`` values.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, sizeof=len):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached document for ``key`` or None"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        """Store ``data`` under ``key``, evicting least recently used entries"""
+        size = self.sizeof(data)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= self.sizeof(previous)
+            self._entries[key] = data
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= self.sizeof(evicted)
+                self.evictions += 1
+
+    def __contains__(self, key):
+        """Check for a cached document without touching LRU order or counters"""
+        with self._lock:
+            return key in self._entries
+
+    def clear(self):
+        """Drop all cached documents and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """Return hit/miss counters and current memory usage"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def _document_size(entry):
+    """Byte size of a cached ``(pdf_bytes, page_count)`` entry"""
+    return len(entry[0])
+
+
+# Process-wide cache of (pdf_bytes, page_count) shared by every session
+# served by this process
+pdf_render_cache = RenderCache(sizeof=_document_size)
+
+
+class SectionCache:
+    """Per-section memo of built flowables with rebuild/reuse statistics
+
+    Each section keeps at most ``max_entries_per_section`` variants, which is
+    enough to cover template toggling without holding on to stale layouts.
+    """
+
+    def __init__(self, max_entries_per_section=8):
+        self.max_entries_per_section = max_entries_per_section
+        self._sections = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def get(self, section, key):
+        """Return the cached flowables for ``section`` or None"""
+        with self._lock:
+            entries = self._sections.get(section)
+            counters = self._stats.setdefault(section, {"rebuilds": 0, "reuses": 0})
+            if entries is None or key not in entries:
+                counters["rebuilds"] += 1
+                return None
+            entries.move_to_end(key)
+            counters["reuses"] += 1
+            return entries[key]
+
+    def put(self, section, key, flowables):
+        """Store the flowables built for ``section`` under ``key``"""
+        with self._lock:
+            entries = self._sections.setdefault(section, OrderedDict())
+            entries[key] = flowables
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries_per_section:
+                entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached flowables and reset the statistics"""
+        with self._lock:
+            self._sections.clear()
+            self._stats.clear()
+
+    def stats(self):
+        """Return per-section rebuild and reuse counters"""
+        with self._lock:
+            return {
+                section: dict(counters) for section, counters in self._stats.items()
+            }
+
+
+class LRUCache:
+    """Thread-safe LRU cache bounded by entry count with hit/miss counters"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return the cached value for ``key`` or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store ``value`` under ``key``, evicting the least recently used"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Return hit/miss counters and the current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Process-wide memo of section flowables used by the PDF story builder
+section_flowable_cache = SectionCache()
+
+# Process-wide cache of parsed Paragraph markup, keyed by (text, style digest)
+paragraph_parse_cache = LRUCache(max_entries=20000)
+
+# Process-wide cache of TrueType subset font programs, keyed by
+# (font file, subset characters); shared by every document that embeds them
+font_subset_cache = RenderCache(max_bytes=16 * 1024 * 1024)
@@ -0,0 +1,152 @@
+"""
+Client for the local render service (see ``render_service.py``).
+
+When ``CV_RENDER_SERVICE_URL`` is set, ``render_cv`` sends the CV to the
+service so the PDF is built in one of its worker processes instead of on the
+Streamlit script thread. Without it, or when the service can't be reached,
+rendering falls back to ``render_pdf`` in this process.
+"""
+
+import base64
+import json
+import logging
+import os
+import urllib.error
+import urllib.request
+
+from src.models.cv_data import Record
+from src.utils.pdf_generator import (
+    DEFAULT_LAYOUT,
+    CVDataError,
+    DocumentLayoutError,
+    RenderError,
+    RenderOptionError,
+    RenderResult,
+    render_pdf,
+)
+from src.utils.render_profiles import DEFAULT_PROFILE
+
+logger = logging.getLogger(__name__)
+
+RENDER_SERVICE_ENV = "CV_RENDER_SERVICE_URL"
+REQUEST_TIMEOUT = 120
+
+
+class RenderServiceUnavailable(RenderError):
+    """The render service could not be reached or had no healthy workers"""
+
+
+# Error types the service may report, by name
+SERVICE_ERRORS = {
+    cls.__name__: cls
+    for cls in (
+        RenderError,
+        RenderOptionError,
+        CVDataError,
+        DocumentLayoutError,
+        RenderServiceUnavailable,
+    )
+}
+
+
+def _encode_bytes(value):
+    """JSON fallback that carries binary values (the photo) as base64"""
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, Record):
+        return value.to_dict()
+    return str(value)
+
+
+def _decode_bytes(obj):
+    """JSON object hook reversing ``_encode_bytes``"""
+    if len(obj) == 1 and "__bytes__" in obj:
+        return base64.b64decode(obj["__bytes__"])
+    return obj
+
+
+def encode_render_request(cv_data, template, page_format, profile, layout):
+    """Serialize a render request body"""
+    request = {
+        "cv_data": cv_data,
+        "template": template,
+        "page_format": page_format,
+        "profile": profile,
+        "layout": layout,
+    }
+    return json.dumps(request, default=_encode_bytes).encode("utf-8")
+
+
+def decode_render_request(body):
+    """Parse a render request body produced by ``encode_render_request``"""
+    return json.loads(body, object_hook=_decode_bytes)
+
+
+def render_service_url():
+    """Return the configured render service URL, or None"""
+    return os.environ.get(RENDER_SERVICE_ENV) or None
+
+
+def render_remote(
+    url,
+    cv_data,
+    template="Professional Blue",
+    page_format="A4",
+    profile=DEFAULT_PROFILE,
+    layout=DEFAULT_LAYOUT,
+    timeout=REQUEST_TIMEOUT,
+):
+    """Render the CV on the service at ``url`` and return a ``RenderResult``
+
+    Errors reported by the service are raised as the matching ``RenderError``
+    subclass; connection failures raise ``RenderServiceUnavailable``.
+    """
+    request = urllib.request.Request(
+        url.rstrip("/") + "/render",
+        data=encode_render_request(cv_data, template, page_format, profile, layout),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            pdf_bytes = response.read()
+            headers = response.headers
+    except urllib.error.HTTPError as e:
+        try:
+            error = json.loads(e.read())
+        except ValueError:
+            error = {}
+        error_cls = SERVICE_ERRORS.get(error.get("error"), RenderError)
+        raise error_cls(error.get("message") or f"Render service error {e.code}")
+    except (urllib.error.URLError, OSError) as e:
+        raise RenderServiceUnavailable(f"Render service unreachable: {e}") from e
+
+    return RenderResult(
+        pdf_bytes,
+        int(headers.get("X-Page-Count", 0)),
+        headers.get("X-Cache-Status", "miss"),
+        json.loads(headers.get("X-Render-Timings", "{}")),
+    )
+
+
+def render_cv(
+    cv_data,
+    template="Professional Blue",
+    page_format="A4",
+    profile=DEFAULT_PROFILE,
+    layout=DEFAULT_LAYOUT,
+):
+    """Render through the service when one is configured, else in-process"""
+    url = render_service_url()
+    if url:
+        try:
+            return render_remote(url, cv_data, template, page_format, profile, layout)
+        except RenderServiceUnavailable as e:
+            logger.warning("%s; rendering in-process", e)
+    return render_pdf(
+        cv_data,
+        template=template,
+        page_format=page_format,
+        profile=profile,
+        layout=layout,
+    )
@@ -0,0 +1,46 @@
+"""
+Render profiles behind the "Compression Level" export option.
+
+Each profile trades output size against fidelity:
+
+| Profile       | Page streams | Photo          | Size   |
+|---------------|--------------|----------------|--------|
+| Standard      | Flate        | 200 dpi, q85   | medium |
+| High Quality  | uncompressed | 300 dpi, q95   | large  |
+| Web Optimized | Flate        | 110 dpi, q70   | small  |
+
+Fonts are the same in every profile: the standard 14 fonts are never
+embedded and ReportLab always subsets embedded TrueType fonts to the glyphs
+used. Render time barely depends on the profile: High Quality skips zlib on
+its page streams but embeds a larger photo, and on the reference CV its
+median is within the run-to-run spread of the others. Run
+``python benchmarks/bench_render_profiles.py`` for measured numbers.
+"""
+
+DEFAULT_PROFILE = "Standard"
+
+RENDER_PROFILES = {
+    "Standard": {
+        # Compressed page streams and a print-quality photo
+        "page_compression": 1,
+        "image_dpi": 200,
+        "image_quality": 85,
+    },
+    "High Quality": {
+        # Uncompressed page streams and more photo detail; the largest file
+        "page_compression": 0,
+        "image_dpi": 300,
+        "image_quality": 95,
+    },
+    "Web Optimized": {
+        # Smallest file: compressed streams and a screen-resolution photo
+        "page_compression": 1,
+        "image_dpi": 110,
+        "image_quality": 70,
+    },
+}
+
+
+def get_render_profile(name):
+    """Get the render profile for a compression level, defaulting to Standard"""
+    return RENDER_PROFILES.get(name, RENDER_PROFILES[DEFAULT_PROFILE])
@@ -0,0 +1,224 @@
+"""
+Bounded render queue shared by every session served by this process.
+
+At most ``max_concurrency`` renders run at once; further requests wait in a
+FIFO queue of at most ``max_queue`` jobs and are rejected with
+``RenderQueueFull`` beyond that. Each session has at most one pending job:
+an identical request joins it and a different one (e.g. after a template
+change) cancels it if it hasn't started yet. A PDF that is already cached
+is served on the calling thread, and one another session is rendering right
+now is shared; the CV is only snapshotted for jobs that are actually queued.
+"""
+
+import copy
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+from src.utils.pdf_generator import RenderError, pdf_cache_key
+from src.utils.render_cache import pdf_render_cache
+from src.utils.render_client import render_cv
+from src.utils.render_profiles import DEFAULT_PROFILE
+
+CONCURRENCY_ENV = "CV_RENDER_CONCURRENCY"
+QUEUE_SIZE_ENV = "CV_RENDER_QUEUE_SIZE"
+# Weight of the newest render time in the running average used for ETAs
+_EMA_WEIGHT = 0.3
+
+
+class RenderQueueFull(RenderError):
+    """The render queue is at capacity; the caller should retry later"""
+
+
+class RenderJob:
+    """A render requested by one session, backed by a ``Future``"""
+
+    def __init__(self, key, session_id, args):
+        self.key = key
+        self.session_id = session_id
+        self.args = args
+        self.future = Future()
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+
+    def done(self):
+        return self.future.done()
+
+    def cancelled(self):
+        return self.future.cancelled()
+
+    def result(self, timeout=None):
+        """Return the ``RenderResult``, waiting up to ``timeout`` seconds"""
+        return self.future.result(timeout)
+
+
+class RenderScheduler:
+    """Run renders on a fixed number of threads behind a bounded queue"""
+
+    def __init__(self, max_concurrency=2, max_queue=32, render=None):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.render = render or render_cv
+        self.average_seconds = 1.0
+        self._queue = deque()
+        self._running = set()
+        self._session_jobs = {}
+        self._cond = threading.Condition()
+        self._workers = []
+
+    def submit(
+        self, session_id, cv_data, template, page_format, profile=DEFAULT_PROFILE
+    ):
+        """Queue a render for a session and return its ``RenderJob``
+
+        Returns the session's pending job when it is for identical inputs,
+        or a running job of another session that renders the same PDF.
+        Raises ``RenderQueueFull`` instead of waiting when the queue is full.
+        """
+        key = pdf_cache_key(cv_data, template, page_format, profile)
+        with self._cond:
+            previous = self._session_jobs.get(session_id)
+            if self._joinable(previous, key):
+                return previous
+            running = next((job for job in self._running if job.key == key), None)
+            cached = running is None and key in pdf_render_cache
+            if (running is not None or cached) and previous is not None:
+                self._cancel_locked(previous)
+        if running is not None:
+            return running
+
+        if cached:
+            # Cached documents take microseconds; serve them without queueing
+            # or snapshotting the CV
+            job = RenderJob(key, session_id, (cv_data, template, page_format, profile))
+            job.future.set_running_or_notify_cancel()
+            job.started_at = time.monotonic()
+            self._run(job)
+            return job
+
+        # Snapshot so later edits on the script thread can't race the render
+        job = RenderJob(
+            key, session_id, (copy.deepcopy(cv_data), template, page_format, profile)
+        )
+        with self._cond:
+            previous = self._session_jobs.get(session_id)
+            if self._joinable(previous, key):
+                return previous
+            if previous is not None:
+                self._cancel_locked(previous)
+            if len(self._queue) >= self.max_queue:
+                raise RenderQueueFull(
+                    f"The render queue is full ({self.max_queue} jobs "
+                    "waiting); please try again in a moment"
+                )
+            self._queue.append(job)
+            self._session_jobs[session_id] = job
+            self._start_workers_locked()
+            self._cond.notify()
+            return job
+
+    @staticmethod
+    def _joinable(job, key):
+        """Whether a session's pending job renders ``key`` and can be joined"""
+        return job is not None and job.key == key and not job.cancelled()
+
+    def cancel(self, session_id):
+        """Cancel a session's pending job; a running one is left to finish"""
+        with self._cond:
+            job = self._session_jobs.get(session_id)
+            if job is not None:
+                self._cancel_locked(job)
+
+    def _cancel_locked(self, job):
+        """Detach a job from its session and drop it if it hasn't started"""
+        if self._session_jobs.get(job.session_id) is job:
+            del self._session_jobs[job.session_id]
+        if job.future.cancel():
+            self._queue.remove(job)
+
+    def position(self, job):
+        """1-based queue position, 0 while rendering, None once finished"""
+        with self._cond:
+            if job in self._running:
+                return 0
+            try:
+                return self._queue.index(job) + 1
+            except ValueError:
+                return None
+
+    def estimated_wait(self, job):
+        """Rough seconds until the job's PDF is ready"""
+        position = self.position(job)
+        if position is None:
+            return 0.0
+        if position == 0:
+            elapsed = time.monotonic() - job.started_at
+            return max(self.average_seconds - elapsed, 0.0)
+        rounds = (position - 1) // self.max_concurrency + 1
+        return rounds * self.average_seconds + self.average_seconds / 2
+
+    def stats(self):
+        """Return queue depth, running jobs and the average render time"""
+        with self._cond:
+            return {
+                "queued": len(self._queue),
+                "running": len(self._running),
+                "max_queue": self.max_queue,
+                "max_concurrency": self.max_concurrency,
+                "average_seconds": self.average_seconds,
+            }
+
+    def _start_workers_locked(self):
+        """Start the worker threads on first use"""
+        while len(self._workers) < self.max_concurrency:
+            worker = threading.Thread(
+                target=self._work,
+                name=f"cv-render-{len(self._workers)}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self):
+        """Worker loop: take the oldest job and render it"""
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                job = self._queue.popleft()
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                job.started_at = time.monotonic()
+                self._running.add(job)
+            try:
+                self._run(job)
+            finally:
+                with self._cond:
+                    self._running.discard(job)
+                    if self._session_jobs.get(job.session_id) is job:
+                        del self._session_jobs[job.session_id]
+                    elapsed = time.monotonic() - job.started_at
+                    self.average_seconds += _EMA_WEIGHT * (
+                        elapsed - self.average_seconds
+                    )
+
+    def _run(self, job):
+        """Render a started job and settle its future"""
+        cv_data, template, page_format, profile = job.args
+        try:
+            result = self.render(
+                cv_data, template=template, page_format=page_format, profile=profile
+            )
+        except BaseException as e:
+            job.future.set_exception(e)
+        else:
+            job.future.set_result(result)
+
+
+# Process-wide scheduler; size it with CV_RENDER_CONCURRENCY / CV_RENDER_QUEUE_SIZE
+render_scheduler = RenderScheduler(
+    max_concurrency=int(os.environ.get(CONCURRENCY_ENV, 2)),
+    max_queue=int(os.environ.get(QUEUE_SIZE_ENV, 32)),
+)
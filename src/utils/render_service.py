@@ -0,0 +1,243 @@
+"""
+Local HTTP render service with a pool of pre-warmed worker processes.
+
+Runs PDF rendering outside the Streamlit process so a burst of renders uses
+every core without stalling the websocket server. Point the app at it with
+``CV_RENDER_SERVICE_URL`` (see ``render_client.py``).
+
+Usage:
+    python -m src.utils.render_service --port 8765 --workers 4
+
+Endpoints:
+    POST /render   JSON request from ``encode_render_request``; replies with
+                   the PDF and X-Page-Count / X-Cache-Status /
+                   X-Render-Timings headers, or a JSON error
+    GET  /health   Worker count and render cache statistics
+"""
+
+import argparse
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.models.sample_cv import build_sample_cv
+from src.utils.fonts import register_fonts
+from src.utils.pdf_generator import (
+    DEFAULT_LAYOUT,
+    CVDataError,
+    DocumentLayoutError,
+    RenderError,
+    RenderOptionError,
+    RenderResult,
+    pdf_cache_key,
+    render_pdf,
+)
+from src.utils.render_cache import pdf_render_cache
+from src.utils.render_client import RenderServiceUnavailable, decode_render_request
+from src.utils.render_profiles import DEFAULT_PROFILE
+from src.utils.template_styles import TEMPLATE_COLORS, warm_template_styles
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Largest accepted request body; a CV with a photo is well under 1 MB
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+# HTTP status for each error type; anything else is a 500
+ERROR_STATUS = {
+    RenderOptionError: 400,
+    CVDataError: 400,
+    DocumentLayoutError: 422,
+    RenderServiceUnavailable: 503,
+}
+
+
+def _init_worker():
+    """Warm a worker: import ReportLab, compile styles, render every template
+
+    One throwaway render per template loads the lazily imported ReportLab
+    and Pillow modules and fills the style and parse caches, so the first
+    real request doesn't pay for them. Fallback fonts are registered up
+    front for the same reason. Whole documents are cached by the service
+    process, so the worker's own document cache is disabled.
+    """
+    warm_template_styles()
+    register_fonts()
+    sample = build_sample_cv(publications=3, experience=1, with_photo=True)
+    for template in TEMPLATE_COLORS:
+        render_pdf(sample, template=template, use_cache=False)
+    pdf_render_cache.max_bytes = 0
+
+
+def _render_in_worker(cv_data, template, page_format, profile, layout):
+    """Render in a worker process and return picklable result fields"""
+    result = render_pdf(
+        cv_data,
+        template=template,
+        page_format=page_format,
+        profile=profile,
+        layout=layout,
+    )
+    return result.pdf, result.page_count, result.timings
+
+
+def _ping():
+    """No-op task used to start and warm every worker up front"""
+    return os.getpid()
+
+
+class RenderService:
+    """Process pool of warm renderers fronted by a shared document cache"""
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self._lock = threading.Lock()
+        self._pool = self._start_pool()
+
+    def _start_pool(self):
+        """Start the worker processes and wait until all are warm"""
+        pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        wait([pool.submit(_ping) for _ in range(self.workers)])
+        return pool
+
+    def render(self, cv_data, template, page_format, profile, layout):
+        """Render a CV, answering repeats from the service-wide cache"""
+        key = pdf_cache_key(cv_data, template, page_format, profile, layout)
+        cached = pdf_render_cache.get(key)
+        if cached is not None:
+            pdf_bytes, page_count = cached
+            return RenderResult(pdf_bytes, page_count, "hit", {})
+
+        pool = self._pool
+        try:
+            pdf_bytes, page_count, timings = pool.submit(
+                _render_in_worker, cv_data, template, page_format, profile, layout
+            ).result()
+        except BrokenProcessPool as e:
+            # A worker died (e.g. killed for memory); replace the whole pool
+            with self._lock:
+                if self._pool is pool:
+                    self._pool = self._start_pool()
+            raise RenderServiceUnavailable("Render worker crashed") from e
+        pdf_render_cache.put(key, (pdf_bytes, page_count))
+        return RenderResult(pdf_bytes, page_count, "miss", timings)
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        self._pool.shutdown(cancel_futures=True)
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for a ``RenderService`` stored on the server"""
+
+    server_version = "CVRenderService/1.0"
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self._send(status, body, "application/json")
+
+    def _send_error(self, status, error, message):
+        self._send_json(status, {"error": error, "message": message})
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._send_error(404, "NotFound", f"No such endpoint: {self.path}")
+            return
+        service = self.server.render_service
+        self._send_json(
+            200,
+            {
+                "status": "ok",
+                "workers": service.workers,
+                "cache": pdf_render_cache.stats(),
+            },
+        )
+
+    def do_POST(self):
+        if self.path != "/render":
+            self._send_error(404, "NotFound", f"No such endpoint: {self.path}")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_REQUEST_BYTES:
+            self._send_error(413, "RequestTooLarge", "Render request is too large")
+            return
+        try:
+            request = decode_render_request(self.rfile.read(length))
+            args = [
+                request["cv_data"],
+                request.get("template", "Professional Blue"),
+                request.get("page_format", "A4"),
+                request.get("profile", DEFAULT_PROFILE),
+                request.get("layout", DEFAULT_LAYOUT),
+            ]
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_error(400, "BadRequest", f"Malformed render request: {e}")
+            return
+
+        try:
+            result = self.server.render_service.render(*args)
+        except RenderError as e:
+            status = ERROR_STATUS.get(type(e), 500)
+            self._send_error(status, type(e).__name__, str(e))
+            return
+        self._send(
+            200,
+            result.pdf,
+            "application/pdf",
+            {
+                "X-Page-Count": str(result.page_count),
+                "X-Cache-Status": result.cache_status,
+                "X-Render-Timings": json.dumps(result.timings),
+            },
+        )
+
+
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None):
+    """Start the worker pool and bind the HTTP server (not yet serving)"""
+    server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    server.daemon_threads = True
+    server.render_service = RenderService(workers)
+    return server
+
+
+def main(argv=None):
+    """Entry point for the render service"""
+    parser = argparse.ArgumentParser(description="Run the local CV render service.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    args = parser.parse_args(argv)
+
+    server = create_server(args.host, args.port, args.workers)
+    print(
+        f"Render service on http://{args.host}:{args.port} "
+        f"with {server.render_service.workers} warm workers"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.render_service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -45,6 +45,12 @@ def load_css():
         font-size: 0.9em;
     }
 
+    .skills-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 0 1.5em;
+    }
+
     .stButton > button {
         background-color: #3b82f6;
         color: white;
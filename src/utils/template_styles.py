@@ -0,0 +1,193 @@
+"""
+Process-wide registry of compiled PDF template styles.
+
+Each template's ReportLab styles are compiled once per process on first use
+and shared by every renderer in that process. The registry hands out
+read-only mappings; callers must treat the contained styles as immutable.
+"""
+
+import threading
+import weakref
+from types import MappingProxyType
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+from src.utils.fonts import base_font
+from src.utils.render_cache import canonical_digest
+
+DEFAULT_TEMPLATE = "Professional Blue"
+
+# Template definitions; call invalidate_template_styles() after editing one
+TEMPLATE_COLORS = {
+    "Professional Blue": {
+        "title": "#1e3a8a",
+        "subtitle": "#1e40af",
+        "section": "#1e40af",
+        "border": "#3b82f6",
+    },
+    "Academic Classic": {
+        "title": "#0f172a",
+        "subtitle": "#374151",
+        "section": "#374151",
+        "border": "#6b7280",
+    },
+    "Modern Minimal": {
+        "title": "#111827",
+        "subtitle": "#4b5563",
+        "section": "#6b7280",
+        "border": "#d1d5db",
+    },
+    "Scientific Research": {
+        "title": "#065f46",
+        "subtitle": "#047857",
+        "section": "#059669",
+        "border": "#10b981",
+    },
+}
+
+_registry = {}
+_registry_lock = threading.Lock()
+_base_styles = None
+_style_fingerprints = weakref.WeakKeyDictionary()
+
+
+def get_template_colors(template):
+    """Get color scheme for different PDF templates"""
+    return TEMPLATE_COLORS.get(template, TEMPLATE_COLORS[DEFAULT_TEMPLATE])
+
+
+def _resolve_template(template):
+    """Map unknown template names onto the default template"""
+    return template if template in TEMPLATE_COLORS else DEFAULT_TEMPLATE
+
+
+def compile_template_styles(template):
+    """Build fresh ReportLab paragraph styles for a template"""
+    global _base_styles
+    if _base_styles is None:
+        _base_styles = getSampleStyleSheet()
+    styles = _base_styles
+    colors_scheme = get_template_colors(template)
+    minimal = template == "Modern Minimal"
+
+    # Title style
+    title_style = ParagraphStyle(
+        "CustomTitle",
+        parent=styles["Heading1"],
+        fontName=base_font(bold=True),
+        fontSize=24 if not minimal else 22,
+        spaceAfter=6,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor(colors_scheme["title"]),
+    )
+
+    # Subtitle style
+    subtitle_style = ParagraphStyle(
+        "CustomSubtitle",
+        parent=styles["Heading2"],
+        fontName=base_font(bold=True),
+        fontSize=14,
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor(colors_scheme["subtitle"]),
+    )
+
+    # Section header style
+    section_style = ParagraphStyle(
+        "SectionHeader",
+        parent=styles["Heading2"],
+        fontName=base_font(bold=True),
+        fontSize=14 if not minimal else 12,
+        spaceBefore=12,
+        spaceAfter=6,
+        textColor=colors.HexColor(colors_scheme["section"]),
+        borderWidth=1 if not minimal else 0,
+        borderColor=colors.HexColor(colors_scheme["border"]) if not minimal else None,
+        borderPadding=3 if not minimal else 0,
+    )
+
+    # Body text style
+    body_style = ParagraphStyle(
+        "CustomBody",
+        parent=styles["Normal"],
+        fontName=base_font(),
+        fontSize=10,
+        spaceBefore=3,
+        spaceAfter=3,
+        leftIndent=0,
+    )
+
+    return {
+        "title": title_style,
+        "subtitle": subtitle_style,
+        "section": section_style,
+        "body": body_style,
+    }
+
+
+def styles_digest(styles):
+    """Fingerprint a style set so cached flowables follow style changes"""
+    return canonical_digest(
+        {name: style.__dict__ for name, style in sorted(styles.items())}
+    )
+
+
+def style_fingerprint(style):
+    """Digest of a single paragraph style, memoized per style object
+
+    Equal styles from different templates share a fingerprint, so caches
+    keyed by it are shared across templates wherever the style allows it.
+    """
+    fingerprint = _style_fingerprints.get(style)
+    if fingerprint is None:
+        fingerprint = canonical_digest(style.__dict__)
+        _style_fingerprints[style] = fingerprint
+    return fingerprint
+
+
+def _compiled(template):
+    """Return the (styles, digest) pair for a template, compiling on first use"""
+    template = _resolve_template(template)
+    entry = _registry.get(template)
+    if entry is None:
+        with _registry_lock:
+            entry = _registry.get(template)
+            if entry is None:
+                styles = compile_template_styles(template)
+                entry = (MappingProxyType(styles), styles_digest(styles))
+                _registry[template] = entry
+    return entry
+
+
+def get_template_styles(template):
+    """Return the shared, read-only style mapping for a template"""
+    return _compiled(template)[0]
+
+
+def template_style_digest(template):
+    """Return the fingerprint of a template's compiled styles"""
+    return _compiled(template)[1]
+
+
+def warm_template_styles():
+    """Compile every template up front, e.g. in a worker process initializer"""
+    for template in TEMPLATE_COLORS:
+        _compiled(template)
+
+
+def invalidate_template_styles(template=None):
+    """Forget compiled styles for one template, or all of them
+
+    Call this after changing a template definition; the next render
+    recompiles it and, because the style digest changes, cached flowables
+    and PDFs built with the old styles are no longer used.
+    """
+    global _base_styles
+    with _registry_lock:
+        if template is None:
+            _registry.clear()
+            _base_styles = None
+        else:
+            _registry.pop(_resolve_template(template), None)
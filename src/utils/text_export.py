@@ -0,0 +1,47 @@
+"""
+ATS-friendly plain-text export of a CV document.
+
+Applicant tracking systems parse plain text most reliably: one fact per
+line, upper-case section headings, no columns or tables. Lines aren't
+wrapped, so a parser never sees a sentence split across lines.
+"""
+
+
+def _free_text(text):
+    """Free text as lines, without blank or trailing-space lines"""
+    lines = str(text).replace("\r\n", "\n").split("\n")
+    return [line.rstrip() for line in lines if line.strip()]
+
+
+def _entry_lines(entry):
+    title = str(entry.title)
+    if entry.subtitle:
+        title += f" - {entry.subtitle}"
+    lines = [title, *entry.details]
+    lines += [f"{label}: {value}" for label, value in entry.fields]
+    if entry.description:
+        lines += _free_text(entry.description)
+    lines += [f"{label}: {value}" for label, value in entry.links]
+    return lines
+
+
+def render_text(document):
+    """Serialize a ``Document`` as plain text"""
+    header = document.header
+    lines = [str(value) for value in (header.name, header.title) if value]
+    lines += [f"{label}: {value}" for label, value in header.contacts]
+    if header.summary:
+        lines += ["", "PROFESSIONAL SUMMARY", *_free_text(header.summary)]
+
+    for section in document.sections:
+        lines += ["", section.title]
+        if section.key == "skills":
+            lines += [
+                f"{group.name}: {', '.join(group.skills)}" for group in section.entries
+            ]
+            continue
+        for index, entry in enumerate(section.entries):
+            if index:
+                lines.append("")
+            lines += _entry_lines(entry)
+    return "\n".join(lines).strip("\n") + "\n"
@@ -0,0 +1,148 @@
+"""
+Template preview thumbnails rendered from the sample CV.
+
+Each template's first page is rendered once, rasterized to PNG and kept in
+memory and on disk under ``thumbnail_dir()``. File names carry a digest of
+the template definition, so editing a template (or bumping
+``THUMBNAIL_VERSION`` after a layout change) builds a fresh thumbnail while
+unchanged templates are never rendered again. Prebuild them with:
+
+    python -m src.utils.thumbnails
+"""
+
+import io
+import logging
+import os
+import threading
+
+from src.models.sample_cv import build_sample_cv
+from src.utils.pdf_generator import RenderError, render_pdf
+from src.utils.render_cache import canonical_digest
+from src.utils.template_styles import (
+    TEMPLATE_COLORS,
+    get_template_colors,
+    template_style_digest,
+)
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DIR_ENV = "CV_THUMBNAIL_DIR"
+DEFAULT_THUMBNAIL_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "data",
+    "thumbnails",
+)
+THUMBNAIL_WIDTH = 300
+# Bump when a renderer change alters how every template looks
+THUMBNAIL_VERSION = 1
+
+_thumbnails = {}
+_lock = threading.Lock()
+
+
+def thumbnail_dir():
+    """Directory holding the cached thumbnail PNGs"""
+    return os.environ.get(THUMBNAIL_DIR_ENV) or DEFAULT_THUMBNAIL_DIR
+
+
+def thumbnail_digest(template):
+    """Digest of everything a template's thumbnail depends on"""
+    return canonical_digest(
+        THUMBNAIL_VERSION,
+        THUMBNAIL_WIDTH,
+        get_template_colors(template),
+        template_style_digest(template),
+    )
+
+
+def _file_prefix(template):
+    return template.lower().replace(" ", "-") + "-"
+
+
+def thumbnail_path(template, digest=None):
+    """Cache file of a template's current thumbnail"""
+    digest = digest or thumbnail_digest(template)
+    return os.path.join(thumbnail_dir(), f"{_file_prefix(template)}{digest[:16]}.png")
+
+
+def render_thumbnail(template):
+    """Render the sample CV's first page in a template as PNG bytes"""
+    try:
+        import pypdfium2
+    except ImportError as e:
+        raise RenderError("Template thumbnails need pypdfium2") from e
+
+    sample = build_sample_cv(publications=3, experience=2, with_photo=True)
+    pdf = render_pdf(sample, template=template, use_cache=False).pdf
+    doc = pypdfium2.PdfDocument(pdf)
+    try:
+        page = doc[0]
+        bitmap = page.render(scale=THUMBNAIL_WIDTH / page.get_width())
+        buffer = io.BytesIO()
+        bitmap.to_pil().convert("RGB").save(buffer, format="PNG")
+        return buffer.getvalue()
+    finally:
+        doc.close()
+
+
+def _store(template, path, png):
+    """Write a thumbnail atomically and remove the template's stale ones"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(png)
+    os.replace(temp_path, path)
+
+    prefix = _file_prefix(template)
+    for name in os.listdir(directory):
+        stale = os.path.join(directory, name)
+        if name.startswith(prefix) and name.endswith(".png") and stale != path:
+            os.remove(stale)
+
+
+def _load_or_render(template, digest):
+    """Read a thumbnail from disk, rendering and storing it if missing"""
+    path = thumbnail_path(template, digest)
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        pass
+
+    png = render_thumbnail(template)
+    try:
+        _store(template, path, png)
+    except OSError as e:
+        # A read-only deployment still gets in-memory thumbnails
+        logger.warning("Could not cache thumbnail %s: %s", path, e)
+    return png
+
+
+def template_thumbnail(template):
+    """PNG thumbnail of a template, rendered only when missing or stale"""
+    digest = thumbnail_digest(template)
+    png = _thumbnails.get(digest)
+    if png is None:
+        with _lock:
+            png = _thumbnails.get(digest)
+            if png is None:
+                png = _load_or_render(template, digest)
+                _thumbnails[digest] = png
+    return png
+
+
+def template_thumbnails():
+    """Thumbnails of every template, keyed by template name"""
+    return {template: template_thumbnail(template) for template in TEMPLATE_COLORS}
+
+
+def main():
+    """Prebuild the thumbnail of every template"""
+    for template in TEMPLATE_COLORS:
+        png = template_thumbnail(template)
+        print(f"{thumbnail_path(template)} ({len(png):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
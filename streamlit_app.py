@@ -1,7 +1,20 @@
-import json
-
 import streamlit as st
-from PIL import Image
+
+from src.utils.cv_file import (
+    CVB_EXTENSION,
+    CVB_MIME,
+    CVImportError,
+    dump_cvb,
+    dump_json,
+    load_cv_file,
+)
+from src.utils.cv_validation import format_errors
+from src.utils.pdf_generator import RenderError, generate_pdf_cv, pdf_filename
+from src.utils.photo import ingest_photo, is_ingested_photo
+from src.utils.preview_html import preview_html
+
+# Validation problems listed under a rejected import
+MAX_SHOWN_ERRORS = 20
 
 # Page configuration
 st.set_page_config(
@@ -90,6 +103,12 @@ def load_css():
         font-size: 0.9em;
     }
 
+    .skills-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        gap: 0 1.5em;
+    }
+
     .stButton > button {
         background-color: #3b82f6;
         color: white;
@@ -200,8 +219,7 @@ def cv_preview_main_page():
             "🚀 Get started by editing your CV information in the 'Edit CV' section!"
         )
         st.markdown("### Quick Start Guide:")
-        st.markdown(
-            """
+        st.markdown("""
         1. **Personal Information** - Add your name, contact details, and
            professional summary
         2. **Education** - Include your degrees and academic background
@@ -209,173 +227,15 @@ def cv_preview_main_page():
         4. **Skills** - Showcase your technical abilities
         5. **Projects & Publications** - Highlight your research and
            development work
-        """
-        )
+        """)
         return
 
     # Display CV Preview
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        # Header section
-        if personal["full_name"]:
-            st.markdown(f"# {personal['full_name']}")
-
-        if personal["title"]:
-            st.markdown(f"### *{personal['title']}*")
-
-        # Contact information in a clean layout
-        contact_info = []
-        if personal["email"]:
-            contact_info.append(f"📧 {personal['email']}")
-        if personal["phone"]:
-            contact_info.append(f"📱 {personal['phone']}")
-        if personal["location"]:
-            contact_info.append(f"📍 {personal['location']}")
-
-        if contact_info:
-            st.markdown(" | ".join(contact_info))
-
-        # Links
-        links = []
-        if personal["linkedin"]:
-            links.append(f"[LinkedIn]({personal['linkedin']})")
-        if personal["github"]:
-            links.append(f"[GitHub]({personal['github']})")
-        if personal["orcid"]:
-            links.append(f"[ORCID]({personal['orcid']})")
-        if personal["website"]:
-            links.append(f"[Website]({personal['website']})")
-
-        if links:
-            st.markdown(" • ".join(links))
-
-        st.divider()
-
-        # Professional Summary
-        if personal["summary"]:
-            st.markdown("## 📝 Professional Summary")
-            st.markdown(
-                f'<div class="info-card">{personal["summary"]}</div>',
-                unsafe_allow_html=True,
-            )
-
-        # Technical Skills
-        if any(cv_data["skills"].values()):
-            st.markdown("## 🛠️ Technical Skills")
-
-            skills_cols = st.columns(2)
-            skill_categories = list(cv_data["skills"].items())
-
-            for i, (category, skills_list) in enumerate(skill_categories):
-                if skills_list:
-                    col_idx = i % 2
-                    with skills_cols[col_idx]:
-                        category_name = category.replace("_", " ").title()
-                        st.markdown(f"**{category_name}:**")
-                        skills_html = ""
-                        for skill in skills_list:
-                            skills_html += f'<span class="skill-tag">{skill}</span>'
-                        st.markdown(skills_html, unsafe_allow_html=True)
-                        st.markdown("")
-
-        # Education
-        if cv_data["education"]:
-            st.markdown("## 🎓 Education")
-            for edu in cv_data["education"]:
-                st.markdown('<div class="info-card">', unsafe_allow_html=True)
-                st.markdown(f"**{edu['degree']}**")
-                st.markdown(f"*{edu['institution']}* • {edu['location']}")
-                st.markdown(f"📅 {edu['start_year']} - {edu['end_year']}")
-
-                if edu["thesis_title"]:
-                    st.markdown(f"**Thesis:** {edu['thesis_title']}")
-                if edu["advisor"]:
-                    st.markdown(f"**Advisor:** {edu['advisor']}")
-                if edu["gpa"]:
-                    st.markdown(f"**GPA:** {edu['gpa']}")
-                if edu["description"]:
-                    st.markdown(edu["description"])
-                st.markdown("</div>", unsafe_allow_html=True)
-
-        # Work Experience
-        if cv_data["experience"]:
-            st.markdown("## 💼 Work Experience")
-            for exp in cv_data["experience"]:
-                st.markdown('<div class="info-card">', unsafe_allow_html=True)
-                st.markdown(f"**{exp['job_title']}**")
-                st.markdown(f"*{exp['company']}* • {exp['location']}")
-                st.markdown(
-                    f"📅 {exp['start_date']} - {exp['end_date']} • {exp['job_type']}"
-                )
-                if exp["description"]:
-                    st.markdown(exp["description"])
-                st.markdown("</div>", unsafe_allow_html=True)
-
-        # Projects
-        if cv_data["projects"]:
-            st.markdown("## 🚀 Projects")
-            for project in cv_data["projects"]:
-                st.markdown('<div class="info-card">', unsafe_allow_html=True)
-                st.markdown(f"**{project['name']}** - *{project['type']}*")
-                st.markdown(f"📅 {project['start_date']} - {project['end_date']}")
-
-                if project["technologies"]:
-                    st.markdown(f"**Technologies:** {project['technologies']}")
-
-                links = []
-                if project["github_link"]:
-                    links.append(f"[GitHub]({project['github_link']})")
-                if project["publication_link"]:
-                    links.append(f"[Publication]({project['publication_link']})")
-                if links:
-                    st.markdown(" • ".join(links))
-
-                if project["description"]:
-                    st.markdown(project["description"])
-                st.markdown("</div>", unsafe_allow_html=True)
-
-        # Publications
-        if cv_data["publications"]:
-            st.markdown("## 📚 Publications")
-            for pub in cv_data["publications"]:
-                st.markdown('<div class="info-card">', unsafe_allow_html=True)
-                st.markdown(f"**{pub['title']}**")
-                st.markdown(f"*{pub['authors']}*")
-                st.markdown(f"📖 {pub['journal']} ({pub['year']})")
-
-                if pub["volume"] and pub["pages"]:
-                    st.markdown(f"Vol. {pub['volume']}, pp. {pub['pages']}")
-                if pub["doi"]:
-                    st.markdown(f"DOI: {pub['doi']}")
-                if pub["url"]:
-                    st.markdown(f"[Read Publication]({pub['url']})")
-                st.markdown("</div>", unsafe_allow_html=True)
-
-        # Certifications & Awards
-        if cv_data["certifications"]:
-            st.markdown("## 📜 Certifications")
-            for cert in cv_data["certifications"]:
-                st.markdown('<div class="info-card">', unsafe_allow_html=True)
-                st.markdown(f"**{cert['name']}**")
-                st.markdown(f"*{cert['issuing_org']}*")
-                st.markdown(
-                    f"📅 Issued: {cert['issue_date']} • Expires: {cert['expiry_date']}"
-                )
-                if cert["url"]:
-                    st.markdown(f"[View Credential]({cert['url']})")
-                st.markdown("</div>", unsafe_allow_html=True)
-
-        if cv_data["awards"]:
-            st.markdown("## 🏆 Awards & Honors")
-            for award in cv_data["awards"]:
-                st.markdown('<div class="info-card">', unsafe_allow_html=True)
-                st.markdown(f"**{award['name']}**")
-                st.markdown(f"*{award['awarding_org']}*")
-                st.markdown(f"📅 {award['date']}")
-                if award["description"]:
-                    st.markdown(award["description"])
-                st.markdown("</div>", unsafe_allow_html=True)
+        # One memoized HTML element instead of a websocket delta per line
+        st.markdown(preview_html(cv_data), unsafe_allow_html=True)
 
     with col2:
         st.markdown("### 🎯 Quick Actions")
@@ -457,14 +317,15 @@ def export_section():
 
     with col1:
         if st.button("📄 Generate & Download PDF", type="primary"):
-            pdf_file = generate_pdf_cv(
-                cv_data, template=pdf_template, page_format=pdf_format
-            )
-            if pdf_file:
-                filename = (
-                    f"{personal['full_name'].replace(' ', '_')}_CV_"
-                    f"{pdf_template.replace(' ', '_')}.pdf"
+            try:
+                pdf_file = generate_pdf_cv(
+                    cv_data, template=pdf_template, page_format=pdf_format
                 )
+            except RenderError as e:
+                st.error(f"Error generating PDF: {e}")
+                pdf_file = None
+            if pdf_file:
+                filename = pdf_filename(personal["full_name"], pdf_template)
                 st.download_button(
                     label="⬇️ Download PDF",
                     data=pdf_file,
@@ -473,26 +334,44 @@ def export_section():
                 )
 
     with col2:
-        # Export as JSON
-        json_data = json.dumps(cv_data, indent=2, default=str)
+        # Export as JSON; both saves are memoized per CV
+        data_name = (
+            f"{personal['full_name'].replace(' ', '_')}_CV_data"
+            if personal["full_name"]
+            else "CV_data"
+        )
         st.download_button(
             label="💾 Export Data (JSON)",
-            data=json_data,
-            file_name=(f"{personal['full_name'].replace(' ', '_')}_CV_data.json"),
+            data=dump_json(cv_data),
+            file_name=f"{data_name}.json",
             mime="application/json",
         )
+        st.download_button(
+            label="💾 Save CV File (.cvb)",
+            data=dump_cvb(cv_data),
+            file_name=f"{data_name}.{CVB_EXTENSION}",
+            mime=CVB_MIME,
+        )
 
     with col3:
-        # Import JSON data
-        uploaded_json = st.file_uploader("📂 Import CV Data", type=["json"])
-        if uploaded_json is not None:
-            try:
-                imported_data = json.load(uploaded_json)
-                st.session_state.cv_data = imported_data
+        # Import JSON or .cvb data, each upload once (the uploader keeps it)
+        uploaded_file = st.file_uploader(
+            "📂 Import CV Data", type=["json", CVB_EXTENSION]
+        )
+        if uploaded_file is not None:
+            if uploaded_file.file_id == st.session_state.get("imported_file_id"):
                 st.success("CV data imported successfully!")
-                st.rerun()
-            except Exception as e:
-                st.error(f"Error importing data: {e}")
+            else:
+                try:
+                    imported_data = load_cv_file(uploaded_file)
+                except CVImportError as e:
+                    st.error(f"Error importing data: {e}")
+                    if e.errors:
+                        st.code(format_errors(e.errors, limit=MAX_SHOWN_ERRORS))
+                else:
+                    st.session_state.cv_data = imported_data
+                    st.session_state.imported_file_id = uploaded_file.file_id
+                    st.rerun()
 
 
 def personal_info_section():
@@ -509,14 +388,21 @@ def personal_info_section():
             "Upload your professional photo", type=["png", "jpg", "jpeg"]
         )
 
+        photo = st.session_state.cv_data.get("photo")
         if uploaded_file is not None:
-            image = Image.open(uploaded_file)
-            st.image(image, caption="Your Photo", width=200)
-            st.session_state.cv_data["photo"] = uploaded_file
-        elif st.session_state.cv_data.get("photo"):
-            st.image(
-                st.session_state.cv_data["photo"], caption="Current Photo", width=200
-            )
+            # Decode each upload once; later reruns reuse the stored renditions
+            source_id = getattr(uploaded_file, "file_id", uploaded_file.name)
+            if not is_ingested_photo(photo) or photo["source_id"] != source_id:
+                try:
+                    photo = ingest_photo(uploaded_file, source_id=source_id)
+                    st.session_state.cv_data["photo"] = photo
+                except Exception as e:
+                    st.error(f"Could not read the uploaded photo: {e}")
+                    photo = None
+            if is_ingested_photo(photo):
+                st.image(photo["preview"], caption="Your Photo", width=200)
+        elif is_ingested_photo(photo):
+            st.image(photo["preview"], caption="Current Photo", width=200)
 
     with col2:
         st.subheader("📝 Basic Information")
@@ -1019,322 +905,5 @@ def certifications_awards_section():
                 st.divider()
 
 
-def generate_pdf_cv(cv_data, template="Professional Blue", page_format="A4"):
-    """Generate comprehensive PDF version of the CV with template options"""
-    try:
-        from io import BytesIO
-
-        from reportlab.lib import colors
-        from reportlab.lib.enums import TA_CENTER
-        from reportlab.lib.pagesizes import A4, letter
-        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-        from reportlab.lib.units import inch
-        from reportlab.platypus import (
-            Paragraph,
-            SimpleDocTemplate,
-            Spacer,
-            Table,
-            TableStyle,
-        )
-
-        # Page setup
-        pagesize = A4 if page_format == "A4" else letter
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=pagesize,
-            rightMargin=0.75 * inch,
-            leftMargin=0.75 * inch,
-            topMargin=0.75 * inch,
-            bottomMargin=0.75 * inch,
-        )
-
-        # Template-specific color schemes
-        template_colors = {
-            "Professional Blue": {
-                "title": "#1e3a8a",
-                "subtitle": "#1e40af",
-                "section": "#1e40af",
-                "border": "#3b82f6",
-            },
-            "Academic Classic": {
-                "title": "#0f172a",
-                "subtitle": "#374151",
-                "section": "#374151",
-                "border": "#6b7280",
-            },
-            "Modern Minimal": {
-                "title": "#111827",
-                "subtitle": "#4b5563",
-                "section": "#6b7280",
-                "border": "#d1d5db",
-            },
-            "Scientific Research": {
-                "title": "#065f46",
-                "subtitle": "#047857",
-                "section": "#059669",
-                "border": "#10b981",
-            },
-        }
-
-        colors_scheme = template_colors.get(
-            template, template_colors["Professional Blue"]
-        )
-
-        # Custom styles
-        styles = getSampleStyleSheet()
-
-        # Define custom styles based on template
-        title_style = ParagraphStyle(
-            "CustomTitle",
-            parent=styles["Heading1"],
-            fontSize=24 if template != "Modern Minimal" else 22,
-            spaceAfter=6,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor(colors_scheme["title"]),
-        )
-
-        subtitle_style = ParagraphStyle(
-            "CustomSubtitle",
-            parent=styles["Heading2"],
-            fontSize=14,
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor(colors_scheme["subtitle"]),
-        )
-
-        section_style = ParagraphStyle(
-            "SectionHeader",
-            parent=styles["Heading2"],
-            fontSize=14 if template != "Modern Minimal" else 12,
-            spaceBefore=12,
-            spaceAfter=6,
-            textColor=colors.HexColor(colors_scheme["section"]),
-            borderWidth=1 if template != "Modern Minimal" else 0,
-            borderColor=(
-                colors.HexColor(colors_scheme["border"])
-                if template != "Modern Minimal"
-                else None
-            ),
-            borderPadding=3 if template != "Modern Minimal" else 0,
-        )
-
-        body_style = ParagraphStyle(
-            "CustomBody",
-            parent=styles["Normal"],
-            fontSize=10,
-            spaceBefore=3,
-            spaceAfter=3,
-            leftIndent=0,
-        )
-
-        story = []
-        personal = cv_data["personal_info"]
-
-        # Header Section
-        if personal["full_name"]:
-            title = Paragraph(f"<b>{personal['full_name']}</b>", title_style)
-            story.append(title)
-
-        if personal["title"]:
-            subtitle = Paragraph(personal["title"], subtitle_style)
-            story.append(subtitle)
-
-        # Contact Information
-        contact_data = []
-        if personal["email"]:
-            contact_data.append(["Email:", personal["email"]])
-        if personal["phone"]:
-            contact_data.append(["Phone:", personal["phone"]])
-        if personal["location"]:
-            contact_data.append(["Location:", personal["location"]])
-        if personal["linkedin"]:
-            contact_data.append(["LinkedIn:", personal["linkedin"]])
-        if personal["github"]:
-            contact_data.append(["GitHub:", personal["github"]])
-        if personal["orcid"]:
-            contact_data.append(["ORCID:", personal["orcid"]])
-
-        if contact_data:
-            # Split contact data into two columns
-            mid_point = len(contact_data) // 2 + len(contact_data) % 2
-            col1 = contact_data[:mid_point]
-            col2 = contact_data[mid_point:] if len(contact_data) > mid_point else []
-
-            # Pad col2 to match col1 length
-            while len(col2) < len(col1):
-                col2.append(["", ""])
-
-            contact_table_data = []
-            for i in range(len(col1)):
-                row = [
-                    col1[i][0],
-                    col1[i][1],
-                    col2[i][0] if i < len(col2) else "",
-                    col2[i][1] if i < len(col2) else "",
-                ]
-                contact_table_data.append(row)
-
-            contact_table = Table(
-                contact_table_data, colWidths=[1 * inch, 2 * inch, 1 * inch, 2 * inch]
-            )
-            contact_table.setStyle(
-                TableStyle(
-                    [
-                        ("FONTSIZE", (0, 0), (-1, -1), 9),
-                        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                        ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-                        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                        ("FONTNAME", (2, 0), (2, -1), "Helvetica-Bold"),
-                    ]
-                )
-            )
-            story.append(contact_table)
-            story.append(Spacer(1, 12))
-
-        # Professional Summary
-        if personal["summary"]:
-            story.append(Paragraph("<b>PROFESSIONAL SUMMARY</b>", section_style))
-            summary = Paragraph(personal["summary"], body_style)
-            story.append(summary)
-            story.append(Spacer(1, 6))
-
-        # Technical Skills
-        if any(cv_data["skills"].values()):
-            story.append(Paragraph("<b>TECHNICAL SKILLS</b>", section_style))
-
-            for category, skills_list in cv_data["skills"].items():
-                if skills_list:
-                    category_name = category.replace("_", " ").title()
-                    skills_text = f"<b>{category_name}:</b> {', '.join(skills_list)}"
-                    skills_para = Paragraph(skills_text, body_style)
-                    story.append(skills_para)
-            story.append(Spacer(1, 6))
-
-        # Education
-        if cv_data["education"]:
-            story.append(Paragraph("<b>EDUCATION</b>", section_style))
-            for edu in cv_data["education"]:
-                edu_title = f"<b>{edu['degree']}</b> - {edu['institution']}"
-                story.append(Paragraph(edu_title, body_style))
-
-                edu_details = (
-                    f"{edu['start_year']} - {edu['end_year']} | {edu['location']}"
-                )
-                story.append(Paragraph(edu_details, body_style))
-
-                if edu["thesis_title"]:
-                    thesis = f"<i>Thesis:</i> {edu['thesis_title']}"
-                    story.append(Paragraph(thesis, body_style))
-
-                if edu["advisor"]:
-                    advisor = f"<i>Advisor:</i> {edu['advisor']}"
-                    story.append(Paragraph(advisor, body_style))
-
-                if edu["gpa"]:
-                    gpa = f"<i>GPA:</i> {edu['gpa']}"
-                    story.append(Paragraph(gpa, body_style))
-
-                if edu["description"]:
-                    story.append(Paragraph(edu["description"], body_style))
-
-                story.append(Spacer(1, 6))
-
-        # Work Experience
-        if cv_data["experience"]:
-            story.append(Paragraph("<b>WORK EXPERIENCE</b>", section_style))
-            for exp in cv_data["experience"]:
-                exp_title = f"<b>{exp['job_title']}</b> - {exp['company']}"
-                story.append(Paragraph(exp_title, body_style))
-
-                exp_details = (
-                    f"{exp['start_date']} - {exp['end_date']} | "
-                    f"{exp['location']} | {exp['job_type']}"
-                )
-                story.append(Paragraph(exp_details, body_style))
-
-                if exp["description"]:
-                    story.append(Paragraph(exp["description"], body_style))
-
-                story.append(Spacer(1, 6))
-
-        # Projects
-        if cv_data["projects"]:
-            story.append(Paragraph("<b>PROJECTS</b>", section_style))
-            for project in cv_data["projects"]:
-                project_title = f"<b>{project['name']}</b> - {project['type']}"
-                story.append(Paragraph(project_title, body_style))
-
-                project_details = f"{project['start_date']} - {project['end_date']}"
-                if project["technologies"]:
-                    project_details += f" | Technologies: {project['technologies']}"
-                story.append(Paragraph(project_details, body_style))
-
-                if project["description"]:
-                    story.append(Paragraph(project["description"], body_style))
-
-                if project["github_link"]:
-                    github = f"Repository: {project['github_link']}"
-                    story.append(Paragraph(github, body_style))
-
-                story.append(Spacer(1, 6))
-
-        # Publications
-        if cv_data["publications"]:
-            story.append(Paragraph("<b>PUBLICATIONS</b>", section_style))
-            for pub in cv_data["publications"]:
-                pub_title = f"<b>{pub['title']}</b>"
-                story.append(Paragraph(pub_title, body_style))
-
-                pub_details = f"{pub['authors']} ({pub['year']}). {pub['journal']}"
-                if pub["volume"] and pub["pages"]:
-                    pub_details += f", Vol. {pub['volume']}, pp. {pub['pages']}"
-                story.append(Paragraph(pub_details, body_style))
-
-                if pub["doi"]:
-                    doi = f"DOI: {pub['doi']}"
-                    story.append(Paragraph(doi, body_style))
-
-                story.append(Spacer(1, 6))
-
-        # Certifications
-        if cv_data["certifications"]:
-            story.append(Paragraph("<b>CERTIFICATIONS</b>", section_style))
-            for cert in cv_data["certifications"]:
-                cert_title = f"<b>{cert['name']}</b> - {cert['issuing_org']}"
-                story.append(Paragraph(cert_title, body_style))
-
-                cert_details = (
-                    f"Issued: {cert['issue_date']} | Expires: {cert['expiry_date']}"
-                )
-                story.append(Paragraph(cert_details, body_style))
-
-                story.append(Spacer(1, 6))
-
-        # Awards
-        if cv_data["awards"]:
-            story.append(Paragraph("<b>AWARDS & HONORS</b>", section_style))
-            for award in cv_data["awards"]:
-                award_title = f"<b>{award['name']}</b> - {award['awarding_org']}"
-                story.append(Paragraph(award_title, body_style))
-
-                award_details = f"Date: {award['date']}"
-                story.append(Paragraph(award_details, body_style))
-
-                if award["description"]:
-                    story.append(Paragraph(award["description"], body_style))
-
-                story.append(Spacer(1, 6))
-
-        # Build the PDF
-        doc.build(story)
-        buffer.seek(0)
-        return buffer.getvalue()
-
-    except Exception as e:
-        st.error(f"Error generating PDF: {e}")
-        return None
-
-
 if __name__ == "__main__":
     main()
@@ -0,0 +1,37 @@
+"""Imported CV files must work everywhere the app uses them"""
+
+import io
+import json
+
+from src.models.cv_data import init_cv_data
+from src.utils.cv_file import load_cv_file
+from src.utils.pdf_generator import render_pdf
+from src.utils.preview_html import preview_html
+
+
+def _upload(data):
+    return io.BytesIO(json.dumps(data).encode("utf-8"))
+
+
+def test_partial_personal_info_imports_previews_and_renders():
+    cv_data = load_cv_file(
+        _upload(
+            {
+                "personal_info": {"full_name": "A"},
+                "skills": {"programming_languages": ["Python"]},
+            }
+        )
+    )
+
+    assert cv_data["personal_info"] == {
+        **init_cv_data()["personal_info"],
+        "full_name": "A",
+    }
+    assert cv_data["skills"]["bioinformatics_tools"] == []
+    assert cv_data["skills"]["programming_languages"] == ["Python"]
+    assert cv_data["awards"] == []
+
+    assert "A" in preview_html(cv_data)
+    result = render_pdf(cv_data, use_cache=False)
+    assert result.pdf.startswith(b"%PDF")
+    assert result.page_count == 1